@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -78,10 +79,37 @@ WSGI_APPLICATION = 'config.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
     }
 }
 
+# Production SQLite mode, on with SQLITE_PRODUCTION=1. Off by default: WAL mode
+# is stored in the database file, so it would rewrite the development
+# db.sqlite3 on every manage.py command.
+# WAL lets readers run alongside the writer and core.db.apply_sqlite_pragmas
+# sets it up on every new connection; writers start with BEGIN IMMEDIATE and
+# wait up to busy_timeout for the lock instead of failing with "database is
+# locked" when a read transaction tries to upgrade to a write; connections
+# are kept open across requests; and hot write endpoints go through the
+# serialized write path (core.db.serialized_write). Needs Django 5.1+.
+SQLITE_PRODUCTION = os.environ.get('SQLITE_PRODUCTION', '0') != '0'
+SQLITE_PRAGMAS = {}
+SQLITE_SERIALIZE_WRITES = SQLITE_PRODUCTION
+if SQLITE_PRODUCTION:
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {'transaction_mode': 'IMMEDIATE'},
+    })
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        # NORMAL is durable in WAL mode except for the last commits on power loss
+        'synchronous': 'NORMAL',
+        'busy_timeout': 20000,
+        'temp_store': 'MEMORY',
+        'cache_size': -20000,
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -127,10 +155,159 @@ MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
 # Adzuna API Configuration
+ADZUNA_API_URL = 'https://api.adzuna.com/v1/api'
 ADZUNA_APP_ID = 'a1504701'
 ADZUNA_APP_KEY = '132ecca6c0541d3b485dc97062fb4445'
 
 # RapidAPI Configuration (for JSearch)
+JSEARCH_API_URL = 'https://jsearch.p.rapidapi.com/search'
 # Get your free API key from: https://rapidapi.com/letscrape-6bRBa3QguO5/api/jsearch
 RAPIDAPI_KEY = ''  # Add your RapidAPI key here (optional, will work without it using other APIs)
 
+
+# Skill taxonomy used by extract_skills (JSON: {"skills": {"canonical": ["alias", ...]}})
+# Leave as None to use the bundled core/data/skills.json, a seed of common tech
+# skills. `manage.py import_skill_taxonomy` builds a full one (e.g. ESCO's 13k+
+# skills with aliases) from a CSV export; point this setting at its output.
+SKILL_TAXONOMY_PATH = os.environ.get('SKILL_TAXONOMY_PATH') or None
+
+# Resume analysis cache (keyed by SHA-256 of the uploaded file)
+# Number of analyses kept in the in-process LRU in front of the database table
+ANALYSIS_CACHE_SIZE = 256
+
+# PDF text extraction limits (0 disables a limit). Extraction stops as soon as
+# either budget is reached, so huge or image-heavy PDFs cannot stall a worker.
+PDF_MAX_PAGES = 20
+PDF_MAX_CHARS = 100000
+
+# Job provider fan-out
+# Providers are queried concurrently; each gets its own HTTP timeout (seconds)
+# and the whole search returns whatever has arrived by JOB_SEARCH_DEADLINE.
+JOB_PROVIDER_TIMEOUTS = {
+    'default': 8,
+    'adzuna': 8,
+    'jsearch': 8,
+    'remoteok': 8,
+}
+JOB_SEARCH_DEADLINE = 10
+JOB_PROVIDER_WORKERS = 16
+
+# Job search result cache (per provider, keyed by sorted skills and location)
+# Entries are fresh for JOB_CACHE_TTL seconds, then served stale for up to
+# JOB_CACHE_STALE_TTL more seconds while a background refresh runs.
+JOB_CACHE_TTL = 600
+JOB_CACHE_STALE_TTL = 3600
+JOB_CACHE_SIZE = 1024
+
+# RemoteOK API (no key required)
+REMOTEOK_API_URL = 'https://remoteok.com/api'
+
+# Local RemoteOK feed snapshot, refreshed by `manage.py ingest_remoteok`
+# Remote job searches use its inverted index while the snapshot is younger
+# than REMOTEOK_SNAPSHOT_MAX_AGE seconds and fall back to a live download.
+REMOTEOK_SNAPSHOT_PATH = BASE_DIR / 'data' / 'remoteok_snapshot.json'
+REMOTEOK_SNAPSHOT_MAX_AGE = 6 * 60 * 60
+
+# Shared HTTP clients for job providers (per-provider keys override 'default')
+# retries: extra attempts on connection errors, timeouts and 429/5xx responses
+# backoff: base seconds for jittered exponential backoff between attempts
+# failure_threshold/reset_timeout: circuit breaker opens after that many
+# consecutive failures and fails fast for reset_timeout seconds
+# half_open_timeout: seconds before an unanswered half-open trial is
+# abandoned and another one is let through
+JOB_PROVIDER_CLIENT = {
+    'default': {
+        'retries': 2,
+        'backoff': 0.2,
+        'pool_size': 10,
+        'failure_threshold': 5,
+        'reset_timeout': 30,
+        'half_open_timeout': 30,
+    },
+}
+
+# Document frequencies of the job corpus used for BM25 ranking of job results,
+# written by `manage.py ingest_remoteok` (ranking falls back to the candidates)
+JOB_IDF_PATH = BASE_DIR / 'data' / 'job_idf.json'
+
+# Job results whose SimHash fingerprints (title, company, description start)
+# differ in at most this many of 64 bits are treated as the same posting (0-15)
+JOB_DEDUPE_MAX_DISTANCE = 8
+
+# Resume analysis queue: when enabled, uploads that miss the analysis cache are
+# queued and run by `manage.py run_analysis_worker`, which must then be running
+# (off by default: uploads are analyzed inside the request)
+# A failed task is retried after ANALYSIS_TASK_RETRY_BACKOFF * 2^(attempt-1)
+# seconds until ANALYSIS_TASK_MAX_ATTEMPTS; a running task whose worker has
+# not renewed its lease for ANALYSIS_TASK_TIMEOUT seconds is assumed lost and
+# handed to another worker (or failed once it used all its attempts).
+ANALYSIS_QUEUE_ENABLED = False
+ANALYSIS_TASK_MAX_ATTEMPTS = 3
+ANALYSIS_TASK_RETRY_BACKOFF = 5
+ANALYSIS_TASK_TIMEOUT = 300
+# Processes parsing PDFs for the async upload view when the queue is off, so
+# the event loop never runs CPU-bound analysis
+ANALYSIS_PROCESSES = 2
+
+# Load testing: point every job provider at the local simulator started with
+# `manage.py simulate_providers` (e.g. JOB_PROVIDER_SIMULATOR_URL=http://127.0.0.1:8900)
+JOB_PROVIDER_SIMULATOR_URL = os.environ.get('JOB_PROVIDER_SIMULATOR_URL', '')
+if JOB_PROVIDER_SIMULATOR_URL:
+    ADZUNA_API_URL = f'{JOB_PROVIDER_SIMULATOR_URL}/adzuna'
+    JSEARCH_API_URL = f'{JOB_PROVIDER_SIMULATOR_URL}/jsearch/search'
+    REMOTEOK_API_URL = f'{JOB_PROVIDER_SIMULATOR_URL}/remoteok/api'
+    RAPIDAPI_KEY = RAPIDAPI_KEY or 'simulator'
+    # Send RemoteOK searches to the simulator rather than the local snapshot
+    REMOTEOK_SNAPSHOT_PATH = ''
+
+# Bearer token required by the Prometheus /metrics/ endpoint (empty: no auth)
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Translations (whole texts and paragraphs) kept in memory per process;
+# every translation is also stored in the TranslationCache table
+TRANSLATION_CACHE_SIZE = 2048
+
+# Translator client class (googletrans interface); 'core.translation.LocalTranslator'
+# is an offline stand-in that waits TRANSLATOR_STUB_DELAY seconds per call.
+# Classes with an async atranslate() are awaited directly by the async views;
+# others run there on the translation pool. 'core.google_translate.GoogleTranslator'
+# adds one to googletrans (opt-in, only with the googletrans release it supports).
+# TRANSLATION_WORKERS bounds concurrent chunk translations per process and loop.
+TRANSLATOR_CLASS = os.environ.get('TRANSLATOR_CLASS', 'googletrans.Translator')
+TRANSLATOR_STUB_DELAY = 0.0
+TRANSLATION_WORKERS = 4
+
+# Saved jobs list API page size (?limit= is capped at SAVED_JOBS_MAX_PAGE_SIZE)
+SAVED_JOBS_PAGE_SIZE = 50
+SAVED_JOBS_MAX_PAGE_SIZE = 200
+# Largest item list accepted by the bulk save/unsave endpoint
+SAVED_JOBS_BULK_MAX_ITEMS = 1000
+
+# Candidate search (core.candidates): results per page, and the match count
+# up to which the reported total is exact
+CANDIDATE_SEARCH_PAGE_SIZE = 50
+CANDIDATE_SEARCH_MAX_PAGE_SIZE = 200
+CANDIDATE_SEARCH_COUNT_LIMIT = 1000
+
+# Job catalogue (every job providers return) and the per-user top-k lists
+# written from it by `manage.py refresh_recommendations`. Jobs no provider
+# has returned for JOB_CATALOG_MAX_AGE_DAYS are dropped on the next refresh.
+JOB_CATALOG_ENABLED = True
+JOB_CATALOG_MAX_AGE_DAYS = 30
+RECOMMENDATIONS_PER_USER = 20
+
+# Application logs (provider errors, job counts, analysis task failures) go to
+# the console; LOG_LEVEL=WARNING keeps only the problems
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {'format': '%(asctime)s %(levelname)s %(name)s: %(message)s'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'simple'},
+    },
+    'loggers': {
+        'core': {'handlers': ['console'], 'level': os.environ.get('LOG_LEVEL', 'INFO')},
+    },
+}
@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import SavedJob, UserProfile
+from .models import (
+    AnalysisTask, JobPosting, JobRecommendation, ProfileSkill, RecommendationRun, ResumeAnalysis, SavedJob,
+    TranslationCache, UserProfile,
+)
 
 @admin.register(SavedJob)
 class SavedJobAdmin(admin.ModelAdmin):
@@ -11,3 +14,44 @@ class SavedJobAdmin(admin.ModelAdmin):
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'ats_score', 'uploaded_at')
     search_fields = ('user__username', 'user__email')
+
+@admin.register(ProfileSkill)
+class ProfileSkillAdmin(admin.ModelAdmin):
+    list_display = ('profile', 'skill', 'ats_score')
+    search_fields = ('skill', 'profile__user__username')
+    raw_id_fields = ('profile',)
+
+@admin.register(ResumeAnalysis)
+class ResumeAnalysisAdmin(admin.ModelAdmin):
+    list_display = ('content_hash', 'version', 'ats_score', 'created_at')
+    search_fields = ('content_hash',)
+    list_filter = ('version',)
+
+@admin.register(AnalysisTask)
+class AnalysisTaskAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'status', 'attempts', 'worker', 'created_at', 'finished_at')
+    search_fields = ('content_hash', 'user__username')
+    list_filter = ('status',)
+
+@admin.register(TranslationCache)
+class TranslationCacheAdmin(admin.ModelAdmin):
+    list_display = ('text_hash', 'target_language', 'created_at')
+    search_fields = ('text_hash',)
+    list_filter = ('target_language',)
+
+@admin.register(JobPosting)
+class JobPostingAdmin(admin.ModelAdmin):
+    list_display = ('job_id', 'provider', 'updated_at', 'seen_at')
+    search_fields = ('job_id',)
+    list_filter = ('provider',)
+
+@admin.register(JobRecommendation)
+class JobRecommendationAdmin(admin.ModelAdmin):
+    list_display = ('user', 'rank', 'posting', 'score')
+    search_fields = ('user__username', 'posting__job_id')
+    raw_id_fields = ('user', 'posting')
+
+@admin.register(RecommendationRun)
+class RecommendationRunAdmin(admin.ModelAdmin):
+    list_display = ('started_at', 'finished_at', 'full', 'users_refreshed', 'jobs_changed', 'jobs_removed')
+    list_filter = ('full',)
@@ -0,0 +1,337 @@
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from .ats import ATS_RULES_VERSION
+from .cache import LRUCache
+from .candidates import reindex_profiles, sync_profile_skills
+from .db import serialized_write, update_rows
+from .metrics import NULL_TIMER
+from .models import ResumeAnalysis, ResumeText, UserProfile
+from .skills import get_skill_taxonomy
+from .utils import calculate_ats_score, extract_skills, extract_text_from_pdf
+
+# Resume text compresses about 5x; higher levels gain little and cost CPU per upload
+RESUME_TEXT_COMPRESSION_LEVEL = 6
+
+_analysis_cache = LRUCache(maxsize=getattr(settings, 'ANALYSIS_CACHE_SIZE', 256))
+_analysis_processes = None
+_analysis_processes_lock = threading.Lock()
+
+
+def get_analysis_version():
+    """
+    Version of everything that shapes an analysis: the ATS rules and the
+    skill taxonomy. Cached analyses from another version are stale.
+    """
+    return f"{ATS_RULES_VERSION}-{get_skill_taxonomy().version}"
+
+
+def hash_uploaded_file(uploaded_file):
+    """
+    Returns the SHA-256 hex digest of an uploaded file, reading it in chunks.
+    """
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    uploaded_file.seek(0)
+    return digest.hexdigest()
+
+
+def hash_file(path):
+    """
+    Returns the SHA-256 hex digest of a file on disk, reading it in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compress_text(text):
+    return zlib.compress(text.encode('utf-8'), RESUME_TEXT_COMPRESSION_LEVEL)
+
+
+def decompress_text(data):
+    return zlib.decompress(bytes(data)).decode('utf-8')
+
+
+def store_resume_text(content_hash, text):
+    """
+    Keeps the extracted text of a resume, so later rule or taxonomy changes
+    can re-analyze it without parsing the PDF again (see `manage.py
+    reanalyze`). The first stored text of a content hash wins.
+    """
+    with serialized_write():
+        ResumeText.objects.bulk_create([
+            ResumeText(content_hash=content_hash, compressed_text=compress_text(text))
+        ], ignore_conflicts=True)
+
+
+def analyze_text(text, timer=NULL_TIMER):
+    """
+    Runs skill extraction and ATS scoring on already extracted resume text.
+    """
+    with timer.stage('extract_skills'):
+        skills = extract_skills(text)
+    with timer.stage('ats_score'):
+        ats_score, ats_breakdown = calculate_ats_score(text, skills)
+    return {
+        'skills': skills,
+        'ats_score': ats_score,
+        'ats_breakdown': ats_breakdown,
+    }
+
+
+def analyze_resume_file(file_path):
+    return analyze_text(extract_text_from_pdf(file_path))
+
+
+def extract_and_analyze(path):
+    """
+    Returns (text, analysis) of a PDF. Touches no database, so it can run
+    in another process.
+    """
+    text = extract_text_from_pdf(path)
+    return text, analyze_text(text)
+
+
+def _store_extracted(content_hash, text, analysis, file_path):
+    store_resume_text(content_hash, text)
+    store_analysis(content_hash, analysis, resume_path=file_path)
+
+
+def analyze_stored_resume(content_hash, file_path, timer=NULL_TIMER):
+    """
+    Extracts and analyzes a resume saved in default storage (path relative
+    to MEDIA_ROOT) and caches the analysis under its content hash.
+    """
+    with timer.stage('extract_text'):
+        text = extract_text_from_pdf(os.path.join(settings.MEDIA_ROOT, file_path))
+    analysis = analyze_text(text, timer)
+    # Unreadable PDFs are not cached so a retry re-parses them
+    if text:
+        with timer.stage('cache_store'):
+            _store_extracted(content_hash, text, analysis, file_path)
+    return analysis
+
+
+def _init_analysis_process():
+    import django
+    django.setup()
+
+
+def _get_analysis_processes():
+    global _analysis_processes
+    with _analysis_processes_lock:
+        if _analysis_processes is None:
+            # Spawned, not forked: the parent runs an event loop and threads
+            _analysis_processes = ProcessPoolExecutor(
+                max_workers=getattr(settings, 'ANALYSIS_PROCESSES', 2),
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_analysis_process,
+            )
+    return _analysis_processes
+
+
+async def aanalyze_stored_resume(content_hash, file_path, timer=NULL_TIMER):
+    """
+    Async analyze_stored_resume: the PDF is parsed and scored in the
+    analysis process pool (ANALYSIS_PROCESSES) and the results are stored
+    from a thread, so the event loop only waits on them.
+    """
+    loop = asyncio.get_running_loop()
+    with timer.stage('analyze'):
+        text, analysis = await loop.run_in_executor(
+            _get_analysis_processes(), extract_and_analyze, os.path.join(settings.MEDIA_ROOT, file_path))
+    if text:
+        with timer.stage('cache_store'):
+            await sync_to_async(_store_extracted)(content_hash, text, analysis, file_path)
+    return analysis
+
+
+def purge_stale_analyses(version=None):
+    """
+    Deletes every stored analysis from another rules/taxonomy version.
+    Lookups already ignore them, so this only reclaims space; run it once
+    after a version change (`manage.py reanalyze` does). Returns the number
+    of deleted rows.
+    """
+    with serialized_write():
+        deleted, _ = ResumeAnalysis.objects.exclude(version=version or get_analysis_version()).delete()
+    return deleted
+
+
+def get_cached_analysis(content_hash):
+    """
+    Returns the stored analysis for a resume hash, or None.
+    The in-process LRU is checked before the database.
+    """
+    version = get_analysis_version()
+    key = (content_hash, version)
+    analysis = _analysis_cache.get(key)
+    if analysis is not None:
+        return analysis
+
+    row = ResumeAnalysis.objects.filter(content_hash=content_hash, version=version).first()
+    if row is None:
+        return None
+    analysis = {
+        'skills': row.skills,
+        'ats_score': row.ats_score,
+        'ats_breakdown': row.ats_breakdown,
+        'resume': row.resume.name if row.resume else None,
+    }
+    _analysis_cache.set(key, analysis)
+    return analysis
+
+
+def store_analysis(content_hash, analysis, resume_path=None):
+    version = get_analysis_version()
+    with serialized_write():
+        ResumeAnalysis.objects.update_or_create(
+            content_hash=content_hash,
+            defaults={
+                'version': version,
+                'resume': resume_path,
+                'skills': analysis['skills'],
+                'ats_score': analysis['ats_score'],
+                'ats_breakdown': analysis['ats_breakdown'],
+            }
+        )
+    _analysis_cache.set((content_hash, version), dict(analysis, resume=resume_path))
+
+
+def analysis_cache_stats():
+    return _analysis_cache.stats()
+
+
+def analysis_response(analysis):
+    """
+    The analysis fields returned to the upload page.
+    """
+    ats_breakdown = analysis['ats_breakdown']
+    return {
+        'skills': analysis['skills'],
+        'ats_score': analysis['ats_score'],
+        'ats_breakdown': ats_breakdown,
+        'missing_keywords': ats_breakdown.get('missing_keywords', []),
+        'professional_summary': ats_breakdown.get('professional_summary', ''),
+    }
+
+
+def update_profile_analysis(user, file_path, analysis, content_hash=''):
+    """
+    Stores the resume and its analysis on the user's profile and its skill
+    index, on the serialized write path. Database errors are raised.
+    """
+    with serialized_write():
+        profile, created = UserProfile.objects.get_or_create(user=user)
+        profile.resume = file_path # Save relative path
+        profile.resume_hash = content_hash
+        profile.skills = analysis['skills']
+        profile.ats_score = analysis['ats_score']
+        profile.ats_breakdown = analysis['ats_breakdown']
+        profile.analysis_version = get_analysis_version()
+        profile.save()
+        sync_profile_skills(profile)
+
+
+def save_profile_analysis(user, file_path, analysis, content_hash=''):
+    """
+    Stores the resume and its analysis on the user's profile.
+    """
+    try:
+        update_profile_analysis(user, file_path, analysis, content_hash)
+    except Exception as e:
+        print(f"Error saving profile: {e}")
+
+
+def stale_profiles(version=None):
+    """
+    Profiles whose stored analysis comes from another rules/taxonomy
+    version (or from before versions were recorded). Profiles without a
+    resume have nothing to re-analyze.
+    """
+    return UserProfile.objects.exclude(resume='').exclude(analysis_version=version or get_analysis_version())
+
+
+def reanalyze_profiles(profile_ids, pdf_fallback=True):
+    """
+    Re-runs the analysis of a batch of profiles from their stored resume
+    text and saves the results, the skill index and the analysis cache in
+    one transaction. Profiles analyzed before texts were stored fall back
+    to parsing their PDF once (pdf_fallback), which stores the text for
+    next time. A resume shared by several profiles is analyzed once.
+    Returns counts of profiles by source: 'text', 'pdf' and 'missing'.
+    """
+    version = get_analysis_version()
+    profiles = list(UserProfile.objects.filter(id__in=profile_ids).only(
+        'id', 'resume', 'resume_hash', 'skills', 'ats_score', 'ats_breakdown'))
+    texts = dict(ResumeText.objects.filter(
+        content_hash__in={profile.resume_hash for profile in profiles if profile.resume_hash}
+    ).values_list('content_hash', 'compressed_text'))
+
+    counts = {'text': 0, 'pdf': 0, 'missing': 0}
+    analyses = {}
+    new_texts = {}
+    updated = []
+    for profile in profiles:
+        content_hash = profile.resume_hash
+        if content_hash in analyses:
+            source = 'text'
+        elif content_hash in texts:
+            analyses[content_hash] = analyze_text(decompress_text(texts[content_hash]))
+            source = 'text'
+        else:
+            path = os.path.join(settings.MEDIA_ROOT, profile.resume.name) if profile.resume else None
+            if not pdf_fallback or not path or not os.path.exists(path):
+                counts['missing'] += 1
+                continue
+            content_hash = hash_file(path)
+            text = extract_text_from_pdf(path)
+            if text:
+                new_texts[content_hash] = ResumeText(content_hash=content_hash, compressed_text=compress_text(text))
+            analyses[content_hash] = analyze_text(text)
+            source = 'pdf'
+        counts[source] += 1
+
+        analysis = analyses[content_hash]
+        profile.resume_hash = content_hash
+        profile.skills = analysis['skills']
+        profile.ats_score = analysis['ats_score']
+        profile.ats_breakdown = analysis['ats_breakdown']
+        profile.analysis_version = version
+        updated.append(profile)
+
+    with serialized_write():
+        ResumeText.objects.bulk_create(new_texts.values(), ignore_conflicts=True)
+        # uploaded_at is bumped like a save() would, so the recommendation
+        # refresh picks up the new skills
+        uploaded_at = connection.ops.adapt_datetimefield_value(timezone.now())
+        update_rows(UserProfile, ('resume_hash', 'skills', 'ats_score', 'ats_breakdown', 'analysis_version',
+                                  'uploaded_at'), [
+            (profile.resume_hash, json.dumps(profile.skills), profile.ats_score, json.dumps(profile.ats_breakdown),
+             version, uploaded_at, profile.id)
+            for profile in updated
+        ])
+        reindex_profiles([{'id': profile.id, 'skills': profile.skills, 'ats_score': profile.ats_score}
+                          for profile in updated])
+        ResumeAnalysis.objects.bulk_create([
+            ResumeAnalysis(content_hash=content_hash, version=version, skills=analysis['skills'],
+                           ats_score=analysis['ats_score'], ats_breakdown=analysis['ats_breakdown'])
+            for content_hash, analysis in analyses.items() if content_hash in texts or content_hash in new_texts
+        ], update_conflicts=True, unique_fields=['content_hash'],
+            update_fields=['version', 'skills', 'ats_score', 'ats_breakdown'])
+    return counts
@@ -3,3 +3,13 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = 'core'
+    default_auto_field = 'django.db.models.BigAutoField'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .db import apply_sqlite_pragmas
+        connection_created.connect(apply_sqlite_pragmas, dispatch_uid='core.apply_sqlite_pragmas')
+
+        # Compile the skill matcher once at startup instead of on first request
+        from .skills import get_skill_taxonomy
+        get_skill_taxonomy()
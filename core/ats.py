@@ -0,0 +1,200 @@
+import hashlib
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+
+from .matching import PhraseMatcher, tokenize
+from .skills import get_skill_taxonomy
+
+# Declarative ATS rules. Every phrase below is compiled into one
+# PhraseMatcher, so a resume is tokenized and scanned exactly once no matter
+# how many rules exist. Phrases match on token boundaries.
+ATS_RULES = {
+    # Section name -> words that count as that section (the words the old
+    # substring check matched, so scores stay the same)
+    "sections": {
+        "experience": ["experience", "experiences", "experienced"],
+        "education": ["education", "educational"],
+        "skills": ["skills"],
+        "summary": ["summary"],
+        "projects": ["projects"],
+    },
+    # Role (in priority order) -> phrases that identify it and the keywords
+    # a resume for that role is expected to contain
+    "roles": [
+        {"role": "developer", "triggers": ["developer", "developers"],
+         "keywords": ["python", "javascript", "react", "node.js", "api", "git", "docker", "aws", "ci/cd", "testing"]},
+        {"role": "engineer", "triggers": ["engineer", "engineers", "engineering"],
+         "keywords": ["system design", "architecture", "scalability", "microservices", "kubernetes", "devops"]},
+        {"role": "data", "triggers": ["data"],
+         "keywords": ["sql", "python", "machine learning", "pandas", "visualization", "statistics", "big data"]},
+        {"role": "manager", "triggers": ["manager", "managers"],
+         "keywords": ["leadership", "stakeholder management", "agile", "scrum", "roadmap", "kpis", "budgeting"]},
+        {"role": "designer", "triggers": ["designer", "designers"],
+         "keywords": ["ui/ux", "figma", "adobe", "wireframing", "prototyping", "user research", "design systems"]},
+        {"role": "analyst", "triggers": ["analyst", "analysts"],
+         "keywords": ["excel", "sql", "data analysis", "reporting", "dashboards", "business intelligence"]},
+        {"role": "marketing", "triggers": ["marketing"],
+         "keywords": ["seo", "sem", "content marketing", "analytics", "campaign management", "social media"]},
+    ],
+    # Industry keywords most resumes should mention
+    "recommended_keywords": {
+        "technical": ["agile", "scrum", "ci/cd", "devops", "cloud", "api", "testing", "debugging",
+                      "version control", "git", "collaboration", "problem-solving"],
+        "soft_skills": ["leadership", "communication", "teamwork", "analytical", "creative",
+                        "detail-oriented", "time management", "adaptable", "strategic thinking"],
+        "achievements": ["improved", "increased", "reduced", "developed", "implemented",
+                         "designed", "optimized", "achieved", "led", "managed", "delivered"],
+    },
+    # Other forms of the keywords above that count as mentioning them
+    # (taxonomy skills also match through their aliases)
+    "keyword_aliases": {
+        "api": ["apis"],
+        "microservices": ["microservice"],
+        "dashboards": ["dashboard"],
+        "kpis": ["kpi"],
+        "design systems": ["design system"],
+    },
+    # Job titles used in the generated professional summary (in priority
+    # order) and the words that identify them, including the plurals and
+    # derived forms the title used to match as a substring
+    "summary_roles": [
+        {"role": "developer", "triggers": ["developer", "developers"]},
+        {"role": "engineer", "triggers": ["engineer", "engineers", "engineering"]},
+        {"role": "designer", "triggers": ["designer", "designers"]},
+        {"role": "manager", "triggers": ["manager", "managers"]},
+        {"role": "analyst", "triggers": ["analyst", "analysts"]},
+        {"role": "scientist", "triggers": ["scientist", "scientists"]},
+        {"role": "architect", "triggers": ["architect", "architects", "architecture", "architectures",
+                                           "architectural"]},
+        {"role": "consultant", "triggers": ["consultant", "consultants"]},
+        {"role": "specialist", "triggers": ["specialist", "specialists"]},
+        {"role": "administrator", "triggers": ["administrator", "administrators"]},
+    ],
+    # Focus area -> phrases that indicate it
+    "focus_areas": {
+        "project delivery": ["project", "projects"],
+        "team collaboration": ["team", "teams", "teamwork", "collaboration"],
+        "client satisfaction": ["client", "clients", "customer", "customers"],
+    },
+}
+
+ATS_RULES_VERSION = hashlib.sha256(json.dumps(ATS_RULES, sort_keys=True).encode()).hexdigest()[:12]
+
+# A numeric token, optionally with "+" and a glued "year(s)" ("5", "5+", "5+years")
+NUMBER_TOKEN_RE = re.compile(r"(\d+)\+?(years?)?")
+YEAR_TOKENS = {"year", "years"}
+DIGITS = frozenset("0123456789")
+
+
+@dataclass
+class ResumeFeatures:
+    """Everything the ATS score and summary need, gathered in one pass."""
+    word_count: int = 0
+    has_email: bool = False
+    digit_count: int = 0
+    years_experience: int = 0
+    sections: set = field(default_factory=set)
+    roles: set = field(default_factory=set)
+    keywords: set = field(default_factory=set)
+    summary_roles: set = field(default_factory=set)
+    focus_areas: set = field(default_factory=set)
+
+    @property
+    def has_phone(self):
+        return self.digit_count > 9
+
+
+class CompiledRules:
+    """
+    ATS_RULES compiled into a single PhraseMatcher. Keywords that are also
+    taxonomy skills match through their aliases too ("reactjs" counts as
+    "react").
+    """
+
+    def __init__(self, rules, aliases=None):
+        aliases = aliases or {}
+        self.rules = rules
+        self.matcher = PhraseMatcher()
+        for section, phrases in rules["sections"].items():
+            for phrase in phrases:
+                self.matcher.add(phrase, ("sections", section))
+        keywords = set()
+        for role in rules["roles"]:
+            for phrase in role["triggers"]:
+                self.matcher.add(phrase, ("roles", role["role"]))
+            keywords.update(role["keywords"])
+        for category_keywords in rules["recommended_keywords"].values():
+            keywords.update(category_keywords)
+        for keyword in keywords:
+            self.matcher.add(keyword, ("keywords", keyword))
+            for alias in (*aliases.get(keyword, ()), *rules["keyword_aliases"].get(keyword, ())):
+                self.matcher.add(alias, ("keywords", keyword))
+        for role in rules["summary_roles"]:
+            for phrase in role["triggers"]:
+                self.matcher.add(phrase, ("summary_roles", role["role"]))
+        for area, phrases in rules["focus_areas"].items():
+            for phrase in phrases:
+                self.matcher.add(phrase, ("focus_areas", area))
+
+    def extract_features(self, text):
+        text_lower = text.lower()
+        tokens = tokenize(text_lower)
+        # Length and contact checks keep the exact semantics of the original
+        # scoring: whitespace-separated words, any "@", and every digit in
+        # the text (so "john123" or "python3" still count towards a phone)
+        features = ResumeFeatures(
+            word_count=len(text.split()),
+            has_email="@" in text,
+            digit_count=sum(map(str.isdigit, text)),
+        )
+
+        # One walk over the tokens: phrase matches via the trie, and
+        # "N years" for numeric tokens that start no phrase
+        root = self.matcher.root
+        end = PhraseMatcher.END
+        last = len(tokens) - 1
+        for start, token in enumerate(tokens):
+            node = root.get(token)
+            if node is None:
+                if token[0] in DIGITS:
+                    self._add_years(features, tokens, start, last)
+                continue
+            position = start
+            while node is not None:
+                for kind, name in node.get(end, ()):
+                    getattr(features, kind).add(name)
+                position += 1
+                if position > last:
+                    break
+                node = node.get(tokens[position])
+        return features
+
+    @staticmethod
+    def _add_years(features, tokens, position, last):
+        match = NUMBER_TOKEN_RE.fullmatch(tokens[position])
+        if match is None:
+            return
+        if match.group(2) or (position < last and tokens[position + 1] in YEAR_TOKENS):
+            features.years_experience = max(features.years_experience, int(match.group(1)))
+
+
+_compiled_rules = None
+_compiled_rules_lock = threading.Lock()
+
+
+def get_ats_rules():
+    """
+    Returns the process-wide compiled ATS rules, compiling them on first use.
+    """
+    global _compiled_rules
+    if _compiled_rules is None:
+        with _compiled_rules_lock:
+            if _compiled_rules is None:
+                _compiled_rules = CompiledRules(ATS_RULES, get_skill_taxonomy().skills)
+    return _compiled_rules
+
+
+def extract_features(text):
+    return get_ats_rules().extract_features(text or "")
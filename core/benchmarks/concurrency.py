@@ -0,0 +1,196 @@
+import asyncio
+import itertools
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+
+from .runner import summarize
+
+# scenario: (sync view path, async view path)
+SCENARIOS = {
+    'jobs': ('/core/jobs/', '/core/jobs/async/'),
+    'translate': ('/core/translate/', '/core/translate/async/'),
+}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_simulator(latency_ms):
+    """
+    Starts `manage.py simulate_providers` in its own process, so simulated
+    providers do not compete with the app for the GIL. Returns (process,
+    url) once it accepts connections.
+    """
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, str(settings.BASE_DIR / 'manage.py'), 'simulate_providers', '--port', str(port),
+         '--latency-ms', str(latency_ms), '--jitter-ms', '0', '--seed', '0'],
+        stdout=subprocess.DEVNULL, env=os.environ.copy())
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError("The provider simulator did not start.")
+            time.sleep(0.2)
+
+
+class _Payloads:
+    """
+    Unique request bodies, so every request misses the job and translation
+    caches and pays the full provider or translator round trip.
+    """
+
+    def __init__(self):
+        self.counter = itertools.count()
+        self.translated = []
+
+    def __call__(self, scenario):
+        n = next(self.counter)
+        if scenario == 'jobs':
+            return {'skills': [f"benchmark{n}", 'python', 'django']}
+        text = f"Benchmark job description {n}: build and operate APIs with a small team."
+        self.translated.append(text)
+        return {'text': text, 'target_language': 'hi'}
+
+
+def _report(samples, errors, elapsed):
+    return dict(summarize(samples or [0.0]), ops_per_sec=round(len(samples) / elapsed, 2), errors=errors)
+
+
+def _ok(response):
+    return response.status_code == 200 and json.loads(response.content).get('success', False)
+
+
+def run_wsgi(path, scenario, payloads, clients, threads, seconds):
+    """
+    A WSGI server with `threads` request threads (a sync worker has one)
+    under `clients` closed-loop clients: each sends its next request as
+    soon as the previous one is answered, and waits while every thread is
+    busy.
+    """
+    server = ThreadPoolExecutor(max_workers=threads)
+    handlers = threading.local()
+    samples = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def handle(body):
+        client = getattr(handlers, 'client', None)
+        if client is None:
+            client = handlers.client = Client()
+        return _ok(client.post(path, data=json.dumps(body), content_type='application/json'))
+
+    def client_loop():
+        nonlocal errors
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                ok = server.submit(handle, payloads(scenario)).result()
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - started
+            with lock:
+                samples.append(elapsed)
+                errors += not ok
+
+    started = time.monotonic()
+    client_threads = [threading.Thread(target=client_loop) for _ in range(clients)]
+    for thread in client_threads:
+        thread.start()
+    for thread in client_threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    server.shutdown()
+    return _report(samples, errors, elapsed)
+
+
+def run_asgi(path, scenario, payloads, clients, seconds):
+    """
+    One ASGI worker (one event loop) under `clients` closed-loop clients.
+    """
+    samples = []
+    errors = 0
+
+    async def client_loop(deadline):
+        nonlocal errors
+        client = AsyncClient()
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                ok = _ok(await client.post(path, data=json.dumps(payloads(scenario)),
+                                           content_type='application/json'))
+            except Exception:
+                ok = False
+            samples.append(time.perf_counter() - started)
+            errors += not ok
+
+    async def run():
+        started = time.monotonic()
+        await asyncio.gather(*(client_loop(started + seconds) for _ in range(clients)))
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(run())
+    return _report(samples, errors, elapsed)
+
+
+def run_concurrency_benchmarks(clients=(10, 100, 300), wsgi_threads=(1, 8), seconds=5.0,
+                               provider_latency_ms=200, scenarios=tuple(SCENARIOS), progress=None):
+    """
+    Compares how many concurrent job searches and translations one worker
+    sustains: the sync views under a WSGI worker with each thread count,
+    and the async views under an ASGI worker. Providers are simulated with
+    provider_latency_ms of latency and the translator waits as long per
+    call. Returns {name: summary} with throughput as ops_per_sec.
+    """
+    from core.models import TranslationCache
+    from core.translation import text_hash
+    from core.utils import job_cache
+
+    simulator, url = start_simulator(provider_latency_ms)
+    payloads = _Payloads()
+    results = {}
+    try:
+        with override_settings(
+            # The test clients' host, allowed like under the test runner
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+            ADZUNA_API_URL=f"{url}/adzuna", JSEARCH_API_URL=f"{url}/jsearch/search",
+            REMOTEOK_API_URL=f"{url}/remoteok/api", RAPIDAPI_KEY='simulator', REMOTEOK_SNAPSHOT_PATH='',
+            JOB_CATALOG_ENABLED=False, TRANSLATOR_CLASS='core.translation.LocalTranslator',
+            TRANSLATOR_STUB_DELAY=provider_latency_ms / 1000,
+        ):
+            for scenario in scenarios:
+                sync_path, async_path = SCENARIOS[scenario]
+                for count in clients:
+                    runs = [(f"wsgi threads={threads}", lambda threads=threads: run_wsgi(
+                        sync_path, scenario, payloads, count, threads, seconds)) for threads in wsgi_threads]
+                    runs.append(('asgi', lambda: run_asgi(async_path, scenario, payloads, count, seconds)))
+                    for server, run in runs:
+                        name = f"{scenario}[{server} clients={count}]"
+                        results[name] = run()
+                        if progress:
+                            progress(name, results[name])
+    finally:
+        simulator.terminate()
+        simulator.wait()
+        job_cache.clear()
+        TranslationCache.objects.filter(
+            text_hash__in=[text_hash(text) for text in payloads.translated]).delete()
+    return results
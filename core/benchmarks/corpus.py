@@ -0,0 +1,160 @@
+import os
+import random
+
+from core.skills import get_skill_taxonomy
+
+# Document kinds, from what most uploads look like to inputs that stress
+# specific code paths (many matches, non-ASCII tokenizing, no word breaks)
+CORPUS_KINDS = ['short', 'typical', 'long', 'dense_skills', 'unicode', 'no_whitespace']
+
+FIRST_NAMES = ['Aarav', 'Priya', 'Rohan', 'Ananya', 'Vikram', 'Sneha', 'Arjun', 'Meera', 'Kabir', 'Isha']
+LAST_NAMES = ['Sharma', 'Patel', 'Iyer', 'Reddy', 'Gupta', 'Nair', 'Singh', 'Das', 'Mehta', 'Rao']
+COMPANIES = ['Infosys', 'TCS', 'Wipro', 'Flipkart', 'Zoho', 'Freshworks', 'Razorpay', 'Swiggy', 'Acme Labs']
+ROLES = ['Software Engineer', 'Backend Developer', 'Frontend Developer', 'Full Stack Developer',
+         'Data Scientist', 'DevOps Engineer', 'QA Engineer', 'Mobile Developer']
+VERBS = ['Built', 'Designed', 'Led', 'Migrated', 'Optimized', 'Automated', 'Implemented', 'Maintained']
+FILLER = ['scalable', 'services', 'for', 'customers', 'across', 'teams', 'with', 'high', 'availability',
+          'reducing', 'latency', 'and', 'cost', 'using', 'modern', 'tooling', 'in', 'production']
+UNICODE_WORDS = ['développeur', 'ingénieur', 'données', 'système', 'équipe', 'München', 'São', 'Paulo',
+                 'разработчик', 'программист', 'データ', 'エンジニア', '开发', '工程师', 'विकासकर्ता']
+
+
+def _skills(rng, count):
+    names = list(get_skill_taxonomy().skills)
+    return rng.sample(names, min(count, len(names)))
+
+
+def _bullet(rng, skills):
+    words = [rng.choice(VERBS)] + rng.sample(FILLER, 8) + [rng.choice(skills)] + rng.sample(FILLER, 4)
+    return f"- {' '.join(words)}, improving throughput by {rng.randint(5, 80)}%."
+
+
+def _resume(rng, jobs, bullets_per_job, skill_count):
+    skills = _skills(rng, skill_count)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.split()[0].lower()}@example.com | +91 98{rng.randint(10000000, 99999999)}",
+        "",
+        "SUMMARY",
+        f"{rng.choice(ROLES)} with {rng.randint(1, 15)} years of experience in {', '.join(skills[:3])}.",
+        "",
+        "EXPERIENCE",
+    ]
+    for _ in range(jobs):
+        start = rng.randint(2008, 2022)
+        lines.append(f"{rng.choice(ROLES)}, {rng.choice(COMPANIES)} ({start} - {start + rng.randint(1, 4)})")
+        lines.extend(_bullet(rng, skills) for _ in range(bullets_per_job))
+    lines += [
+        "",
+        "EDUCATION",
+        f"B.Tech in Computer Science, {rng.choice(['IIT', 'NIT', 'VIT', 'BITS'])} ({rng.randint(2004, 2020)})",
+        "",
+        "PROJECTS",
+        _bullet(rng, skills),
+        "",
+        "SKILLS",
+        ", ".join(skills),
+    ]
+    return "\n".join(lines)
+
+
+def generate_resume(kind, seed=0):
+    """
+    Returns deterministic synthetic resume text of the given kind.
+    """
+    rng = random.Random(f"{kind}-{seed}")
+    if kind == 'short':
+        return _resume(rng, jobs=1, bullets_per_job=2, skill_count=5)
+    if kind == 'typical':
+        return _resume(rng, jobs=3, bullets_per_job=5, skill_count=20)
+    if kind == 'long':
+        return _resume(rng, jobs=25, bullets_per_job=15, skill_count=80)
+    if kind == 'dense_skills':
+        # Every taxonomy alias, many times over: worst case for phrase matching
+        aliases = [alias for names in get_skill_taxonomy().skills.values() for alias in names]
+        aliases += list(get_skill_taxonomy().skills)
+        return ", ".join(rng.choice(aliases) for _ in range(5000))
+    if kind == 'unicode':
+        words = [rng.choice(UNICODE_WORDS + FILLER) for _ in range(3000)]
+        return _resume(rng, jobs=2, bullets_per_job=3, skill_count=10) + "\n" + " ".join(words)
+    if kind == 'no_whitespace':
+        return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789.+#") for _ in range(50000))
+    raise ValueError(f"Unknown corpus kind: {kind}")
+
+
+def _pdf_escape(line):
+    line = line.encode('latin-1', 'replace').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _wrap(text, width=95):
+    for paragraph in text.split("\n"):
+        while len(paragraph) > width:
+            cut = paragraph.rfind(' ', 0, width)
+            cut = cut if cut > 0 else width
+            yield paragraph[:cut]
+            paragraph = paragraph[cut:].lstrip()
+        yield paragraph
+
+
+def render_pdf(text, lines_per_page=60):
+    """
+    Renders text as a minimal uncompressed PDF (Helvetica, one text object
+    per page), enough for pypdf to extract it again. Characters outside
+    Latin-1 become '?'.
+    """
+    lines = list(_wrap(text)) or ['']
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    # Object numbers: 1 catalog, 2 page tree, 3 font, then (page, content) pairs
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    }
+    page_refs = []
+    for i, page_lines in enumerate(pages):
+        page_num, content_num = 4 + 2 * i, 5 + 2 * i
+        ops = ["BT", "/F1 10 Tf", "12 TL", "50 760 Td"]
+        ops += [f"({_pdf_escape(line)}) Tj T*" for line in page_lines]
+        ops.append("ET")
+        stream = "\n".join(ops).encode('latin-1')
+        objects[content_num] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        objects[page_num] = (b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                             b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_num)
+        page_refs.append(b"%d 0 R" % page_num)
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(page_refs), len(pages))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, objects[num])
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for num in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[num]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def write_pdf(path, text, lines_per_page=60):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(render_pdf(text, lines_per_page))
+    return path
+
+
+def build_corpus(directory, kinds=None, copies=1):
+    """
+    Writes `copies` PDFs of each kind into directory and returns
+    {kind: [(path, text), ...]}.
+    """
+    corpus = {}
+    for kind in kinds or CORPUS_KINDS:
+        corpus[kind] = []
+        for seed in range(copies):
+            text = generate_resume(kind, seed)
+            path = write_pdf(os.path.join(directory, f"{kind}_{seed}.pdf"), text)
+            corpus[kind].append((path, text))
+    return corpus
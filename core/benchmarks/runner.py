@@ -0,0 +1,116 @@
+import json
+import os
+import platform
+import time
+
+from core.matching import tokenize
+from core.utils import calculate_ats_score, extract_skills, extract_text_from_pdf, generate_professional_summary
+
+from .corpus import CORPUS_KINDS, build_corpus
+
+
+def _reset_caches():
+    # Skill extraction and ATS scoring share memoized tokenizing, which would
+    # otherwise turn every repeated call on the same text into a cache hit
+    tokenize.cache_clear()
+
+
+def make_benchmarks(corpus):
+    """
+    Returns {name: callable} for every hot path and corpus kind.
+    """
+    benchmarks = {}
+    for kind, documents in corpus.items():
+        path, text = documents[0]
+        skills = extract_skills(text)
+        benchmarks[f"extract_skills[{kind}]"] = lambda text=text: extract_skills(text)
+        benchmarks[f"calculate_ats_score[{kind}]"] = (
+            lambda text=text, skills=skills: calculate_ats_score(text, skills))
+        benchmarks[f"generate_professional_summary[{kind}]"] = (
+            lambda text=text, skills=skills: generate_professional_summary(text, skills))
+        benchmarks[f"extract_text_from_pdf[{kind}]"] = lambda path=path: extract_text_from_pdf(path)
+    return benchmarks
+
+
+def measure(func, min_time=0.5, min_runs=5, max_runs=10000):
+    """
+    Calls func until min_time seconds and min_runs calls have passed (after
+    one warm-up call) and returns the per-call durations in seconds.
+    """
+    _reset_caches()
+    func()
+    samples = []
+    total = 0.0
+    while (total < min_time or len(samples) < min_runs) and len(samples) < max_runs:
+        _reset_caches()
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        samples.append(elapsed)
+        total += elapsed
+    return samples
+
+
+def summarize(samples):
+    samples = sorted(samples)
+
+    def percentile(p):
+        return round(samples[min(len(samples) - 1, int(p * len(samples)))] * 1000, 4)
+
+    return {
+        'runs': len(samples),
+        'ops_per_sec': round(len(samples) / sum(samples), 2),
+        'mean_ms': round(sum(samples) / len(samples) * 1000, 4),
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+    }
+
+
+def run_benchmarks(directory, kinds=None, name_filter=None, min_time=0.5, progress=None):
+    """
+    Builds the synthetic corpus in directory and benchmarks every hot path
+    on it. Returns {name: summary}.
+    """
+    corpus = build_corpus(directory, kinds or CORPUS_KINDS)
+    results = {}
+    for name, func in make_benchmarks(corpus).items():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = summarize(measure(func, min_time=min_time))
+        if progress:
+            progress(name, results[name])
+    return results
+
+
+def save_baseline(path, results):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'created_at': time.time(),
+            'results': results,
+        }, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['results']
+
+
+def compare(results, baseline, threshold=0.2):
+    """
+    Compares median (p50) times against a baseline. Returns a list of
+    (name, baseline_ms, current_ms, change) for benchmarks that got slower
+    by more than threshold (0.2 = 20%).
+    """
+    regressions = []
+    for name, summary in results.items():
+        base = baseline.get(name)
+        if not base or not base['p50_ms']:
+            continue
+        change = summary['p50_ms'] / base['p50_ms'] - 1
+        if change > threshold:
+            regressions.append((name, base['p50_ms'], summary['p50_ms'], change))
+    return regressions
@@ -0,0 +1,74 @@
+import json
+import time
+import uuid
+
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+
+from .runner import summarize
+
+BULK_SIZES = (1, 100, 1000)
+
+
+def _job(i):
+    return {
+        'job_id': f"bench-{i}",
+        'job_title': f"Backend Developer {i}",
+        'company': 'Acme Labs',
+        'location': 'Bangalore, India',
+        'description': 'Build and operate APIs. ' * 40,
+        'redirect_url': f"https://example.com/jobs/{i}",
+        'salary': '10-20 LPA',
+        'posted_date': '2026-01-01',
+    }
+
+
+def _post(view, user, payload):
+    request = RequestFactory().post('/', data=json.dumps(payload), content_type='application/json')
+    request.user = user
+    response = view(request)
+    if response.status_code != 200:
+        raise RuntimeError(f"{view.__name__} returned {response.status_code}: {response.content[:200]}")
+    return response
+
+
+def run_saved_job_benchmarks(sizes=BULK_SIZES, repeat=3, progress=None):
+    """
+    Times saving and then removing N jobs, one save_job_view call per job
+    versus one bulk_save_jobs_view call, against the configured database.
+    Uses a throwaway user that is deleted afterwards. Returns {name: summary}.
+    """
+    from core.views import bulk_save_jobs_view, save_job_view
+
+    user = User.objects.create_user(username=f"benchmark-{uuid.uuid4().hex[:12]}")
+    results = {}
+    try:
+        for size in sizes:
+            jobs = [_job(i) for i in range(size)]
+            samples = {'save_loop': [], 'unsave_loop': [], 'save_bulk': [], 'unsave_bulk': []}
+            for _ in range(repeat):
+                started = time.perf_counter()
+                for job in jobs:
+                    _post(save_job_view, user, dict(job, action='save'))
+                samples['save_loop'].append(time.perf_counter() - started)
+                started = time.perf_counter()
+                for job in jobs:
+                    _post(save_job_view, user, {'job_id': job['job_id'], 'action': 'unsave'})
+                samples['unsave_loop'].append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                _post(bulk_save_jobs_view, user, {'items': [dict(job, action='save') for job in jobs]})
+                samples['save_bulk'].append(time.perf_counter() - started)
+                started = time.perf_counter()
+                _post(bulk_save_jobs_view, user, {'items': [{'job_id': job['job_id'], 'action': 'unsave'}
+                                                            for job in jobs]})
+                samples['unsave_bulk'].append(time.perf_counter() - started)
+
+            for kind, kind_samples in samples.items():
+                name = f"saved_jobs_{kind}[{size}]"
+                results[name] = summarize(kind_samples)
+                if progress:
+                    progress(name, results[name])
+    finally:
+        user.delete()
+    return results
@@ -0,0 +1,105 @@
+import json
+import threading
+import time
+import uuid
+
+from django.contrib.auth.models import User
+from django.db import OperationalError, connection
+from django.test import RequestFactory
+
+from .runner import summarize
+from .saved_jobs import _job
+
+PROFILE_ANALYSIS = {
+    'skills': ['python', 'django', 'sql'],
+    'ats_score': 72,
+    'ats_breakdown': {'missing_keywords': [], 'professional_summary': ''},
+}
+
+
+def _is_lock_error(message):
+    return 'database is locked' in message or 'database table is locked' in message
+
+
+def _view_write(view, user, payload):
+    request = RequestFactory().post('/', data=json.dumps(payload), content_type='application/json')
+    request.user = user
+    response = view(request)
+    if response.status_code != 200:
+        raise OperationalError(json.loads(response.content).get('error', response.status_code))
+
+
+def _write_cycle(user, worker, cycle):
+    """
+    The hot writes of the app in the order a user makes them, as
+    callables: a profile update (upload_view), a job save and unsave
+    (save_job_view) and a small bulk save (bulk_save_jobs_view).
+    """
+    from core.analysis import update_profile_analysis
+    from core.views import bulk_save_jobs_view, save_job_view
+
+    job = _job(f"{worker}-{cycle}")
+    batch = [dict(_job(f"{worker}-{cycle}-{i}"), action='save') for i in range(5)]
+    return [
+        lambda: update_profile_analysis(user, f"resumes/stress-{worker}.pdf", PROFILE_ANALYSIS),
+        lambda: _view_write(save_job_view, user, dict(job, action='save')),
+        lambda: _view_write(save_job_view, user, {'job_id': job['job_id'], 'action': 'unsave'}),
+        lambda: _view_write(bulk_save_jobs_view, user, {'items': batch}),
+    ]
+
+
+def run_write_stress(threads=8, seconds=10.0):
+    """
+    Runs the hot write paths from concurrent threads, each as its own
+    throwaway user, against the configured database for the given time.
+    Returns write counts, lock errors, writes/s and write latencies.
+    """
+    users = [User.objects.create_user(username=f"stress-{uuid.uuid4().hex[:12]}") for _ in range(threads)]
+    samples = []
+    counts = {'writes': 0, 'lock_errors': 0, 'other_errors': 0}
+    errors = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def worker(index, user):
+        cycle = 0
+        try:
+            while time.perf_counter() < deadline:
+                for write in _write_cycle(user, index, cycle):
+                    started = time.perf_counter()
+                    error = None
+                    try:
+                        write()
+                        outcome = 'writes'
+                    except Exception as e:
+                        error = str(e)
+                        outcome = 'lock_errors' if _is_lock_error(error) else 'other_errors'
+                    elapsed = time.perf_counter() - started
+                    with lock:
+                        counts[outcome] += 1
+                        if error is None:
+                            samples.append(elapsed)
+                        else:
+                            errors.append(error)
+                cycle += 1
+        finally:
+            connection.close()
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(index, user), name=f"stress-{index}")
+               for index, user in enumerate(users)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    User.objects.filter(pk__in=[user.pk for user in users]).delete()
+    return {
+        'threads': threads,
+        'seconds': round(elapsed, 2),
+        **counts,
+        'writes_per_sec': round(counts['writes'] / elapsed, 1),
+        'latency': summarize(samples) if samples else None,
+        'sample_errors': sorted(set(errors))[:5],
+    }
@@ -0,0 +1,121 @@
+from django.conf import settings
+from django.db.models import Exists, OuterRef
+
+from .db import insert_rows, serialized_write
+from .models import ProfileSkill, UserProfile
+from .skills import get_skill_taxonomy
+
+SKILL_MAX_LENGTH = ProfileSkill._meta.get_field('skill').max_length
+
+
+def normalize_skills(skills):
+    """
+    Canonical, deduplicated skill names in their original order; blank and
+    over-long names are dropped.
+    """
+    taxonomy = get_skill_taxonomy()
+    normalized = []
+    for skill in skills:
+        if not isinstance(skill, str):
+            continue
+        skill = taxonomy.canonical(skill)
+        if skill and len(skill) <= SKILL_MAX_LENGTH and skill not in normalized:
+            normalized.append(skill)
+    return normalized
+
+
+def _index_rows(profile_id, skills, ats_score):
+    return [ProfileSkill(profile_id=profile_id, skill=skill, ats_score=ats_score or 0)
+            for skill in normalize_skills(skills or [])]
+
+
+def sync_profile_skills(profile):
+    """
+    Rewrites the skill index rows of one profile from profile.skills and
+    profile.ats_score. Runs in the caller's transaction when there is one.
+    """
+    with serialized_write():
+        ProfileSkill.objects.filter(profile_id=profile.pk).delete()
+        ProfileSkill.objects.bulk_create(_index_rows(profile.pk, profile.skills, profile.ats_score))
+
+
+def reindex_profiles(profiles):
+    """
+    Rewrites the skill index rows of a batch of profiles, given as values()
+    rows with id, skills and ats_score, in one delete and one insert.
+    Returns the number of index rows written.
+    """
+    rows = [(profile['id'], skill, profile['ats_score'] or 0)
+            for profile in profiles for skill in normalize_skills(profile['skills'] or [])]
+    with serialized_write():
+        ProfileSkill.objects.filter(profile_id__in=[profile['id'] for profile in profiles]).delete()
+        insert_rows(ProfileSkill, ('profile_id', 'skill', 'ats_score'), rows)
+    return len(rows)
+
+
+def _posting(skills, min_ats):
+    """
+    Index entries of profiles with any of the skills and at least min_ats:
+    a range scan on the (skill, ats_score, profile) index per skill.
+    """
+    return ProfileSkill.objects.filter(skill__in=skills, ats_score__gte=min_ats)
+
+
+def _has_skill(skills):
+    return Exists(ProfileSkill.objects.filter(profile_id=OuterRef('profile_id'), skill__in=skills))
+
+
+def _capped_count(queryset, cap):
+    return queryset[:cap].count()
+
+
+def search_candidates(all_skills=(), any_skills=(), min_ats=0, limit=50, offset=0):
+    """
+    Profiles having every skill of all_skills and at least one of
+    any_skills, with an ATS score of at least min_ats, best score first.
+
+    The query is driven by the rarest skill's posting list, read from the
+    (skill, ats_score) index in score order, and the other skills are
+    index lookups per candidate, so a page costs at most one short posting
+    list or the first few hundred entries of a long one. The profile table
+    is only read for the returned page. total is exact up to
+    CANDIDATE_SEARCH_COUNT_LIMIT; above it total_exact is False.
+    Returns a dict with total, total_exact and candidates.
+    """
+    if not all_skills and not any_skills:
+        raise ValueError("At least one skill is required.")
+    cap = getattr(settings, 'CANDIDATE_SEARCH_COUNT_LIMIT', 1000)
+
+    if all_skills:
+        # Rarest first; counting stops at the cap, so this is a few index probes
+        driver = min(all_skills, key=lambda skill: _capped_count(_posting([skill], min_ats), cap))
+        matches = _posting([driver], min_ats)
+        for skill in all_skills:
+            if skill != driver:
+                matches = matches.filter(_has_skill([skill]))
+        if any_skills:
+            matches = matches.filter(_has_skill(any_skills))
+        matches = matches.order_by('-ats_score', '-profile_id').values_list('profile_id', flat=True)
+    elif _capped_count(_posting(any_skills, min_ats), cap) < cap:
+        # A short union: sorting it is cheaper than walking the profiles
+        matches = (_posting(any_skills, min_ats).order_by('-ats_score', '-profile_id')
+                   .values_list('profile_id', flat=True).distinct())
+    else:
+        # Common skills: walk profiles best score first until the page is full
+        matches = (UserProfile.objects.filter(ats_score__gte=min_ats)
+                   .filter(Exists(ProfileSkill.objects.filter(profile_id=OuterRef('pk'), skill__in=any_skills)))
+                   .order_by('-ats_score', '-id').values_list('id', flat=True))
+
+    total = _capped_count(matches, cap + 1)
+    page_ids = list(matches[offset:offset + limit])
+    rows = {row['id']: row for row in UserProfile.objects.filter(id__in=page_ids).values(
+        'id', 'user_id', 'user__username', 'ats_score', 'skills', 'uploaded_at')}
+    candidates = [{
+        'profile_id': row['id'],
+        'user_id': row['user_id'],
+        'username': row['user__username'],
+        'ats_score': row['ats_score'],
+        'skills': row['skills'],
+        'uploaded_at': row['uploaded_at'].isoformat(),
+    } for row in (rows[profile_id] for profile_id in page_ids if profile_id in rows)]
+    return {'total': min(total, cap), 'total_exact': total <= cap, 'candidates': candidates}
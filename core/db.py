@@ -0,0 +1,87 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+
+from .metrics import Histogram
+
+WRITE_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+# One writer at a time per process: threads queue on this lock instead of
+# all racing for SQLite's database lock and backing off in its busy handler
+_write_lock = threading.RLock()
+
+write_lock_wait = Histogram(
+    'resume_app_db_write_lock_wait_seconds', "Time spent waiting for the serialized write path.",
+    buckets=WRITE_WAIT_BUCKETS)
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """
+    connection_created receiver: applies SQLITE_PRAGMAS (WAL journal,
+    synchronous level, busy timeout...) to every new SQLite connection.
+    journal_mode=WAL is stored in the database file; the others are per
+    connection, so they are set every time.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    pragmas = getattr(settings, 'SQLITE_PRAGMAS', {})
+    if not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def serializes_writes(using='default'):
+    return connections[using].vendor == 'sqlite' and getattr(settings, 'SQLITE_SERIALIZE_WRITES', False)
+
+
+@contextmanager
+def serialized_write(using='default'):
+    """
+    Runs the block in a transaction on the serialized write path: with
+    SQLITE_SERIALIZE_WRITES on a SQLite database the block first takes the
+    process-wide write lock, so concurrent requests of this process write
+    one after another. Other processes are still kept out by SQLite's own
+    lock and busy timeout. Elsewhere this is just transaction.atomic().
+    """
+    if not serializes_writes(using):
+        with transaction.atomic(using=using):
+            yield
+        return
+    started = time.perf_counter()
+    with _write_lock:
+        write_lock_wait.observe(time.perf_counter() - started)
+        with transaction.atomic(using=using):
+            yield
+
+
+def insert_rows(model, columns, rows):
+    """
+    INSERTs rows (tuples of database values for columns) with one
+    executemany. For batch jobs writing many thousands of rows: unlike
+    bulk_create it builds no model instance per row, which is most of
+    bulk_create's cost. JSON values must already be serialized.
+    """
+    quote = connection.ops.quote_name
+    placeholders = ', '.join(['%s'] * len(columns))
+    sql = (f"INSERT INTO {quote(model._meta.db_table)} ({', '.join(quote(column) for column in columns)}) "
+           f"VALUES ({placeholders})")
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
+def update_rows(model, columns, rows):
+    """
+    UPDATEs rows by primary key with one executemany; each row is the
+    database values for columns followed by the primary key. The batch
+    counterpart of insert_rows.
+    """
+    quote = connection.ops.quote_name
+    assignments = ', '.join(f"{quote(column)} = %s" for column in columns)
+    sql = f"UPDATE {quote(model._meta.db_table)} SET {assignments} WHERE {quote(model._meta.pk.column)} = %s"
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
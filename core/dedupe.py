@@ -0,0 +1,213 @@
+import hashlib
+import re
+from functools import lru_cache
+
+from .matching import strip_html
+
+WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+# Title words that name a seniority level, and the level they name.
+# Postings for different levels are different jobs, even when their
+# descriptions match.
+SENIORITY_LEVELS = {
+    "senior": "senior", "sr": "senior", "junior": "junior", "jr": "junior", "lead": "lead",
+    "principal": "principal", "staff": "staff", "intern": "intern", "trainee": "trainee",
+    "entry": "entry", "mid": "mid", "i": "i", "ii": "ii", "iii": "iii", "iv": "iv",
+}
+# Words that describe the contract or workplace rather than the job itself
+TITLE_NOISE = {
+    "level", "remote", "hybrid", "onsite", "full", "part", "time", "contract", "permanent",
+    "m", "f", "d", "w",
+}
+# Legal-form suffixes that differ between providers for the same employer
+COMPANY_NOISE = {
+    "inc", "incorporated", "llc", "llp", "ltd", "limited", "pvt", "private", "plc",
+    "corp", "corporation", "co", "company", "gmbh", "ag", "sa", "bv", "pte", "the",
+}
+# Only the start of the description is compared, because providers truncate
+# descriptions at different lengths
+DESCRIPTION_WORDS = 60
+TITLE_WEIGHT = 3
+COMPANY_WEIGHT = 2
+# Share of title words (Jaccard) two jobs need before their fingerprints
+# are compared: one company's roles often share an intro paragraph, which
+# outweighs the title in the fingerprint
+TITLE_MIN_SIMILARITY = 0.5
+# Fingerprints are split into max_distance + 1 bands of at least 4 bits
+MAX_DISTANCE_LIMIT = 15
+
+
+def _words(text):
+    return WORD_RE.findall((text or "").lower())
+
+
+def normalize_title(title):
+    """
+    Title words without seniority and contract words, for the fingerprint.
+    """
+    return " ".join(w for w in _words(title) if w not in TITLE_NOISE and w not in SENIORITY_LEVELS)
+
+
+def title_key(title):
+    """
+    Title words for the exact-duplicate key: contract words are dropped,
+    seniority words are kept ("Sr." is spelled out as "senior").
+    """
+    return " ".join(SENIORITY_LEVELS.get(w, w) for w in _words(title) if w not in TITLE_NOISE)
+
+
+def seniority(title):
+    return frozenset(SENIORITY_LEVELS[w] for w in _words(title) if w in SENIORITY_LEVELS)
+
+
+def normalize_company(company):
+    return " ".join(w for w in _words(company) if w not in COMPANY_NOISE)
+
+
+def _company_name(job):
+    company = job.get('company')
+    if isinstance(company, dict):
+        return company.get('display_name', '')
+    return company or ''
+
+
+# Words and shingles recur across postings, so their hashes are memoized
+@lru_cache(maxsize=65536)
+def _hash64(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'big')
+
+
+def simhash(weighted_features):
+    """
+    64-bit SimHash of (feature, weight) pairs. Similar feature sets give
+    fingerprints that differ in few bits.
+
+    Per-bit vote counts are kept as a bit-sliced binary counter (one 64-bit
+    int per counter bit), so adding a feature hash and taking the majority
+    cost a handful of integer operations instead of loops over 64 bits.
+    """
+    slices = []
+    total = 0
+    for feature, weight in weighted_features:
+        h = _hash64(feature)
+        total += weight
+        for _ in range(weight):
+            carry = h
+            for i, counter in enumerate(slices):
+                slices[i] = counter ^ carry
+                carry &= counter
+                if not carry:
+                    break
+            if carry:
+                slices.append(carry)
+
+    # A bit is set where its vote count exceeds half the total weight:
+    # bit-sliced "count > threshold" comparison, most significant bit first
+    threshold = total // 2
+    greater = 0
+    equal = (1 << 64) - 1
+    for i in range(max(len(slices), threshold.bit_length()) - 1, -1, -1):
+        counter = slices[i] if i < len(slices) else 0
+        if threshold >> i & 1:
+            equal &= counter
+        else:
+            greater |= equal & counter
+            equal &= ~counter
+    return greater
+
+
+def title_similarity(a, b):
+    """
+    Jaccard similarity of the word sets of two normalized titles.
+    """
+    a, b = set(a.split()), set(b.split())
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def job_fingerprint(job, title=None, company=None):
+    """
+    SimHash over the normalized title and company words and the word
+    bigrams (shingles) of the start of the description.
+    """
+    title = normalize_title(job.get('title')) if title is None else title
+    company = normalize_company(_company_name(job)) if company is None else company
+    features = [(f"t:{w}", TITLE_WEIGHT) for w in title.split()]
+    features += [(f"c:{w}", COMPANY_WEIGHT) for w in company.split()]
+    words = _words(strip_html(job.get('description')))[:DESCRIPTION_WORDS]
+    features += [(f"d:{a} {b}", 1) for a, b in zip(words, words[1:])]
+    return simhash(features)
+
+
+class JobDeduper:
+    """
+    Incremental dedupe_jobs: add() jobs one at a time, as they arrive, and
+    keep those for which it returns True.
+
+    Jobs with the same title (seniority included) and normalized company
+    are duplicates. Other jobs are near-duplicates when their titles are
+    near-identical apart from seniority (TITLE_MIN_SIMILARITY), they do not
+    name different seniority levels, and their SimHash fingerprints differ
+    in at most `max_distance` bits. Fingerprints are split into
+    max_distance + 1 bands and only jobs sharing a band are compared (any
+    pair within the distance must agree on at least one band), so each
+    add() is roughly constant time.
+    """
+
+    def __init__(self, max_distance=8):
+        if not 0 <= max_distance <= MAX_DISTANCE_LIMIT:
+            raise ValueError(f"max_distance must be between 0 and {MAX_DISTANCE_LIMIT}, got {max_distance}")
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = 64 // self.bands
+        self.band_mask = (1 << self.band_bits) - 1
+        self.seen_keys = set()
+        self.buckets = {}
+        self.kept_fingerprints = []
+        self.kept_titles = []
+        self.kept_levels = []
+
+    def _is_near_duplicate(self, index, fingerprint, title, levels):
+        kept_levels = self.kept_levels[index]
+        return (bin(fingerprint ^ self.kept_fingerprints[index]).count('1') <= self.max_distance
+                and (not levels or not kept_levels or levels == kept_levels)
+                and title_similarity(title, self.kept_titles[index]) >= TITLE_MIN_SIMILARITY)
+
+    def add(self, job):
+        """
+        Returns True and remembers the job unless it duplicates one kept
+        before.
+        """
+        company = normalize_company(_company_name(job))
+        key = (title_key(job.get('title')), company)
+        if key in self.seen_keys:
+            return False
+
+        title = normalize_title(job.get('title'))
+        levels = seniority(job.get('title'))
+        fingerprint = job_fingerprint(job, title, company)
+        band_keys = [(band, fingerprint >> (band * self.band_bits) & self.band_mask) for band in range(self.bands)]
+        candidates = set()
+        for band_key in band_keys:
+            candidates.update(self.buckets.get(band_key, ()))
+        if any(self._is_near_duplicate(i, fingerprint, title, levels) for i in candidates):
+            return False
+
+        self.seen_keys.add(key)
+        index = len(self.kept_fingerprints)
+        self.kept_fingerprints.append(fingerprint)
+        self.kept_titles.append(title)
+        self.kept_levels.append(levels)
+        for band_key in band_keys:
+            self.buckets.setdefault(band_key, []).append(index)
+        return True
+
+
+def dedupe_jobs(jobs, max_distance=8):
+    """
+    Removes duplicate and near-duplicate jobs, keeping the first occurrence
+    (see JobDeduper).
+    """
+    deduper = JobDeduper(max_distance)
+    return [job for job in jobs if deduper.add(job)]
@@ -0,0 +1,78 @@
+import googletrans
+import httpx
+from googletrans import Translator, urls
+from googletrans.client import RPC_ID
+from googletrans.constants import LANGCODES, LANGUAGES, SPECIAL_CASES
+
+# The googletrans release whose private request helpers and batchexecute
+# parameters this module reuses. With any other release atranslate() is not
+# offered (async_supported) and the async views use the translation pool.
+SUPPORTED_GOOGLETRANS_VERSION = '4.0.0-rc.1'
+
+# Query parameters of googletrans' batchexecute request (googletrans.Translator._translate)
+RPC_PARAMS = {
+    'rpcids': RPC_ID,
+    'bl': 'boq_translate-webserver_20201207.13_p0',
+    'soc-app': 1,
+    'soc-platform': 1,
+    'soc-device': 1,
+    'rt': 'c',
+}
+
+
+def _hooks_available():
+    return (getattr(googletrans, '__version__', None) == SUPPORTED_GOOGLETRANS_VERSION
+            and all(hasattr(Translator, name) for name in ('_translate', '_build_rpc_request', '_pick_service_url')))
+
+
+def _language(code):
+    code = code.lower().split('_', 1)[0]
+    if code in LANGUAGES or code == 'auto':
+        return code
+    if code in SPECIAL_CASES:
+        return SPECIAL_CASES[code]
+    if code in LANGCODES:
+        return LANGCODES[code]
+    raise ValueError(f"invalid language: {code}")
+
+
+class GoogleTranslator(Translator):
+    """
+    googletrans.Translator with a non-blocking atranslate() for the async
+    views, opt-in with TRANSLATOR_CLASS = 'core.google_translate.GoogleTranslator'.
+    The request goes through an httpx.AsyncClient and the response is
+    parsed by googletrans itself, so both methods give the same result.
+    This relies on googletrans internals, so it is only used with the
+    release it was written for (async_supported).
+    """
+
+    async_supported = _hooks_available()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._async_client = None
+        self._prefetched = None
+
+    def _translate(self, text, dest, src):
+        if self._prefetched is not None:
+            return self._prefetched
+        return super()._translate(text, dest, src)
+
+    async def atranslate(self, text, dest='en', src='auto'):
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(headers=dict(self.client.headers), timeout=self.client.timeout)
+        dest = _language(dest)
+        src = _language(src)
+        response = await self._async_client.post(
+            urls.TRANSLATE_RPC.format(host=self._pick_service_url()), params=RPC_PARAMS,
+            data={'f.req': self._build_rpc_request(text, dest, src)})
+        if response.status_code != 200:
+            raise Exception(f'Unexpected status code "{response.status_code}" from {self.service_urls}')
+
+        # translate() runs to completion without yielding to the event
+        # loop, so no other coroutine can see the prefetched response
+        self._prefetched = (response.text, response)
+        try:
+            return self.translate(text, dest, src)
+        finally:
+            self._prefetched = None
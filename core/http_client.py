@@ -0,0 +1,402 @@
+import asyncio
+import random
+import threading
+import time
+import weakref
+from collections import deque
+
+import httpcore
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+# Responses worth retrying: throttling and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised without a request while a provider's circuit breaker is open."""
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised without a request when the caller's deadline has passed."""
+
+
+# Errors of AsyncProviderClient.get. httpx before 0.14 raises httpcore's
+# transport errors, which are not httpx.HTTPErrors
+ASYNC_HTTP_ERRORS = (CircuitOpenError, DeadlineExceeded, httpx.HTTPError, httpcore.TimeoutException,
+                     httpcore.NetworkError, httpcore.ProtocolError)
+ASYNC_RETRYABLE_ERRORS = (httpcore.TimeoutException, httpcore.NetworkError)
+
+
+def _cap_timeout(timeout, remaining):
+    """
+    A request timeout (seconds or a (connect, read) tuple) lowered to the
+    remaining seconds of the caller's deadline.
+    """
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    if timeout is None or isinstance(timeout, (int, float)):
+        return remaining if timeout is None else min(timeout, remaining)
+    return timeout
+
+
+class CircuitBreaker:
+    """
+    Classic three-state breaker. After `failure_threshold` consecutive
+    failures the circuit opens and calls fail fast for `reset_timeout`
+    seconds; then one trial call is let through (half-open) and its outcome
+    closes or re-opens the circuit. A trial whose outcome is never recorded
+    is abandoned after `half_open_timeout` seconds and another one is let
+    through.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, half_open_timeout=None):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_timeout = half_open_timeout or reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0
+        self.trial_started_at = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self.trial_started_at = time.monotonic()
+                return True
+            if self.state == self.HALF_OPEN:
+                # Only the single trial request is allowed through
+                if time.monotonic() - self.trial_started_at < self.half_open_timeout:
+                    return False
+                self.trial_started_at = time.monotonic()
+                return True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class ProviderClient:
+    """
+    HTTP client for one job provider: a keep-alive connection pool, bounded
+    retries with jittered exponential backoff, a circuit breaker and
+    latency/error statistics.
+    """
+
+    def __init__(self, name, retries=2, backoff=0.2, pool_size=10,
+                 failure_threshold=5, reset_timeout=30, half_open_timeout=None):
+        self.name = name
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout, half_open_timeout)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.requests = 0
+        self.errors = 0
+        self.retried = 0
+        self.rejected = 0
+        self.latencies = deque(maxlen=500)
+        self._stats_lock = threading.Lock()
+
+    def _backoff_delay(self, attempt):
+        # Full jitter: anywhere between 0 and the exponential backoff
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    def check_deadline(self, deadline):
+        """
+        Raises DeadlineExceeded once the deadline (a time.monotonic()
+        value, or None for no deadline) has passed.
+        """
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceeded(f"{self.name} deadline passed")
+
+    def retry_delay(self, attempt, deadline):
+        """
+        Backoff before the given retry, or None when no retries are left
+        or the deadline would pass before the retry could start.
+        """
+        if attempt > self.retries:
+            return None
+        delay = self._backoff_delay(attempt)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    def check_circuit(self):
+        """
+        Raises CircuitOpenError while the provider is considered down.
+        """
+        if not self.breaker.allow_request():
+            with self._stats_lock:
+                self.rejected += 1
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+    def record_attempt(self, elapsed, failed):
+        with self._stats_lock:
+            self.requests += 1
+            self.latencies.append(elapsed)
+            if failed:
+                self.errors += 1
+
+    def record_retry(self):
+        with self._stats_lock:
+            self.retried += 1
+
+    def record_outcome(self, failed):
+        if failed:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def get(self, url, deadline=None, **kwargs):
+        """
+        Same interface as requests.get. Raises CircuitOpenError without
+        sending anything while the provider is considered down.
+        With a deadline (time.monotonic() value), each attempt's timeout is
+        capped by the time left and no retry starts after it.
+        """
+        self.check_deadline(deadline)
+        self.check_circuit()
+
+        # Calls that end without an outcome (cancelled, interrupted) count
+        # as failures, so a half-open trial always closes or re-opens
+        failed = True
+        try:
+            attempt = 0
+            while True:
+                started = time.monotonic()
+                if deadline is not None:
+                    kwargs['timeout'] = _cap_timeout(kwargs.get('timeout'), max(deadline - started, 0.001))
+                try:
+                    response = self.session.get(url, **kwargs)
+                    error = None
+                except requests.RequestException as e:
+                    response = None
+                    error = e
+                elapsed = time.monotonic() - started
+
+                attempt_failed = error is not None or response.status_code >= 500
+                self.record_attempt(elapsed, attempt_failed)
+
+                if error is not None:
+                    retryable = isinstance(error, (requests.ConnectionError, requests.Timeout))
+                else:
+                    retryable = response.status_code in RETRY_STATUSES
+                delay = self.retry_delay(attempt + 1, deadline) if retryable else None
+                if delay is not None:
+                    attempt += 1
+                    self.record_retry()
+                    time.sleep(delay)
+                    continue
+
+                failed = attempt_failed
+                if error is not None:
+                    raise error
+                return response
+        finally:
+            self.record_outcome(failed)
+
+    def stats(self):
+        with self._stats_lock:
+            latencies = sorted(self.latencies)
+            requests_count = self.requests
+            errors = self.errors
+            retried = self.retried
+            rejected = self.rejected
+
+        def percentile(p):
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 1)
+
+        return {
+            'circuit': self.breaker.state,
+            'requests': requests_count,
+            'errors': errors,
+            'retries': retried,
+            'rejected': rejected,
+            'error_rate': round(errors / requests_count, 4) if requests_count else 0.0,
+            'latency_ms': {
+                'avg': round(sum(latencies) / len(latencies) * 1000, 1) if latencies else 0.0,
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'max': round(latencies[-1] * 1000, 1) if latencies else 0.0,
+            },
+        }
+
+
+class AsyncProviderClient:
+    """
+    Non-blocking counterpart of ProviderClient for async views, on an
+    httpx.AsyncClient: same interface (awaited), retries and backoff. It
+    shares the provider's circuit breaker and statistics with the sync
+    client, so both code paths trip one breaker and report together.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        # Keep-alive connections are bounded like the sync pool, but not
+        # concurrent requests: waiting on many of them is the point
+        if hasattr(httpx, 'Limits'):
+            limits = {'limits': httpx.Limits(max_keepalive_connections=client.pool_size, max_connections=None)}
+        else:
+            limits = {'pool_limits': httpx.PoolLimits(max_keepalive=client.pool_size, max_connections=None)}
+        self.session = httpx.AsyncClient(**limits)
+
+    async def aclose(self):
+        await self.session.aclose()
+
+    async def get(self, url, deadline=None, **kwargs):
+        """
+        Same interface as httpx.AsyncClient.get. Raises CircuitOpenError
+        without sending anything while the provider is considered down.
+        Deadlines work like in ProviderClient.get.
+        """
+        client = self.client
+        client.check_deadline(deadline)
+        client.check_circuit()
+
+        # A task cancelled at its deadline counts as a failure, like in
+        # ProviderClient.get
+        failed = True
+        try:
+            attempt = 0
+            while True:
+                started = time.monotonic()
+                if deadline is not None:
+                    kwargs['timeout'] = _cap_timeout(kwargs.get('timeout'), max(deadline - started, 0.001))
+                try:
+                    response = await self.session.get(url, **kwargs)
+                    error = None
+                except ASYNC_HTTP_ERRORS as e:
+                    response = None
+                    error = e
+                elapsed = time.monotonic() - started
+
+                attempt_failed = error is not None or response.status_code >= 500
+                client.record_attempt(elapsed, attempt_failed)
+
+                if error is not None:
+                    retryable = isinstance(error, ASYNC_RETRYABLE_ERRORS)
+                else:
+                    retryable = response.status_code in RETRY_STATUSES
+                delay = client.retry_delay(attempt + 1, deadline) if retryable else None
+                if delay is not None:
+                    attempt += 1
+                    client.record_retry()
+                    await asyncio.sleep(delay)
+                    continue
+
+                failed = attempt_failed
+                if error is not None:
+                    raise error
+                return response
+        finally:
+            client.record_outcome(failed)
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+# Per event loop objects: httpx async clients must stay on the loop they
+# were first used on
+_loop_objects = weakref.WeakKeyDictionary()
+_loop_closers = weakref.WeakKeyDictionary()
+
+
+def get_provider_client(name):
+    """
+    Returns the shared client for a provider, created on first use from
+    JOB_PROVIDER_CLIENT settings (per-provider overrides of 'default').
+    """
+    client = _clients.get(name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(name)
+            if client is None:
+                config = getattr(settings, 'JOB_PROVIDER_CLIENT', {})
+                options = dict(config.get('default', {}), **config.get(name, {}))
+                client = _clients[name] = ProviderClient(name, **options)
+    return client
+
+
+async def _close_at_shutdown(objects):
+    """
+    Suspended for the life of its event loop. asyncio.run() (and so
+    asgiref and the ASGI servers) closes the loop's async generators before
+    the loop itself, which runs the finally block on the loop: the objects
+    with an aclose() method, such as httpx clients, close their connections
+    there instead of leaking them with the loop.
+    """
+    try:
+        yield
+    finally:
+        # The generator refers to its loop, so its entries would keep the
+        # loop alive
+        loop = asyncio.get_running_loop()
+        with _clients_lock:
+            _loop_objects.pop(loop, None)
+            _loop_closers.pop(loop, None)
+        for obj in list(objects.values()):
+            if hasattr(obj, 'aclose'):
+                await obj.aclose()
+
+
+def get_loop_object(key, factory):
+    """
+    Returns the object stored under key for the running event loop,
+    created with factory() on first use. Under ASGI every worker has one
+    loop, so this is a per-worker singleton. Objects with an aclose()
+    method are closed when the loop shuts down.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        objects = _loop_objects.get(loop)
+        if objects is None:
+            objects = _loop_objects[loop] = {}
+            closer = _close_at_shutdown(objects)
+            # Run to the yield now, which registers it with the loop. The
+            # loop only holds it weakly, and it has an aclose() of its own,
+            # so it is kept apart from the objects
+            try:
+                closer.asend(None).send(None)
+            except StopIteration:
+                pass
+            _loop_closers[loop] = closer
+    obj = objects.get(key)
+    if obj is None:
+        obj = objects[key] = factory()
+    return obj
+
+
+def get_async_provider_client(name):
+    """
+    Returns the async client for a provider on the running event loop.
+    """
+    return get_loop_object(('provider', name), lambda: AsyncProviderClient(get_provider_client(name)))
+
+
+def provider_client_stats():
+    return {name: client.stats() for name, client in sorted(_clients.items())}
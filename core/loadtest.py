@@ -0,0 +1,118 @@
+import random
+import threading
+import time
+
+import requests
+
+from .benchmarks.corpus import generate_resume, render_pdf
+from .skills import get_skill_taxonomy
+
+
+def summarize_latencies(latencies):
+    latencies = sorted(latencies)
+
+    def percentile(p):
+        if not latencies:
+            return 0.0
+        return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 1)
+
+    return {
+        'p50_ms': percentile(0.50),
+        'p90_ms': percentile(0.90),
+        'p99_ms': percentile(0.99),
+        'max_ms': round(latencies[-1] * 1000, 1) if latencies else 0.0,
+    }
+
+
+class LoadDriver:
+    """
+    Closed-loop load generator against a running instance of the app:
+    `concurrency` threads each send one request after another for
+    `duration` seconds, picking upload or job-search requests by weight.
+
+    Uploads cycle through `upload_variants` distinct synthetic resumes (so
+    the analysis cache hit ratio is controlled) and, with wait_analysis,
+    poll a queued analysis until it is done, timing the whole round trip.
+    Job searches cycle through `skill_sets` distinct skill lists.
+    With async_views, requests go to the async variants of the views
+    (for an ASGI deployment).
+    """
+
+    def __init__(self, base_url, mix=None, upload_variants=200, skill_sets=50,
+                 wait_analysis=False, request_timeout=60, seed=0, async_views=False):
+        self.base_url = base_url.rstrip('/')
+        self.suffix = 'async/' if async_views else ''
+        self.mix = mix or {'upload': 1, 'jobs': 4}
+        self.wait_analysis = wait_analysis
+        self.request_timeout = request_timeout
+        self.rng = random.Random(seed)
+
+        self.pdfs = [render_pdf(generate_resume('typical', seed=f"load-{i}"))
+                     for i in range(upload_variants if self.mix.get('upload') else 0)]
+        skills = list(get_skill_taxonomy().skills)
+        self.skill_sets = [self.rng.sample(skills, self.rng.randint(3, 8)) for _ in range(skill_sets)]
+
+    def upload(self, session, rng):
+        pdf = rng.choice(self.pdfs)
+        response = session.post(f"{self.base_url}/core/upload/{self.suffix}", files={'resume': ('resume.pdf', pdf, 'application/pdf')},
+                                timeout=self.request_timeout)
+        if response.status_code == 202 and self.wait_analysis:
+            status_url = f"{self.base_url}{response.json()['status_url']}"
+            while True:
+                time.sleep(0.2)
+                response = session.get(status_url, timeout=self.request_timeout)
+                if response.status_code != 200 or response.json().get('status') in ('done', 'failed'):
+                    break
+        return response.ok and response.json().get('success', False)
+
+    def jobs(self, session, rng):
+        response = session.post(f"{self.base_url}/core/jobs/{self.suffix}", json={'skills': rng.choice(self.skill_sets)},
+                                timeout=self.request_timeout)
+        return response.ok and response.json().get('success', False)
+
+    def run(self, concurrency, duration):
+        """
+        Runs one load step and returns {'total': stats, scenario: stats}.
+        """
+        scenarios = [name for name, weight in self.mix.items() if weight > 0]
+        weights = [self.mix[name] for name in scenarios]
+        samples = []
+        samples_lock = threading.Lock()
+        deadline = time.monotonic() + duration
+
+        def worker(worker_seed):
+            rng = random.Random(worker_seed)
+            session = requests.Session()
+            local = []
+            while time.monotonic() < deadline:
+                scenario = rng.choices(scenarios, weights)[0]
+                started = time.perf_counter()
+                try:
+                    ok = getattr(self, scenario)(session, rng)
+                except (requests.RequestException, ValueError):
+                    ok = False
+                local.append((scenario, time.perf_counter() - started, ok))
+            session.close()
+            with samples_lock:
+                samples.extend(local)
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=worker, args=(self.rng.random(),)) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        report = {}
+        for name in ['total'] + scenarios:
+            selected = [s for s in samples if name == 'total' or s[0] == name]
+            errors = sum(1 for s in selected if not s[2])
+            report[name] = dict(
+                requests=len(selected),
+                errors=errors,
+                error_rate=round(errors / len(selected), 4) if selected else 0.0,
+                rps=round(len(selected) / elapsed, 1),
+                **summarize_latencies([s[1] for s in selected]),
+            )
+        return report
@@ -0,0 +1,151 @@
+import json
+import os
+import time
+from multiprocessing import Pool
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.analysis import analyze_text, get_analysis_version, hash_file, store_analysis
+from core.models import ResumeAnalysis
+from core.utils import extract_text_from_pdf
+
+
+def _init_worker():
+    # Pool processes that are spawned rather than forked (Windows, macOS)
+    # start without Django configured
+    import django
+    django.setup()
+
+
+def _analyze_file(item):
+    """
+    Pool task: extract_text_from_pdf -> extract_skills -> calculate_ats_score
+    for one file. Only the path goes in and a small dict comes out, so
+    inter-process traffic stays negligible next to the PDF parsing.
+    """
+    name, path, content_hash = item
+    started = time.perf_counter()
+    try:
+        text = extract_text_from_pdf(path)
+        analysis = analyze_text(text)
+        error = None
+    except Exception as e:
+        text = ''
+        analysis = None
+        error = str(e)
+    return {
+        'file': name,
+        'content_hash': content_hash,
+        'chars': len(text),
+        'analysis': analysis,
+        'error': error,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+class Command(BaseCommand):
+    help = ("Analyzes every PDF resume in a directory (skills and ATS score) across a process pool, "
+            "streaming results to a JSONL file and/or the analysis cache table. "
+            "Re-running the same command skips files that are already done.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory', help="Directory searched recursively for *.pdf files.")
+        parser.add_argument('--output', help="JSONL file to append one result per line to.")
+        parser.add_argument('--db', action='store_true',
+                            help="Store analyses in the ResumeAnalysis table (same cache as uploads).")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="Number of worker processes (default: CPU count).")
+        parser.add_argument('--chunksize', type=int, default=1,
+                            help="Files handed to a worker at a time; raise it for many small files.")
+        parser.add_argument('--progress-every', type=int, default=100,
+                            help="Print throughput after every N files.")
+
+    def handle(self, *args, **options):
+        directory = options['directory']
+        output = options['output']
+        if not os.path.isdir(directory):
+            raise CommandError(f"{directory} is not a directory.")
+        if not output and not options['db']:
+            raise CommandError("Pass --output FILE, --db or both.")
+
+        files = []
+        for root, _, names in os.walk(directory):
+            for filename in names:
+                if filename.lower().endswith('.pdf'):
+                    path = os.path.join(root, filename)
+                    files.append((os.path.relpath(path, directory), path))
+        files.sort()
+
+        # Resume: skip files already in the JSONL output and, with --db,
+        # files whose content already has an analysis of the current version
+        done = self.load_done_files(output) if output else set()
+        items = [(name, path, hash_file(path)) for name, path in files if name not in done]
+        stored = set()
+        if options['db']:
+            stored = set(ResumeAnalysis.objects.filter(
+                content_hash__in={content_hash for _, _, content_hash in items},
+                version=get_analysis_version(),
+            ).values_list('content_hash', flat=True))
+            if not output:
+                # Without a JSONL file the table itself records progress
+                items = [item for item in items if item[2] not in stored]
+
+        skipped = len(files) - len(items)
+        self.stdout.write(f"{len(files)} PDF files, {skipped} already analyzed, {len(items)} to go "
+                          f"with {options['workers']} workers")
+        if not items:
+            return
+
+        out = None
+        if output:
+            out = open(output, 'a', encoding='utf-8')
+            if out.tell() and not self.ends_with_newline(output):
+                out.write('\n')
+        processed = failed = 0
+        started = time.perf_counter()
+        try:
+            with Pool(options['workers'], initializer=_init_worker) as pool:
+                for result in pool.imap_unordered(_analyze_file, items, chunksize=options['chunksize']):
+                    processed += 1
+                    if result['error']:
+                        failed += 1
+                        self.stderr.write(f"{result['file']}: {result['error']}")
+                    elif options['db'] and result['chars'] and result['content_hash'] not in stored:
+                        store_analysis(result['content_hash'], result['analysis'])
+                        stored.add(result['content_hash'])
+                    if out:
+                        out.write(json.dumps(result) + '\n')
+                        out.flush()
+                    if processed % options['progress_every'] == 0:
+                        self.report(processed, len(items), failed, started)
+        except KeyboardInterrupt:
+            self.stdout.write("Interrupted; run the same command again to continue.")
+        finally:
+            if out:
+                out.close()
+        self.report(processed, len(items), failed, started)
+
+    def load_done_files(self, output):
+        done = set()
+        if not os.path.exists(output):
+            return done
+        with open(output, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    # Partial last line from an interrupted run
+                    continue
+                if not result.get('error'):
+                    done.add(result['file'])
+        return done
+
+    def ends_with_newline(self, path):
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def report(self, processed, total, failed, started):
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed else 0.0
+        self.stdout.write(f"{processed}/{total} files ({failed} failed) in {elapsed:.1f}s: {rate:.1f} files/s")
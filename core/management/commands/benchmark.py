@@ -0,0 +1,80 @@
+import os
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarks.concurrency import SCENARIOS, run_concurrency_benchmarks
+from core.benchmarks.corpus import CORPUS_KINDS
+from core.benchmarks.runner import compare, load_baseline, run_benchmarks, save_baseline
+from core.benchmarks.saved_jobs import run_saved_job_benchmarks
+
+
+class Command(BaseCommand):
+    help = ("Benchmarks skill extraction, ATS scoring, summary generation and PDF text extraction "
+            "on a synthetic resume corpus (--suite analysis), per-item versus bulk saving of jobs "
+            "against the database (--suite saved_jobs), or the concurrent job searches and "
+            "translations one WSGI or ASGI worker sustains against simulated providers "
+            "(--suite concurrency), and optionally checks for regressions against a baseline.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--suite', choices=['analysis', 'saved_jobs', 'concurrency'], default='analysis')
+        parser.add_argument('--kind', action='append', choices=CORPUS_KINDS,
+                            help="Corpus kind to run (repeatable; default: all).")
+        parser.add_argument('--filter', help="Only run benchmarks whose name contains this text.")
+        parser.add_argument('--min-time', type=float, default=0.5,
+                            help="Minimum seconds spent measuring each benchmark.")
+        parser.add_argument('--clients', default='10,100,300',
+                            help="Concurrent clients per run of --suite concurrency (comma-separated).")
+        parser.add_argument('--wsgi-threads', default='1,8',
+                            help="Request threads of the WSGI worker in --suite concurrency (comma-separated).")
+        parser.add_argument('--seconds', type=float, default=5.0, help="Seconds per --suite concurrency run.")
+        parser.add_argument('--provider-latency-ms', type=float, default=200,
+                            help="Simulated provider and translator latency in --suite concurrency.")
+        parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                            help="--suite concurrency scenario to run (repeatable; default: all).")
+        parser.add_argument('--save', metavar='FILE', help="Store the results as a baseline JSON file.")
+        parser.add_argument('--compare', metavar='FILE', help="Baseline JSON file to compare against.")
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help="Allowed slowdown of the median before --compare fails (0.2 = 20%%).")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'benchmark':<48} {'ops/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+
+        def progress(name, summary):
+            line = (f"{name:<48} {summary['ops_per_sec']:>10} {summary['p50_ms']:>10} "
+                    f"{summary['p95_ms']:>10} {summary['p99_ms']:>10}")
+            if summary.get('errors'):
+                line += f" ({summary['errors']} failed)"
+            self.stdout.write(line)
+
+        if options['suite'] == 'saved_jobs':
+            results = run_saved_job_benchmarks(progress=progress)
+        elif options['suite'] == 'concurrency':
+            try:
+                clients = [int(count) for count in options['clients'].split(',')]
+                wsgi_threads = [int(count) for count in options['wsgi_threads'].split(',')]
+            except ValueError:
+                raise CommandError("Invalid --clients or --wsgi-threads.")
+            self.stdout.write("(ops/s is throughput; percentiles are request latencies)")
+            results = run_concurrency_benchmarks(clients, wsgi_threads, options['seconds'],
+                                                 options['provider_latency_ms'],
+                                                 options['scenario'] or list(SCENARIOS), progress)
+        else:
+            with tempfile.TemporaryDirectory() as directory:
+                results = run_benchmarks(directory, options['kind'], options['filter'],
+                                         options['min_time'], progress)
+
+        if options['save']:
+            save_baseline(options['save'], results)
+            self.stdout.write(f"Saved baseline to {options['save']}")
+
+        if options['compare']:
+            if not os.path.exists(options['compare']):
+                raise CommandError(f"Baseline {options['compare']} does not exist.")
+            regressions = compare(results, load_baseline(options['compare']), options['threshold'])
+            for name, base_ms, current_ms, change in regressions:
+                self.stderr.write(f"REGRESSION {name}: p50 {base_ms} ms -> {current_ms} ms (+{change:.0%})")
+            if regressions:
+                raise CommandError(f"{len(regressions)} benchmarks regressed by more than "
+                                   f"{options['threshold']:.0%}.")
+            self.stdout.write(f"No regressions above {options['threshold']:.0%}.")
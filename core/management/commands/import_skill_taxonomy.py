@@ -0,0 +1,47 @@
+import json
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.skills import DEFAULT_TAXONOMY_PATH, SkillTaxonomy, import_taxonomy_csv, save_taxonomy
+
+
+class Command(BaseCommand):
+    help = ("Builds a skill taxonomy file from an external taxonomy CSV export, merged with the bundled "
+            "seed taxonomy. Defaults read ESCO's skills_en.csv (https://esco.ec.europa.eu/en/use-esco/download); "
+            "set SKILL_TAXONOMY_PATH to the output file to use it.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help="CSV export of the taxonomy.")
+        parser.add_argument('--output', default=str(settings.BASE_DIR / 'data' / 'skills.json'),
+                            help="Taxonomy JSON file to write (default data/skills.json).")
+        parser.add_argument('--label-column', default='preferredLabel')
+        parser.add_argument('--aliases-column', default='altLabels')
+        parser.add_argument('--alias-separator', default='\n',
+                            help="Separator of the aliases in one cell (ESCO: newline).")
+        parser.add_argument('--type-column', default='skillType')
+        parser.add_argument('--type', action='append', default=[], dest='types',
+                            help="Only import rows of this type, e.g. 'knowledge' (repeatable; default all).")
+        parser.add_argument('--max-words', type=int, default=5,
+                            help="Skip labels longer than this; long descriptive labels never occur in resumes.")
+        parser.add_argument('--no-seed', action='store_true',
+                            help="Do not merge the bundled seed taxonomy into the output.")
+
+    def handle(self, *args, **options):
+        if not os.path.exists(options['csv_path']):
+            raise CommandError(f"{options['csv_path']} does not exist.")
+        started = time.monotonic()
+        seed = {} if options['no_seed'] else SkillTaxonomy.from_file(DEFAULT_TAXONOMY_PATH).skills
+        skills = import_taxonomy_csv(
+            options['csv_path'], seed, options['label_column'], options['aliases_column'],
+            options['alias_separator'], options['type_column'], options['types'], options['max_words'])
+
+        os.makedirs(os.path.dirname(os.path.abspath(options['output'])), exist_ok=True)
+        save_taxonomy(skills, options['output'], source=os.path.basename(options['csv_path']))
+        taxonomy = SkillTaxonomy.from_file(options['output'])
+        aliases = sum(len(names) for names in skills.values())
+        self.stdout.write(f"Wrote {len(skills)} skills with {aliases} aliases to {options['output']} "
+                          f"(version {taxonomy.version}, {time.monotonic() - started:.1f}s)")
+        self.stdout.write(f"Set SKILL_TAXONOMY_PATH = {json.dumps(options['output'])} to use it.")
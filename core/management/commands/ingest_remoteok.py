@@ -0,0 +1,46 @@
+import time
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.ranking import IDFStats
+from core.remoteok import fetch_remoteok_feed, get_snapshot_path, normalize_remoteok_job, save_snapshot
+
+
+class Command(BaseCommand):
+    help = "Downloads the RemoteOK feed into the local snapshot used for remote job search and job ranking IDF."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=int, default=0,
+                            help="Keep running and re-ingest every INTERVAL seconds.")
+        parser.add_argument('--timeout', type=int, default=30,
+                            help="HTTP timeout in seconds for the feed download.")
+
+    def handle(self, *args, **options):
+        path = get_snapshot_path()
+        if not path:
+            raise CommandError("REMOTEOK_SNAPSHOT_PATH is not configured.")
+
+        while True:
+            try:
+                started = time.monotonic()
+                jobs = fetch_remoteok_feed(timeout=options['timeout'])
+                save_snapshot(jobs, path)
+                idf_path = getattr(settings, 'JOB_IDF_PATH', None)
+                if idf_path:
+                    # The feed doubles as the corpus for job ranking IDF weights
+                    corpus = [normalize_remoteok_job(job) for job in jobs]
+                    for job, raw in zip(corpus, jobs):
+                        job['description'] = raw.get('description', '')
+                    IDFStats.from_jobs(corpus).save(str(idf_path))
+                elapsed = time.monotonic() - started
+                self.stdout.write(f"Stored {len(jobs)} RemoteOK jobs in {path} ({elapsed:.1f}s)")
+            except requests.RequestException as e:
+                if not options['interval']:
+                    raise CommandError(f"RemoteOK API Error: {e}")
+                self.stderr.write(f"RemoteOK API Error: {e}")
+
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.loadtest import LoadDriver
+
+
+class Command(BaseCommand):
+    help = ("Drives concurrent upload and job-search traffic against a running instance of the app "
+            "and reports throughput, latency percentiles and error rate per concurrency level. "
+            "Combine with `simulate_providers` to test without the real job APIs.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help="Base URL of the app.")
+        parser.add_argument('--concurrency', default='10',
+                            help="Concurrent clients, or a comma-separated ramp such as 1,5,10,20,50.")
+        parser.add_argument('--duration', type=float, default=30, help="Seconds per concurrency level.")
+        parser.add_argument('--mix', default='upload=1,jobs=4',
+                            help="Request weights, e.g. upload=1,jobs=4 or jobs=1.")
+        parser.add_argument('--upload-variants', type=int, default=200,
+                            help="Distinct resumes uploaded (fewer means more analysis cache hits).")
+        parser.add_argument('--skill-sets', type=int, default=50,
+                            help="Distinct job-search skill lists (fewer means more job cache hits).")
+        parser.add_argument('--wait-analysis', action='store_true',
+                            help="Poll queued uploads until analyzed and time the whole round trip.")
+        parser.add_argument('--timeout', type=float, default=60, help="Per-request timeout in seconds.")
+        parser.add_argument('--async', dest='async_views', action='store_true',
+                            help="Use the async views (/core/upload/async/, /core/jobs/async/) of an ASGI server.")
+
+    def handle(self, *args, **options):
+        try:
+            levels = [int(level) for level in options['concurrency'].split(',')]
+            mix = {}
+            for part in options['mix'].split(','):
+                name, _, weight = part.partition('=')
+                mix[name.strip()] = float(weight or 1)
+        except ValueError:
+            raise CommandError("Invalid --concurrency or --mix.")
+        unknown = set(mix) - {'upload', 'jobs'}
+        if unknown:
+            raise CommandError(f"Unknown request types in --mix: {', '.join(sorted(unknown))}")
+
+        driver = LoadDriver(options['url'], mix, options['upload_variants'], options['skill_sets'],
+                            options['wait_analysis'], options['timeout'], async_views=options['async_views'])
+        self.stdout.write(f"{'clients':>7} {'type':<7} {'requests':>8} {'rps':>8} {'errors':>7} "
+                          f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for concurrency in levels:
+            report = driver.run(concurrency, options['duration'])
+            for name, stats in report.items():
+                self.stdout.write(
+                    f"{concurrency:>7} {name:<7} {stats['requests']:>8} {stats['rps']:>8} "
+                    f"{stats['error_rate']:>7.1%} {stats['p50_ms']:>8} {stats['p90_ms']:>8} "
+                    f"{stats['p99_ms']:>8} {stats['max_ms']:>8}"
+                )
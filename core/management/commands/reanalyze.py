@@ -0,0 +1,97 @@
+import os
+import time
+from multiprocessing import Pool
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core.analysis import get_analysis_version, purge_stale_analyses, reanalyze_profiles, stale_profiles
+from core.models import UserProfile
+
+
+def _init_worker():
+    # Pool processes that are spawned rather than forked (Windows, macOS)
+    # start without Django configured
+    import django
+    django.setup()
+
+
+def _reanalyze_batch(item):
+    """
+    Pool task: re-analyzes one batch of profiles and writes the results
+    from the worker, so only ids and counts cross process boundaries.
+    """
+    profile_ids, pdf_fallback = item
+    started = time.perf_counter()
+    try:
+        counts = reanalyze_profiles(profile_ids, pdf_fallback)
+        error = None
+    except Exception as e:
+        counts = {}
+        error = str(e)
+    return {
+        'profiles': len(profile_ids),
+        'counts': counts,
+        'error': error,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+class Command(BaseCommand):
+    help = ("Recomputes skills and ATS scores of profiles analyzed with other ATS rules or another "
+            "skill taxonomy, from their stored resume text, in parallel batches. Profiles from before "
+            "texts were stored have their PDF parsed once. Re-running continues where it stopped. "
+            "Cached analyses of other versions are deleted at the end.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help="Re-analyze every profile, not only the stale ones.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="Number of worker processes (default: CPU count).")
+        parser.add_argument('--batch-size', type=int, default=200,
+                            help="Profiles per batch; each batch is written in one transaction.")
+        parser.add_argument('--no-pdf', action='store_true',
+                            help="Skip profiles without stored text instead of parsing their PDF.")
+
+    def handle(self, *args, **options):
+        profiles = UserProfile.objects.all() if options['all'] else stale_profiles()
+        profile_ids = list(profiles.order_by('id').values_list('id', flat=True))
+        size = options['batch_size']
+        batches = [(profile_ids[i:i + size], not options['no_pdf']) for i in range(0, len(profile_ids), size)]
+        self.stdout.write(f"{len(profile_ids)} profiles to re-analyze for version {get_analysis_version()} "
+                          f"in {len(batches)} batches with {options['workers']} workers")
+        if not batches:
+            self.purge()
+            return
+
+        # Forked workers must not share the parent's database connection
+        connections.close_all()
+        totals = {'text': 0, 'pdf': 0, 'missing': 0}
+        processed = failed = 0
+        started = time.perf_counter()
+        try:
+            with Pool(options['workers'], initializer=_init_worker) as pool:
+                for result in pool.imap_unordered(_reanalyze_batch, batches):
+                    processed += result['profiles']
+                    if result['error']:
+                        failed += result['profiles']
+                        self.stderr.write(f"Batch of {result['profiles']} failed: {result['error']}")
+                    for source, count in result['counts'].items():
+                        totals[source] += count
+                    self.report(processed, len(profile_ids), totals, failed, started)
+        except KeyboardInterrupt:
+            self.stdout.write("Interrupted; run the same command again to continue.")
+            return
+        self.purge()
+
+    def purge(self):
+        deleted = purge_stale_analyses()
+        if deleted:
+            self.stdout.write(f"Deleted {deleted} cached analyses of other versions")
+
+    def report(self, processed, total, totals, failed, started):
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed else 0.0
+        self.stdout.write(f"{processed}/{total} profiles ({totals['text']} from text, {totals['pdf']} from PDF, "
+                          f"{totals['missing']} without resume, {failed} failed) in {elapsed:.1f}s: "
+                          f"{rate:.0f} profiles/s")
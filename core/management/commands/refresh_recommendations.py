@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.recommendations import refresh_recommendations
+
+
+class Command(BaseCommand):
+    help = ("Scores every profile against the job catalogue and stores each user's top jobs for the "
+            "dashboard. After the first run only changed profiles and jobs are recomputed.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true',
+                            help="Recompute every user instead of only what changed since the last run.")
+        parser.add_argument('--top-k', type=int, help="Recommendations kept per user (default RECOMMENDATIONS_PER_USER).")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Profiles scored per transaction.")
+        parser.add_argument('--interval', type=int, default=0,
+                            help="Keep running and refresh every INTERVAL seconds.")
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.perf_counter()
+            run = refresh_recommendations(options['full'], options['top_k'], options['batch_size'])
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{'Full' if run.full else 'Incremental'} refresh: {run.users_refreshed} users updated, "
+                f"{run.jobs_changed} jobs scored, {run.jobs_removed} expired jobs removed ({elapsed:.1f}s)"
+            )
+            if not options['interval']:
+                break
+            options['full'] = False
+            time.sleep(options['interval'])
@@ -0,0 +1,73 @@
+import threading
+import time
+
+from django.db import DatabaseError, close_old_connections, connection
+from django.core.management.base import BaseCommand
+
+from core.tasks import claim_next_task, default_worker_name, has_pending_tasks, queue_stats, run_task
+
+
+class Command(BaseCommand):
+    help = ("Runs queued resume analyses (uploads) with a pool of worker threads. "
+            "Several instances can run side by side; each task is claimed by one worker.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=2,
+                            help="Number of worker threads.")
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help="Seconds to wait before polling an empty queue again.")
+        parser.add_argument('--once', action='store_true',
+                            help="Exit once no task is pending instead of waiting for new tasks.")
+
+    def handle(self, *args, **options):
+        self.stop = threading.Event()
+        threads = [
+            threading.Thread(target=self.work, args=(options,), name=f"analysis-worker-{i}", daemon=True)
+            for i in range(options['workers'])
+        ]
+        for thread in threads:
+            thread.start()
+        self.stdout.write(f"Started {len(threads)} analysis workers")
+
+        try:
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping after the running tasks finish...")
+            self.stop.set()
+            for thread in threads:
+                thread.join()
+
+        stats = queue_stats()
+        self.stdout.write(
+            f"Queue depth {stats['depth']}, wait p50 {stats['wait_ms']['p50']} ms, "
+            f"processing p50 {stats['processing_ms']['p50']} ms"
+        )
+        close_old_connections()
+
+    def work(self, options):
+        worker_name = default_worker_name()
+        try:
+            while not self.stop.is_set():
+                close_old_connections()
+                try:
+                    task = claim_next_task(worker_name)
+                except DatabaseError as e:
+                    # e.g. SQLite "database is locked" under concurrent writers
+                    self.stderr.write(f"Could not claim a task: {e}")
+                    self.stop.wait(options['poll_interval'])
+                    continue
+                if task is None:
+                    # Tasks waiting out a retry delay still count as queued
+                    if options['once'] and not has_pending_tasks():
+                        break
+                    self.stop.wait(options['poll_interval'])
+                    continue
+                started = time.monotonic()
+                task = run_task(task)
+                elapsed_ms = round((time.monotonic() - started) * 1000)
+                self.stdout.write(f"Task {task.pk}: {task.status} in {elapsed_ms} ms (attempt {task.attempts})")
+        finally:
+            # Every thread has its own database connection
+            connection.close()
@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.simulator import SIMULATED_PROVIDERS, FaultProfile, ProviderSimulator, load_payloads
+
+
+class Command(BaseCommand):
+    help = ("Serves a local simulator of the Adzuna, JSearch and RemoteOK APIs that replays recorded "
+            "payloads with injected latency, errors and timeouts. Start the app with "
+            "JOB_PROVIDER_SIMULATOR_URL=<simulator url> to send job searches to it.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8900)
+        parser.add_argument('--payloads', metavar='DIR',
+                            help="Directory with recorded adzuna.json, jsearch.json and remoteok.json "
+                                 "response bodies (synthetic jobs are used for missing files).")
+        parser.add_argument('--latency-ms', type=float, default=100, help="Added latency per response.")
+        parser.add_argument('--jitter-ms', type=float, default=50, help="Random +/- spread of the latency.")
+        parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of 503 responses.")
+        parser.add_argument('--timeout-rate', type=float, default=0.0,
+                            help="Fraction of requests that stall for --hang-seconds.")
+        parser.add_argument('--hang-seconds', type=float, default=30)
+        parser.add_argument('--fault', action='append', default=[], metavar='PROVIDER:KEY=VALUE,...',
+                            help="Per-provider override, e.g. adzuna:latency_ms=800,error_rate=0.2")
+        parser.add_argument('--seed', type=int, help="Random seed for reproducible fault sequences.")
+
+    def handle(self, *args, **options):
+        default = {
+            'latency_ms': options['latency_ms'],
+            'jitter_ms': options['jitter_ms'],
+            'error_rate': options['error_rate'],
+            'timeout_rate': options['timeout_rate'],
+            'hang_seconds': options['hang_seconds'],
+        }
+        faults = {'default': FaultProfile(**default)}
+        for spec in options['fault']:
+            provider, _, assignments = spec.partition(':')
+            if provider not in SIMULATED_PROVIDERS:
+                raise CommandError(f"Unknown provider in --fault: {provider}")
+            values = dict(default)
+            for assignment in filter(None, assignments.split(',')):
+                key, _, value = assignment.partition('=')
+                if key not in values:
+                    raise CommandError(f"Unknown fault setting: {key}")
+                values[key] = float(value)
+            faults[provider] = FaultProfile(**values)
+
+        payloads = load_payloads(options['payloads'])
+        simulator = ProviderSimulator(payloads, faults, options['host'], options['port'], seed=options['seed'])
+        for provider in SIMULATED_PROVIDERS:
+            self.stdout.write(f"{provider}: {len(payloads[provider])} jobs")
+        self.stdout.write(f"Simulating job providers at {simulator.url}")
+        self.stdout.write(f"Run the app with JOB_PROVIDER_SIMULATOR_URL={simulator.url}")
+        try:
+            simulator.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            simulator.stop()
+            for provider, counts in simulator.counts.items():
+                self.stdout.write(f"{provider}: {counts}")
@@ -0,0 +1,83 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.benchmarks.sqlite_stress import run_write_stress
+
+MODES = {'stock': '0', 'production': '1'}
+
+
+class Command(BaseCommand):
+    help = ("Hammers the profile and saved job write paths from concurrent threads and reports "
+            "writes/s and \"database is locked\" errors. --compare runs the stock and the "
+            "production SQLite setup (SQLITE_PRODUCTION=0/1) on copies of the database.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help="Writer threads per process.")
+        parser.add_argument('--processes', type=int, default=1,
+                            help="Concurrent processes per mode with --compare (like several app workers).")
+        parser.add_argument('--seconds', type=float, default=10.0)
+        parser.add_argument('--compare', action='store_true',
+                            help="Run both modes in subprocesses on copies of the database.")
+        parser.add_argument('--json', action='store_true', help="Print the result as one JSON line.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError("stress_sqlite only runs against a SQLite database.")
+        if options['compare']:
+            self._compare(options)
+            return
+
+        result = run_write_stress(options['threads'], options['seconds'])
+        if options['json']:
+            self.stdout.write(json.dumps(result))
+            return
+        mode = 'production' if settings.SQLITE_PRODUCTION else 'stock'
+        self._report(mode, [result])
+
+    def _compare(self, options):
+        source = settings.DATABASES['default']['NAME']
+        with tempfile.TemporaryDirectory() as directory:
+            for mode, flag in MODES.items():
+                path = os.path.join(directory, f"{mode}.sqlite3")
+                # The backup API gives a consistent copy even while the app is running
+                with sqlite3.connect(str(source)) as src, sqlite3.connect(path) as dst:
+                    src.backup(dst)
+                    if mode == 'stock':
+                        # The copy keeps the source's journal mode; stock SQLite uses a rollback journal
+                        dst.execute("PRAGMA journal_mode = DELETE")
+                env = dict(os.environ, SQLITE_PRODUCTION=flag, SQLITE_PATH=path)
+                command = [sys.executable, str(settings.BASE_DIR / 'manage.py'), 'stress_sqlite', '--json',
+                           '--threads', str(options['threads']), '--seconds', str(options['seconds'])]
+                processes = [subprocess.Popen(command, env=env, stdout=subprocess.PIPE, text=True)
+                             for _ in range(options['processes'])]
+                results = []
+                for process in processes:
+                    output, _ = process.communicate()
+                    if process.returncode != 0:
+                        raise CommandError(f"{mode} stress run failed with exit code {process.returncode}.")
+                    results.append(json.loads(output.strip().splitlines()[-1]))
+                self._report(mode, results)
+
+    def _report(self, mode, results):
+        writes = sum(result['writes'] for result in results)
+        lock_errors = sum(result['lock_errors'] for result in results)
+        other_errors = sum(result['other_errors'] for result in results)
+        writes_per_sec = sum(result['writes_per_sec'] for result in results)
+        threads = sum(result['threads'] for result in results)
+        self.stdout.write(f"{mode:<11} threads={threads:<4} writes={writes:<7} writes/s={writes_per_sec:<8.1f} "
+                          f"lock_errors={lock_errors:<6} other_errors={other_errors}")
+        for result in results:
+            if result['latency']:
+                latency = result['latency']
+                self.stdout.write(f"{'':<11} latency ms p50={latency['p50_ms']} p95={latency['p95_ms']} "
+                                  f"p99={latency['p99_ms']}")
+            for error in result['sample_errors']:
+                self.stdout.write(f"{'':<11} error: {error}")
@@ -0,0 +1,90 @@
+import re
+from functools import lru_cache
+
+# A token is a run of word characters that may carry the punctuation used in
+# skill names ("c++", "c#", "node.js", ".net"). A trailing dot is sentence
+# punctuation, so a token never ends with one.
+TOKEN_PATTERN = r"\.?\w(?:[\w+#.]*[\w+#])?"
+TOKEN_RE = re.compile(TOKEN_PATTERN)
+# Same tokens for pure-ASCII text; explicit classes scan noticeably faster
+# than Unicode \w
+ASCII_TOKEN_RE = re.compile(r"\.?[A-Za-z0-9_](?:[A-Za-z0-9_+#.]*[A-Za-z0-9_+#])?")
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def strip_html(text):
+    return HTML_TAG_RE.sub(' ', text or '')
+
+
+@lru_cache(maxsize=8)
+def tokenize(text):
+    """
+    Splits lowercase text into match tokens.
+    Slashes, hyphens and other punctuation act as separators, so
+    "ci/cd" and "problem-solving" become two tokens each.
+    Results are memoized so extract_skills and the ATS rules share one
+    tokenization of the same resume; callers must not mutate the list.
+    """
+    pattern = ASCII_TOKEN_RE if text.isascii() else TOKEN_RE
+    return pattern.findall(text)
+
+
+class PhraseMatcher:
+    """
+    Token trie that finds many phrases in a single pass over a token list.
+
+    Every phrase is tokenized the same way as the text, so matches always
+    fall on token boundaries ("go" never matches inside "good", "java"
+    never matches inside "javascript"). Each phrase carries a payload that
+    is reported when the phrase is found.
+    """
+
+    END = object()
+
+    def __init__(self):
+        self.root = {}
+        self.phrase_count = 0
+        self.max_length = 0
+
+    def add(self, phrase, payload):
+        tokens = tokenize(phrase.lower())
+        if not tokens:
+            return
+        node = self.root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node.setdefault(self.END, []).append(payload)
+        self.phrase_count += 1
+        self.max_length = max(self.max_length, len(tokens))
+
+    def iter_matches(self, tokens):
+        """
+        Yields (position, payload) for every phrase occurring in tokens,
+        in text order. Cost is bounded by len(tokens) * longest phrase,
+        independent of how many phrases are loaded.
+        """
+        root = self.root
+        end = self.END
+        for start, token in enumerate(tokens):
+            node = root.get(token)
+            position = start
+            while node is not None:
+                payloads = node.get(end)
+                if payloads:
+                    for payload in payloads:
+                        yield start, payload
+                position += 1
+                if position >= len(tokens):
+                    break
+                node = node.get(tokens[position])
+
+    def find_all(self, tokens):
+        """
+        Returns the distinct payloads found in tokens, in order of first
+        appearance.
+        """
+        found = {}
+        for _, payload in self.iter_matches(tokens):
+            if payload not in found:
+                found[payload] = None
+        return list(found)
@@ -0,0 +1,244 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+RESULT_COUNT_BUCKETS = (0, 1, 5, 10, 20, 50, 100, 500)
+
+_registry = []
+
+
+def _format_labels(labelnames, values, extra=None):
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """
+    Base for process-local metrics rendered in the Prometheus text format.
+    Label values are passed as keyword arguments in labelnames order.
+    """
+
+    kind = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_value(key, value))
+        return lines
+
+    def _render_value(self, key, value):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket (non-cumulative) counts, then sum and count
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _render_value(self, key, value):
+        counts, total, count = value
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + ('+Inf',), counts):
+            cumulative += bucket_count
+            le = bound if bound == '+Inf' else _format_value(float(bound))
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', le))} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(float(total))}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+def render_metrics():
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+request_duration = Histogram(
+    'resume_app_request_duration_seconds', "Time spent in instrumented API views.", ['view', 'status'])
+stage_duration = Histogram(
+    'resume_app_stage_duration_seconds', "Time spent in each stage of an instrumented API view.",
+    ['view', 'stage'])
+provider_duration = Histogram(
+    'resume_app_job_provider_duration_seconds', "Job provider query time, including cache hits.",
+    ['provider', 'status', 'cache'])
+provider_results = Histogram(
+    'resume_app_job_provider_results', "Jobs returned per job provider query.", ['provider'],
+    buckets=RESULT_COUNT_BUCKETS)
+analysis_queue_depth = Gauge(
+    'resume_app_analysis_queue_tasks', "Resume analysis tasks by status.", ['status'])
+
+
+def record_provider_result(provider, status):
+    """
+    Records one provider query from aggregate_jobs' status dict.
+    """
+    provider_duration.observe(status['elapsed_ms'] / 1000, provider=provider,
+                              status=status['status'], cache=status.get('cache', 'miss'))
+    provider_results.observe(status['count'], provider=provider)
+
+
+class StageTimer:
+    """
+    Collects stage durations of one request for the Server-Timing header
+    and the stage histogram.
+    """
+
+    def __init__(self, view):
+        self.view = view
+        self.entries = []
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name, seconds, description=None, observe=True):
+        self.entries.append((name, seconds, description))
+        if observe:
+            stage_duration.observe(seconds, view=self.view, stage=name)
+
+    def header(self):
+        parts = []
+        for name, seconds, description in self.entries:
+            part = f"{name};dur={seconds * 1000:.1f}"
+            if description:
+                part += f';desc="{description}"'
+            parts.append(part)
+        return ", ".join(parts)
+
+
+class _NullTimer:
+    """Stand-in when a code path runs outside an instrumented request."""
+
+    @contextmanager
+    def stage(self, name):
+        yield
+
+    def add(self, name, seconds, description=None, observe=True):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+def _timed_stream(content, done):
+    try:
+        yield from content
+    finally:
+        done()
+
+
+async def _atimed_stream(content, done):
+    try:
+        async for chunk in content:
+            yield chunk
+    finally:
+        done()
+
+
+def timed_view(name):
+    """
+    Instruments a view: request.timer collects stage timings, the response
+    gets a Server-Timing header and the request duration is observed.
+    Works on sync and async views.
+
+    A streaming response sends its headers before the body is produced, so
+    it gets no Server-Timing header (it would only cover the setup); its
+    duration is observed when the stream finishes or the client goes away.
+    """
+    def finish(request, response, started):
+        def observe():
+            elapsed = time.perf_counter() - started
+            request.timer.add('total', elapsed, observe=False)
+            request_duration.observe(elapsed, view=name, status=response.status_code)
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _atimed_stream(response.streaming_content, observe)
+            else:
+                response.streaming_content = _timed_stream(response.streaming_content, observe)
+            return response
+        observe()
+        response['Server-Timing'] = request.timer.header()
+        return response
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                request.timer = StageTimer(name)
+                started = time.perf_counter()
+                return finish(request, await view(request, *args, **kwargs), started)
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            request.timer = StageTimer(name)
+            started = time.perf_counter()
+            return finish(request, view(request, *args, **kwargs), started)
+        return wrapper
+    return decorator
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_userprofile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('version', models.CharField(max_length=64)),
+                ('resume', models.FileField(blank=True, null=True, upload_to='resumes/')),
+                ('skills', models.JSONField(blank=True, default=list)),
+                ('ats_score', models.IntegerField(default=0)),
+                ('ats_breakdown', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
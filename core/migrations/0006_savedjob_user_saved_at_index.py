@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_translationcache'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='savedjob',
+            index=models.Index(fields=['user', '-saved_at', '-id'], name='core_savedj_user_id_eec9bb_idx'),
+        ),
+    ]
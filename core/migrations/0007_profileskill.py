@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_savedjob_user_saved_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=100)),
+                ('ats_score', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['-ats_score', '-id'], name='core_userpr_ats_sco_02bc98_idx'),
+        ),
+        migrations.AddField(
+            model_name='profileskill',
+            name='profile',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='core.userprofile'),
+        ),
+        migrations.AddIndex(
+            model_name='profileskill',
+            index=models.Index(fields=['skill', 'ats_score', 'profile'], name='core_profil_skill_8dfa13_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='profileskill',
+            unique_together={('profile', 'skill')},
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:56
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_profileskill'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_id', models.CharField(max_length=300, unique=True)),
+                ('provider', models.CharField(max_length=50)),
+                ('data', models.JSONField()),
+                ('skills', models.JSONField(blank=True, default=list)),
+                ('content_hash', models.CharField(max_length=64)),
+                ('updated_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('seen_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RecommendationRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('full', models.BooleanField(default=False)),
+                ('users_refreshed', models.IntegerField(default=0)),
+                ('jobs_changed', models.IntegerField(default=0)),
+                ('jobs_removed', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.IntegerField()),
+                ('score', models.FloatField()),
+                ('matched_skills', models.JSONField(blank=True, default=list)),
+                ('posting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='core.jobposting')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_recommendations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'rank'], name='core_jobrec_user_id_0bc077_idx')],
+                'unique_together': {('user', 'posting')},
+            },
+        ),
+    ]
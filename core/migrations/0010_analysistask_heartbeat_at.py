@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:09
+
+from django.db import migrations, models
+
+
+def start_heartbeats(apps, schema_editor):
+    # Tasks running during the upgrade keep the lease they had
+    AnalysisTask = apps.get_model('core', 'AnalysisTask')
+    AnalysisTask.objects.filter(status='running').update(heartbeat_at=models.F('started_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_resume_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysistask',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(start_heartbeats, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,7 @@
+import uuid
+
 from django.db import models
+from django.utils import timezone
 from django.contrib.auth.models import User
 
 # Create your models here.
@@ -10,10 +13,31 @@ class UserProfile(models.Model):
     ats_score = models.IntegerField(default=0)
     ats_breakdown = models.JSONField(default=dict, blank=True)
     uploaded_at = models.DateTimeField(auto_now=True)
+    # SHA-256 of the resume PDF (its ResumeText) and the analysis version
+    # (rules + taxonomy) the stored results come from
+    resume_hash = models.CharField(max_length=64, blank=True)
+    analysis_version = models.CharField(max_length=64, blank=True, db_index=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['-ats_score', '-id'])]
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
+class ProfileSkill(models.Model):
+    """Skill index of a profile: one row per (profile, canonical skill)"""
+    profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name='skill_index')
+    skill = models.CharField(max_length=100)
+    # Copied from the profile so a skill with a score floor is one index range scan
+    ats_score = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('profile', 'skill')
+        indexes = [models.Index(fields=['skill', 'ats_score', 'profile'])]
+
+    def __str__(self):
+        return f"{self.profile.user.username} - {self.skill}"
+
 class SavedJob(models.Model):
     """Model to store saved jobs for users"""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_jobs')
@@ -30,7 +54,128 @@ class SavedJob(models.Model):
     class Meta:
         unique_together = ('user', 'job_id')
         ordering = ['-saved_at']
+        indexes = [models.Index(fields=['user', '-saved_at', '-id'])]
     
     def __str__(self):
         return f"{self.user.username} - {self.job_title} at {self.company}"
 
+
+class ResumeAnalysis(models.Model):
+    """Analysis results cached by the SHA-256 of the uploaded resume bytes"""
+    content_hash = models.CharField(max_length=64, unique=True)
+    version = models.CharField(max_length=64)
+    resume = models.FileField(upload_to='resumes/', null=True, blank=True)
+    skills = models.JSONField(default=list, blank=True)
+    ats_score = models.IntegerField(default=0)
+    ats_breakdown = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.content_hash[:12]} ({self.version})"
+
+
+class ResumeText(models.Model):
+    """Extracted resume text (zlib-compressed UTF-8) by the SHA-256 of the PDF bytes"""
+    content_hash = models.CharField(max_length=64, unique=True)
+    compressed_text = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.content_hash[:12]} ({len(self.compressed_text)} bytes)"
+
+
+class AnalysisTask(models.Model):
+    """Resume analysis queued by upload_view and run by `manage.py run_analysis_worker`"""
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+
+    # Random ids, so the status endpoint cannot be used to enumerate results
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='analysis_tasks')
+    content_hash = models.CharField(max_length=64)
+    resume = models.FileField(upload_to='resumes/')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.IntegerField(default=0)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    worker = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    available_at = models.DateTimeField()
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Refreshed by the worker while the task runs; a running task whose
+    # heartbeat is older than ANALYSIS_TASK_TIMEOUT is assumed lost
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'available_at'])]
+
+    def __str__(self):
+        return f"Analysis task {self.pk} ({self.status})"
+
+
+class TranslationCache(models.Model):
+    """Translated text keyed by the SHA-256 of the source text and the target language"""
+    text_hash = models.CharField(max_length=64)
+    target_language = models.CharField(max_length=16)
+    translated_text = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('text_hash', 'target_language')
+
+    def __str__(self):
+        return f"{self.text_hash[:12]} -> {self.target_language}"
+
+
+class JobPosting(models.Model):
+    """Job catalogue: every job a provider returned, with its extracted skills"""
+    # "<provider>:<provider's job id>"
+    job_id = models.CharField(max_length=300, unique=True)
+    provider = models.CharField(max_length=50)
+    data = models.JSONField()
+    skills = models.JSONField(default=list, blank=True)
+    content_hash = models.CharField(max_length=64)
+    # updated_at changes with the content only; seen_at on every fetch
+    updated_at = models.DateTimeField(default=timezone.now, db_index=True)
+    seen_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"{self.job_id}: {self.data.get('title', '')}"
+
+
+class JobRecommendation(models.Model):
+    """Top-k catalogue jobs per user, written by `manage.py refresh_recommendations`"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='job_recommendations')
+    posting = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='recommendations')
+    rank = models.IntegerField()
+    score = models.FloatField()
+    matched_skills = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        unique_together = ('user', 'posting')
+        indexes = [models.Index(fields=['user', 'rank'])]
+
+    def __str__(self):
+        return f"{self.user.username} #{self.rank}: {self.posting.job_id}"
+
+
+class RecommendationRun(models.Model):
+    """One refresh_recommendations run; the last finished one is the watermark for the next"""
+    started_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    full = models.BooleanField(default=False)
+    users_refreshed = models.IntegerField(default=0)
+    jobs_changed = models.IntegerField(default=0)
+    jobs_removed = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"Recommendation run {self.started_at:%Y-%m-%d %H:%M} ({'full' if self.full else 'incremental'})"
@@ -0,0 +1,148 @@
+import json
+import math
+import os
+import threading
+from collections import Counter
+
+from django.conf import settings
+
+from .cache import LRUCache
+from .matching import strip_html, tokenize
+
+# Title terms count this many times more than description terms
+TITLE_WEIGHT = 2
+
+
+# Term vectors of recently ranked jobs; provider results are cached, so the
+# same postings are ranked again and again
+_job_terms_cache = LRUCache(maxsize=4096)
+
+
+def job_terms(job):
+    """
+    Weighted term frequencies for a normalized job (title + description).
+    """
+    # The description itself is part of the key: its hash is cached on the
+    # string, and an edited description never reuses the old terms
+    key = (job.get('id'), job.get('title'), job.get('description') or '')
+    terms = _job_terms_cache.get(key)
+    if terms is None:
+        terms = Counter()
+        for token in tokenize((job.get('title') or '').lower()):
+            terms[token] += TITLE_WEIGHT
+        terms.update(tokenize(strip_html(job.get('description')).lower()))
+        _job_terms_cache.set(key, terms)
+    return terms
+
+
+class IDFStats:
+    """
+    Document frequencies of a job corpus, used for BM25 IDF weights.
+    """
+
+    def __init__(self, doc_count, avg_length, df):
+        self.doc_count = doc_count
+        self.avg_length = avg_length
+        self.df = df
+
+    @classmethod
+    def from_jobs(cls, jobs):
+        df = Counter()
+        total_length = 0
+        for job in jobs:
+            terms = job_terms(job)
+            df.update(terms.keys())
+            total_length += sum(terms.values())
+        return cls(len(jobs), total_length / len(jobs) if jobs else 0.0, dict(df))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['doc_count'], data['avg_length'], data['df'])
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'doc_count': self.doc_count, 'avg_length': self.avg_length, 'df': self.df}, f)
+        os.replace(tmp_path, path)
+
+    def idf(self, term):
+        df = self.df.get(term, 0)
+        return math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+
+
+_idf_stats = None
+_idf_mtime = None
+_idf_lock = threading.Lock()
+
+
+def get_corpus_idf():
+    """
+    Returns the precomputed IDF statistics from JOB_IDF_PATH (written by
+    ingest_remoteok), reloading them when the file changes, or None.
+    """
+    global _idf_stats, _idf_mtime
+    path = str(getattr(settings, 'JOB_IDF_PATH', '') or '')
+    if not path:
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    if mtime != _idf_mtime:
+        with _idf_lock:
+            if mtime != _idf_mtime:
+                _idf_stats = IDFStats.load(path)
+                _idf_mtime = mtime
+    return _idf_stats
+
+
+def rank_jobs(jobs, skills, k1=1.2, b=0.75):
+    """
+    Orders jobs by BM25 relevance of their title and description to the
+    resume's skills. Returns copies of the jobs, each with a 'relevance'
+    entry holding the score and the skills it matched.
+
+    IDF weights come from the precomputed job corpus when available, else
+    from the candidate jobs themselves. Only the query terms are looked up
+    in each job, so cost is (jobs x query terms) dictionary lookups.
+    """
+    if not jobs:
+        return []
+
+    skill_terms = {}
+    for skill in skills:
+        terms = tokenize(skill.strip().lower())
+        if terms:
+            skill_terms[skill] = terms
+    query_terms = {term for terms in skill_terms.values() for term in terms}
+
+    job_term_counts = [job_terms(job) for job in jobs]
+    stats = get_corpus_idf()
+    if stats is None or not stats.doc_count:
+        stats = IDFStats(len(jobs), 0, {})
+        for terms in job_term_counts:
+            for term in query_terms.intersection(terms):
+                stats.df[term] = stats.df.get(term, 0) + 1
+    idf = {term: stats.idf(term) for term in query_terms}
+
+    lengths = [sum(terms.values()) for terms in job_term_counts]
+    avg_length = stats.avg_length or (sum(lengths) / len(lengths)) or 1.0
+
+    ranked = []
+    for job, terms, length in zip(jobs, job_term_counts, lengths):
+        norm = k1 * (1 - b + b * length / avg_length)
+        score = 0.0
+        hits = set()
+        for term in query_terms:
+            tf = terms.get(term)
+            if tf:
+                score += idf[term] * tf * (k1 + 1) / (tf + norm)
+                hits.add(term)
+        matched = [skill for skill, skill_tokens in skill_terms.items() if hits.issuperset(skill_tokens)]
+        ranked.append(dict(job, relevance={'score': round(score, 4), 'matched_terms': matched}))
+
+    ranked.sort(key=lambda job: job['relevance']['score'], reverse=True)
+    return ranked
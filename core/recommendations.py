@@ -0,0 +1,215 @@
+import hashlib
+import heapq
+import json
+import math
+from collections import Counter, defaultdict
+from datetime import timedelta
+from itertools import chain
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+from .candidates import normalize_skills
+from .db import insert_rows, serialized_write
+from .matching import strip_html
+from .models import JobPosting, JobRecommendation, RecommendationRun, UserProfile
+from .skills import get_skill_taxonomy
+
+
+def job_skills(job):
+    """
+    Canonical skills mentioned in a normalized job's title and description.
+    """
+    return get_skill_taxonomy().extract(f"{job.get('title') or ''}\n{strip_html(job.get('description'))}")
+
+
+def job_content_hash(job):
+    return hashlib.sha256(json.dumps(job, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def record_job_postings(provider, jobs):
+    """
+    Adds a provider's results to the job catalogue. New and changed jobs
+    are upserted with a new updated_at, so the next incremental
+    recommendation refresh scores them; unchanged ones only get seen_at.
+    """
+    if not jobs or not getattr(settings, 'JOB_CATALOG_ENABLED', True):
+        return
+    now = timezone.now()
+    postings = {f"{provider}:{job['id']}": job for job in jobs if job.get('id') not in (None, '')}
+    hashes = {job_id: job_content_hash(job) for job_id, job in postings.items()}
+    try:
+        existing = dict(JobPosting.objects.filter(job_id__in=hashes).values_list('job_id', 'content_hash'))
+        changed = [
+            JobPosting(job_id=job_id, provider=provider, data=postings[job_id], skills=job_skills(postings[job_id]),
+                       content_hash=content_hash, updated_at=now, seen_at=now)
+            for job_id, content_hash in hashes.items() if existing.get(job_id) != content_hash
+        ]
+        unchanged = [job_id for job_id, content_hash in hashes.items() if existing.get(job_id) == content_hash]
+        with serialized_write():
+            if changed:
+                JobPosting.objects.bulk_create(
+                    changed, update_conflicts=True, unique_fields=['job_id'],
+                    update_fields=['provider', 'data', 'skills', 'content_hash', 'updated_at', 'seen_at'])
+            if unchanged:
+                JobPosting.objects.filter(job_id__in=unchanged).update(seen_at=now)
+    except DatabaseError as e:
+        print(f"Error recording {provider} jobs: {e}")
+
+
+class SkillMatrix:
+    """
+    Jobs as sparse binary skill vectors, stored by column: for each skill
+    the rows (jobs) that have it. Scoring a user is a sparse vector-matrix
+    product (one count per shared skill) followed by cosine normalization,
+    so its cost is the length of the user's skill columns, not the number
+    of jobs.
+    """
+
+    def __init__(self, postings):
+        self.ids = []
+        self.skills = []
+        self.norms = []
+        self.columns = defaultdict(list)
+        for posting_id, skills in postings:
+            skills = set(skills)
+            if not skills:
+                continue
+            row = len(self.ids)
+            self.ids.append(posting_id)
+            self.skills.append(skills)
+            self.norms.append(math.sqrt(len(skills)))
+            for skill in skills:
+                self.columns[skill].append(row)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def top_k(self, skills, k):
+        """
+        [(score, posting id), ...] of the k best jobs for a skill set, best
+        first; ties go to the newer (higher id) posting.
+        """
+        shared = Counter(chain.from_iterable(self.columns.get(skill, ()) for skill in skills))
+        if not shared:
+            return []
+        user_norm = math.sqrt(len(skills))
+        return heapq.nlargest(k, ((count / (user_norm * self.norms[row]), self.ids[row])
+                                  for row, count in shared.items()))
+
+
+def _write_recommendations(lists, skills_by_user, job_skills_by_id):
+    """
+    Replaces the recommendations of the users in lists ({user id:
+    [(score, posting id), ...]}) in one transaction.
+    """
+    rows = [
+        (user_id, posting_id, rank, score,
+         json.dumps([skill for skill in skills_by_user[user_id] if skill in job_skills_by_id[posting_id]]))
+        for user_id, top in lists.items()
+        for rank, (score, posting_id) in enumerate(top)
+    ]
+    with serialized_write():
+        JobRecommendation.objects.filter(user_id__in=list(lists)).delete()
+        insert_rows(JobRecommendation, ('user_id', 'posting_id', 'rank', 'score', 'matched_skills'), rows)
+
+
+def refresh_recommendations(full=False, top_k=None, batch_size=1000, progress=None):
+    """
+    Writes the top-k catalogue jobs of every user with skills to
+    JobRecommendation.
+
+    Incremental runs (the default once a run has finished) only recompute
+    users whose profile changed since the last run, or whose current list
+    has a job that changed or expired. For everyone else only the changed
+    jobs are scored and merged into the stored list, which is exact because
+    scores only depend on the user and the job. Jobs not seen by any
+    provider for JOB_CATALOG_MAX_AGE_DAYS are removed first.
+    Returns the RecommendationRun.
+    """
+    top_k = top_k or getattr(settings, 'RECOMMENDATIONS_PER_USER', 20)
+    last_run = (RecommendationRun.objects.filter(finished_at__isnull=False)
+                .order_by('-started_at').first())
+    full = full or last_run is None
+    run = RecommendationRun.objects.create(full=full)
+
+    expired = JobPosting.objects.filter(
+        seen_at__lt=run.started_at - timedelta(days=getattr(settings, 'JOB_CATALOG_MAX_AGE_DAYS', 30)))
+    if full:
+        changed_jobs = set()
+        stale_users = set()
+    else:
+        changed_jobs = set(JobPosting.objects.filter(updated_at__gte=last_run.started_at)
+                           .values_list('id', flat=True))
+        # Users whose list loses or rescores a job need a full recompute
+        stale_users = set(JobRecommendation.objects.filter(posting__updated_at__gte=last_run.started_at)
+                          .values_list('user_id', flat=True))
+        stale_users.update(JobRecommendation.objects.filter(posting__in=expired)
+                           .values_list('user_id', flat=True))
+        stale_users.update(UserProfile.objects.filter(uploaded_at__gte=last_run.started_at)
+                           .values_list('user_id', flat=True))
+    with serialized_write():
+        _, removed = expired.delete()
+    run.jobs_removed = removed.get(JobPosting._meta.label, 0)
+
+    postings = list(JobPosting.objects.values_list('id', 'skills'))
+    matrix = SkillMatrix((posting_id, normalize_skills(skills)) for posting_id, skills in postings)
+    changed_matrix = SkillMatrix((posting_id, normalize_skills(skills)) for posting_id, skills in postings
+                                 if posting_id in changed_jobs)
+    job_skills_by_id = dict(zip(matrix.ids, matrix.skills))
+    run.jobs_changed = len(matrix) if full else len(changed_jobs)
+
+    last_id = 0
+    users_seen = 0
+    while True:
+        profiles = list(UserProfile.objects.filter(id__gt=last_id).order_by('id')
+                        .values_list('id', 'user_id', 'skills')[:batch_size])
+        if not profiles:
+            break
+        last_id = profiles[-1][0]
+        users_seen += len(profiles)
+
+        skills_by_user = {user_id: normalize_skills(skills or []) for _, user_id, skills in profiles
+                          if full or changed_matrix.ids or user_id in stale_users}
+        lists = {}
+        merge = {}
+        for user_id, skills in skills_by_user.items():
+            if full or user_id in stale_users:
+                lists[user_id] = matrix.top_k(skills, top_k) if skills else []
+            elif changed_matrix.ids and skills:
+                candidates = changed_matrix.top_k(skills, top_k)
+                if candidates:
+                    merge[user_id] = candidates
+        if merge:
+            stored = defaultdict(list)
+            for user_id, posting_id, score in (JobRecommendation.objects.filter(user_id__in=list(merge))
+                                               .values_list('user_id', 'posting_id', 'score')):
+                stored[user_id].append((score, posting_id))
+            for user_id, candidates in merge.items():
+                top = heapq.nlargest(top_k, stored[user_id] + candidates)
+                # Only rewrite lists a changed job actually made it into
+                if top != heapq.nlargest(top_k, stored[user_id]):
+                    lists[user_id] = top
+
+        if lists:
+            _write_recommendations(lists, skills_by_user, job_skills_by_id)
+            run.users_refreshed += len(lists)
+        if progress:
+            progress(users_seen, run.users_refreshed)
+
+    run.finished_at = timezone.now()
+    run.save()
+    return run
+
+
+def get_recommendations(user, limit=None):
+    """
+    The user's stored recommendations, best first, as normalized jobs with
+    a relevance entry like rank_jobs gives. One indexed query.
+    """
+    limit = limit or getattr(settings, 'RECOMMENDATIONS_PER_USER', 20)
+    rows = (JobRecommendation.objects.filter(user=user).order_by('rank')
+            .values_list('score', 'matched_skills', 'posting__data')[:limit])
+    return [dict(data, relevance={'score': round(score, 4), 'matched_terms': matched})
+            for score, matched, data in rows]
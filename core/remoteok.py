@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+import time
+
+from django.conf import settings
+
+from .http_client import get_async_provider_client, get_provider_client
+from .matching import strip_html, tokenize
+
+REMOTEOK_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+def _feed_jobs(data):
+    # RemoteOK returns array where first element is metadata
+    if isinstance(data, list) and len(data) > 1:
+        data = data[1:]
+    return [job for job in data if isinstance(job, dict)]
+
+
+def fetch_remoteok_feed(timeout=10, deadline=None):
+    """
+    Downloads the RemoteOK feed and returns its job entries
+    (the leading metadata element is dropped).
+    """
+    url = getattr(settings, 'REMOTEOK_API_URL', "https://remoteok.com/api")
+    response = get_provider_client('remoteok').get(url, deadline=deadline, headers=REMOTEOK_HEADERS, timeout=timeout)
+    response.raise_for_status()
+    return _feed_jobs(response.json())
+
+
+async def afetch_remoteok_feed(timeout=10, deadline=None):
+    """
+    Async fetch_remoteok_feed, on the provider's non-blocking client.
+    """
+    url = getattr(settings, 'REMOTEOK_API_URL', "https://remoteok.com/api")
+    response = await get_async_provider_client('remoteok').get(
+        url, deadline=deadline, headers=REMOTEOK_HEADERS, timeout=timeout)
+    response.raise_for_status()
+    return _feed_jobs(response.json())
+
+
+def normalize_remoteok_job(job):
+    """
+    Converts a RemoteOK feed entry to the common job format.
+    """
+    return {
+        'id': job.get('id', ''),
+        'title': job.get('position', ''),
+        'company': {'display_name': job.get('company', 'Unknown')},
+        'location': {'display_name': 'Remote'},
+        'description': job.get('description', '')[:500],  # Truncate long descriptions
+        'created': job.get('date', ''),
+        'salary_min': job.get('salary_min'),
+        'salary_max': job.get('salary_max'),
+        'redirect_url': job.get('url', '')
+    }
+
+
+class RemoteOKIndex:
+    """
+    Inverted index over a RemoteOK feed snapshot.
+
+    Tags are indexed whole; descriptions (HTML stripped) and titles are
+    indexed by token. A skill matches a job when it is one of the job's tags
+    or when all of its tokens occur in the job's text.
+    """
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.tags = {}
+        self.tokens = {}
+        for doc_id, job in enumerate(jobs):
+            for tag in job.get('tags') or []:
+                self.tags.setdefault(str(tag).lower(), set()).add(doc_id)
+            text = f"{job.get('position', '')} {strip_html(job.get('description'))}"
+            for token in set(tokenize(text.lower())):
+                self.tokens.setdefault(token, set()).add(doc_id)
+
+    def _postings(self, skill):
+        docs = set(self.tags.get(skill, ()))
+        token_sets = [self.tokens.get(token) for token in tokenize(skill)]
+        if token_sets and all(token_sets):
+            docs |= set.intersection(*token_sets)
+        return docs
+
+    def search(self, skills, limit=10):
+        """
+        Returns up to `limit` normalized jobs matching any of the skills,
+        jobs matching more skills first, then in feed (newest first) order.
+        """
+        hits = {}
+        for skill in {s.strip().lower() for s in skills if s}:
+            for doc_id in self._postings(skill):
+                hits[doc_id] = hits.get(doc_id, 0) + 1
+        ranked = sorted(hits, key=lambda doc_id: (-hits[doc_id], doc_id))
+        return [normalize_remoteok_job(self.jobs[doc_id]) for doc_id in ranked[:limit]]
+
+
+def get_snapshot_path():
+    return str(getattr(settings, 'REMOTEOK_SNAPSHOT_PATH', '') or '')
+
+
+def save_snapshot(jobs, path=None):
+    """
+    Writes the feed snapshot atomically, so readers never see a partial file.
+    """
+    path = path or get_snapshot_path()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'fetched_at': time.time(), 'jobs': jobs}, f)
+    os.replace(tmp_path, path)
+
+
+_index = None
+_index_mtime = None
+_index_lock = threading.Lock()
+
+
+def get_remoteok_index():
+    """
+    Returns the index for the current snapshot, or None when there is no
+    snapshot or it is older than REMOTEOK_SNAPSHOT_MAX_AGE seconds.
+    The index is rebuilt only when the snapshot file changes.
+    """
+    global _index, _index_mtime
+    path = get_snapshot_path()
+    if not path:
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    max_age = getattr(settings, 'REMOTEOK_SNAPSHOT_MAX_AGE', 0)
+    if max_age and time.time() - mtime > max_age:
+        return None
+    if mtime != _index_mtime:
+        with _index_lock:
+            if mtime != _index_mtime:
+                with open(path, encoding='utf-8') as f:
+                    snapshot = json.load(f)
+                _index = RemoteOKIndex(snapshot.get('jobs', []))
+                _index_mtime = mtime
+    return _index
@@ -0,0 +1,147 @@
+import base64
+import hashlib
+from datetime import datetime
+
+from django.db.models import Count, Max, Q, Sum
+
+from .db import serialized_write
+from .models import SavedJob
+
+# Fields of the saved jobs list; the description is only in the detail view
+LIST_FIELDS = ('id', 'job_id', 'job_title', 'company', 'location', 'redirect_url', 'salary',
+               'posted_date', 'saved_at')
+DETAIL_FIELDS = LIST_FIELDS + ('description',)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(row):
+    raw = f"{row['saved_at'].isoformat()}|{row['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        saved_at, row_id = raw.split('|')
+        return datetime.fromisoformat(saved_at), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+
+def serialize_saved_job(row):
+    """
+    API representation of a values() row (no model instances involved).
+    """
+    job = {
+        'id': row['job_id'],
+        'title': row['job_title'],
+        'company': row['company'],
+        'location': row['location'],
+        'redirect_url': row['redirect_url'],
+        'salary': row['salary'],
+        'postedDate': row['posted_date'],
+        'saved_at': row['saved_at'].isoformat(),
+        'saved': True,
+    }
+    if 'description' in row:
+        job['description'] = row['description']
+    return job
+
+
+def get_saved_jobs_page(user, cursor=None, limit=50):
+    """
+    Returns (jobs, next_cursor) for one page of the user's saved jobs,
+    newest first. Keyset pagination on (saved_at, id) keeps every page one
+    index range scan, however deep the page.
+    """
+    rows = SavedJob.objects.filter(user=user).order_by('-saved_at', '-id')
+    if cursor:
+        saved_at, row_id = decode_cursor(cursor)
+        rows = rows.filter(Q(saved_at__lt=saved_at) | Q(saved_at=saved_at, id__lt=row_id))
+    rows = list(rows.values(*LIST_FIELDS)[:limit + 1])
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return [serialize_saved_job(row) for row in rows[:limit]], next_cursor
+
+
+def saved_jobs_state(user):
+    """
+    (count, newest saved_at, id checksum) of the user's saved jobs, from a
+    single aggregate query. Any save or removal changes the whole tuple
+    (and so the ETag), but not necessarily the newest saved_at: it is no
+    Last-Modified date.
+    """
+    state = SavedJob.objects.filter(user=user).aggregate(
+        count=Count('id'), last_saved=Max('saved_at'), ids=Sum('id'))
+    return state['count'], state['last_saved'], state['ids'] or 0
+
+
+def saved_jobs_etag(user, state, *parts):
+    """
+    ETag of a view of the user's saved jobs in the given saved_jobs_state;
+    parts are whatever else selects the view (cursor, page size).
+    """
+    key = '|'.join(str(part) for part in (user.pk,) + tuple(state) + parts)
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+# Job fields accepted by save actions: request key -> SavedJob field
+SAVE_FIELDS = {
+    'job_title': 'job_title',
+    'company': 'company',
+    'location': 'location',
+    'description': 'description',
+    'redirect_url': 'redirect_url',
+    'salary': 'salary',
+    'posted_date': 'posted_date',
+}
+
+
+def apply_saved_job_actions(user, items):
+    """
+    Applies a list of {'job_id', 'action': 'save'|'unsave', job fields...}
+    items in one transaction on the serialized write path: one existence
+    query, one bulk insert (INSERT OR IGNORE on the (user, job_id) unique
+    constraint) and one filtered delete, however many items there are.
+
+    Returns one result per item, in order, with an outcome of 'saved',
+    'already_saved', 'removed', 'not_saved', 'duplicate' (a later item for
+    the same job wins) or 'invalid'.
+    """
+    results = [{'job_id': item.get('job_id') if isinstance(item, dict) else None, 'outcome': 'invalid'}
+               for item in items]
+    final = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get('job_id') or item.get('action') not in ('save', 'unsave'):
+            continue
+        job_id = str(item['job_id'])
+        if job_id in final:
+            results[final[job_id]]['outcome'] = 'duplicate'
+        final[job_id] = index
+        results[index]['action'] = item['action']
+
+    save_ids = {job_id for job_id, index in final.items() if items[index]['action'] == 'save'}
+    unsave_ids = set(final) - save_ids
+
+    with serialized_write():
+        existing = set(SavedJob.objects.filter(user=user, job_id__in=final)
+                       .values_list('job_id', flat=True))
+        new_jobs = [
+            SavedJob(user=user, job_id=job_id, **{
+                field: str(items[final[job_id]].get(key) or '') for key, field in SAVE_FIELDS.items()
+            })
+            for job_id in save_ids - existing
+        ]
+        SavedJob.objects.bulk_create(new_jobs, ignore_conflicts=True)
+        removed = unsave_ids & existing
+        if removed:
+            SavedJob.objects.filter(user=user, job_id__in=removed).delete()
+
+    for job_id, index in final.items():
+        if job_id in save_ids:
+            results[index]['outcome'] = 'already_saved' if job_id in existing else 'saved'
+        else:
+            results[index]['outcome'] = 'removed' if job_id in existing else 'not_saved'
+    return results
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from .skills import get_skill_taxonomy
+
+SIMULATED_PROVIDERS = ['adzuna', 'jsearch', 'remoteok']
+
+SIM_COMPANIES = ['Infosys', 'TCS', 'Wipro', 'Flipkart', 'Zoho', 'Freshworks', 'Razorpay', 'Swiggy',
+                 'Acme Labs', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries']
+SIM_ROLES = ['Engineer', 'Developer', 'Senior Developer', 'Lead Engineer', 'Consultant', 'Architect']
+SIM_CITIES = ['Bangalore', 'Hyderabad', 'Pune', 'Chennai', 'Mumbai', 'Delhi']
+
+
+class FaultProfile:
+    """
+    Latency and failures injected into one provider's responses.
+
+    latency_ms +/- jitter_ms is added to every response. error_rate of the
+    requests get a 503, and timeout_rate of them stall for hang_seconds
+    (longer than the app's provider timeouts) before answering.
+    """
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, timeout_rate=0.0, hang_seconds=30):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+
+    def delay(self, rng):
+        return max(0.0, self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+
+
+def _synthetic_jobs(provider, count=200, seed=0):
+    """
+    Provider-shaped job postings mentioning taxonomy skills, used when no
+    recorded payload is available.
+    """
+    rng = random.Random(f"{provider}-{seed}")
+    skills = list(get_skill_taxonomy().skills)
+    jobs = []
+    for i in range(count):
+        job_skills = rng.sample(skills, 4)
+        title = f"{job_skills[0].title()} {rng.choice(SIM_ROLES)}"
+        company = rng.choice(SIM_COMPANIES)
+        city = rng.choice(SIM_CITIES)
+        description = (f"We are hiring a {title} to work with {', '.join(job_skills)}. "
+                       f"You will build and operate production systems with a small team in {city}.")
+        if provider == 'adzuna':
+            jobs.append({
+                'id': f"adz-{i}", 'title': title, 'company': {'display_name': company},
+                'location': {'display_name': f"{city}, India"}, 'description': description,
+                'created': '2026-01-01T00:00:00Z', 'salary_min': 600000, 'salary_max': 1800000,
+                'redirect_url': f"https://example.com/adzuna/{i}",
+            })
+        elif provider == 'jsearch':
+            jobs.append({
+                'job_id': f"js-{i}", 'job_title': title, 'employer_name': company,
+                'job_city': city, 'job_country': 'IN', 'job_description': description,
+                'job_posted_at_datetime_utc': '2026-01-01T00:00:00.000Z',
+                'job_min_salary': None, 'job_max_salary': None,
+                'job_apply_link': f"https://example.com/jsearch/{i}",
+            })
+        else:
+            jobs.append({
+                'id': str(100000 + i), 'position': title, 'company': company, 'tags': job_skills,
+                'description': f"<p>{description}</p>", 'date': '2026-01-01T00:00:00+00:00',
+                'salary_min': 50000, 'salary_max': 120000, 'url': f"https://example.com/remoteok/{i}",
+            })
+    return jobs
+
+
+def load_payloads(directory=None):
+    """
+    Returns {provider: [raw job, ...]} from recorded responses in directory
+    (adzuna.json, jsearch.json, remoteok.json: response bodies as returned
+    by the real APIs), falling back to synthetic jobs per missing file.
+    """
+    payloads = {}
+    for provider in SIMULATED_PROVIDERS:
+        path = os.path.join(directory, f"{provider}.json") if directory else None
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if provider == 'adzuna':
+                data = data.get('results', [])
+            elif provider == 'jsearch':
+                data = data.get('data', [])
+            else:
+                data = [job for job in data if isinstance(job, dict) and 'position' in job]
+            payloads[provider] = data
+        else:
+            payloads[provider] = _synthetic_jobs(provider)
+    return payloads
+
+
+class _SimulatorServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections under concurrent load tests
+    request_queue_size = 1024
+
+
+class ProviderSimulator:
+    """
+    Local HTTP stand-in for the Adzuna, JSearch and RemoteOK APIs:
+
+        /adzuna/jobs/<country>/search/<page>   (ADZUNA_API_URL = <url>/adzuna)
+        /jsearch/search                        (JSEARCH_API_URL = <url>/jsearch/search)
+        /remoteok/api                          (REMOTEOK_API_URL = <url>/remoteok/api)
+
+    Each search returns a page of the replayed payload chosen from the
+    query, so different skill sets see different jobs.
+    """
+
+    def __init__(self, payloads, faults=None, host='127.0.0.1', port=8900, page_size=10, seed=None):
+        self.payloads = payloads
+        self.faults = faults or {}
+        self.page_size = page_size
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.counts = {provider: {'ok': 0, 'error': 0, 'timeout': 0} for provider in SIMULATED_PROVIDERS}
+        self.server = _SimulatorServer((host, port), self._handler_class())
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                simulator.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _page(self, provider, query):
+        jobs = self.payloads.get(provider, [])
+        if not jobs:
+            return []
+        digest = int(hashlib.md5(query.encode()).hexdigest()[:8], 16)
+        start = digest % len(jobs)
+        return [jobs[(start + i) % len(jobs)] for i in range(min(self.page_size, len(jobs)))]
+
+    def _route(self, parsed):
+        parts = parsed.path.strip('/').split('/')
+        params = parse_qs(parsed.query)
+        if parts[0] == 'adzuna' and 'search' in parts:
+            return 'adzuna', {'results': self._page('adzuna', params.get('what', [''])[0])}
+        if parts[:2] == ['jsearch', 'search']:
+            return 'jsearch', {'data': self._page('jsearch', params.get('query', [''])[0])}
+        if parts[:2] == ['remoteok', 'api']:
+            # The real feed is one big list with a metadata element first
+            return 'remoteok', [{'legal': 'simulated feed'}] + self.payloads.get('remoteok', [])
+        return None, None
+
+    def handle(self, request):
+        provider, body = self._route(urlparse(request.path))
+        if provider is None:
+            request.send_error(404)
+            return
+
+        fault = self.faults.get(provider) or self.faults.get('default') or FaultProfile()
+        with self.rng_lock:
+            delay = fault.delay(self.rng)
+            roll = self.rng.random()
+        if roll < fault.timeout_rate:
+            outcome = 'timeout'
+            delay = fault.hang_seconds
+        elif roll < fault.timeout_rate + fault.error_rate:
+            outcome = 'error'
+        else:
+            outcome = 'ok'
+        with self.rng_lock:
+            self.counts[provider][outcome] += 1
+
+        time.sleep(delay)
+        try:
+            if outcome == 'error':
+                request.send_error(503, "Simulated provider error")
+                return
+            data = json.dumps(body).encode()
+            request.send_response(200)
+            request.send_header('Content-Type', 'application/json')
+            request.send_header('Content-Length', str(len(data)))
+            request.end_headers()
+            request.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up first, as it should on a simulated timeout
+            pass
+
+    def start(self):
+        thread = threading.Thread(target=self.server.serve_forever, name='provider-simulator', daemon=True)
+        thread.start()
+        return thread
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,126 @@
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+
+from django.conf import settings
+
+from .matching import PhraseMatcher, tokenize
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), 'data', 'skills.json')
+
+# Qualifiers external taxonomies add to labels, e.g. ESCO's
+# "Python (computer programming)"; resumes never spell them out
+LABEL_QUALIFIER_RE = re.compile(r"\s*\([^)]*\)")
+
+
+class SkillTaxonomy:
+    """
+    Compiled skill taxonomy: canonical skill names, their aliases and a
+    PhraseMatcher that maps every surface form back to its canonical name.
+    """
+
+    def __init__(self, skills, version):
+        self.skills = skills
+        self.version = version
+        self.matcher = PhraseMatcher()
+        self.canonical_names = {}
+        for canonical, aliases in skills.items():
+            self.matcher.add(canonical, canonical)
+            self.canonical_names[canonical] = canonical
+            for alias in aliases:
+                self.matcher.add(alias, canonical)
+                self.canonical_names.setdefault(alias, canonical)
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Loads a taxonomy JSON file of the form
+        {"skills": {"kubernetes": ["k8s"], ...}}.
+        The version is derived from the file contents, so editing the
+        taxonomy automatically changes it.
+        """
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+        skills = {
+            canonical.lower(): [alias.lower() for alias in aliases]
+            for canonical, aliases in data.get('skills', {}).items()
+        }
+        version = hashlib.sha256(raw).hexdigest()[:12]
+        return cls(skills, version)
+
+    def extract(self, text):
+        return self.matcher.find_all(tokenize(text.lower()))
+
+    def canonical(self, name):
+        """
+        Canonical name of a skill typed by a user ("K8s" -> "kubernetes");
+        names outside the taxonomy are only lowercased.
+        """
+        name = ' '.join(name.lower().split())
+        return self.canonical_names.get(name, name)
+
+
+def _clean_label(label):
+    return ' '.join(LABEL_QUALIFIER_RE.sub('', label).lower().split())
+
+
+def import_taxonomy_csv(path, skills=None, label_column='preferredLabel', aliases_column='altLabels',
+                        alias_separator='\n', type_column=None, types=(), max_words=5):
+    """
+    Merges the skills of an external taxonomy CSV export (ESCO's
+    skills_en.csv by default) into skills ({canonical: [alias, ...]}, e.g.
+    the bundled taxonomy) and returns the result. Labels are lowercased and
+    stripped of parenthesized qualifiers; a label that is already an alias
+    adds its aliases to that skill. Rows of other types (type_column not in
+    types) and labels longer than max_words are skipped.
+    """
+    skills = {canonical: list(aliases) for canonical, aliases in (skills or {}).items()}
+    canonical_of = {alias: canonical for canonical, aliases in skills.items() for alias in aliases}
+    canonical_of.update((canonical, canonical) for canonical in skills)
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            if types and row.get(type_column) not in types:
+                continue
+            label = _clean_label(row.get(label_column) or '')
+            if not label or len(label.split()) > max_words:
+                continue
+            canonical = canonical_of.setdefault(label, label)
+            aliases = skills.setdefault(canonical, [])
+            for alias in (row.get(aliases_column) or '').split(alias_separator):
+                alias = _clean_label(alias)
+                if alias and len(alias.split()) <= max_words and alias not in canonical_of:
+                    canonical_of[alias] = canonical
+                    aliases.append(alias)
+    return skills
+
+
+def save_taxonomy(skills, path, source=None):
+    """
+    Writes skills in the taxonomy JSON format SkillTaxonomy.from_file reads.
+    """
+    data = {'version': 1, 'skills': {canonical: sorted(skills[canonical]) for canonical in sorted(skills)}}
+    if source:
+        data['source'] = source
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+_taxonomy = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_skill_taxonomy():
+    """
+    Returns the process-wide taxonomy, compiling it on first use.
+    """
+    global _taxonomy
+    if _taxonomy is None:
+        with _taxonomy_lock:
+            if _taxonomy is None:
+                path = getattr(settings, 'SKILL_TAXONOMY_PATH', None) or DEFAULT_TAXONOMY_PATH
+                _taxonomy = SkillTaxonomy.from_file(path)
+    return _taxonomy
@@ -0,0 +1,190 @@
+import logging
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .analysis import analysis_response, analyze_stored_resume, update_profile_analysis
+from .models import AnalysisTask
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_analysis(content_hash, file_path, user=None):
+    """
+    Queues analysis of a saved resume and returns the task.
+    """
+    return AnalysisTask.objects.create(
+        user=user if user is not None and user.is_authenticated else None,
+        content_hash=content_hash,
+        resume=file_path,
+        available_at=timezone.now(),
+    )
+
+
+def default_worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def claim_next_task(worker_name):
+    """
+    Atomically marks the oldest runnable task as running and returns it,
+    or None when the queue is empty.
+
+    Runnable tasks are pending tasks whose retry delay has passed and
+    running tasks whose heartbeat is older than ANALYSIS_TASK_TIMEOUT (the
+    worker died). A lost task that already used ANALYSIS_TASK_MAX_ATTEMPTS
+    is marked failed instead, so a resume that crashes its worker is not
+    picked up forever. The conditional UPDATE makes concurrent workers, in
+    this or other processes, race safely: only one of them wins each task.
+    """
+    lease = getattr(settings, 'ANALYSIS_TASK_TIMEOUT', 300)
+    max_attempts = getattr(settings, 'ANALYSIS_TASK_MAX_ATTEMPTS', 3)
+    while True:
+        now = timezone.now()
+        task = (AnalysisTask.objects
+                .filter(Q(status=AnalysisTask.PENDING, available_at__lte=now)
+                        | Q(status=AnalysisTask.RUNNING, heartbeat_at__lt=now - timedelta(seconds=lease)))
+                .order_by('available_at', 'created_at')
+                .only('id', 'status', 'attempts')
+                .first())
+        if task is None:
+            return None
+        unchanged = AnalysisTask.objects.filter(pk=task.pk, status=task.status, attempts=task.attempts)
+        if task.status == AnalysisTask.RUNNING and task.attempts >= max_attempts:
+            unchanged.update(
+                status=AnalysisTask.FAILED,
+                error=f"Worker lost the task on attempt {task.attempts}",
+                finished_at=now,
+            )
+            continue
+        claimed = unchanged.update(
+            status=AnalysisTask.RUNNING,
+            attempts=task.attempts + 1,
+            worker=worker_name,
+            started_at=now,
+            heartbeat_at=now,
+        )
+        if claimed:
+            return AnalysisTask.objects.get(pk=task.pk)
+
+
+@contextmanager
+def keep_lease(task):
+    """
+    Refreshes the heartbeat of a claimed task every third of
+    ANALYSIS_TASK_TIMEOUT while the block runs, so a slow analysis is not
+    mistaken for a lost one and run a second time.
+    """
+    interval = getattr(settings, 'ANALYSIS_TASK_TIMEOUT', 300) / 3
+    stop = threading.Event()
+
+    def beat():
+        try:
+            while not stop.wait(interval):
+                AnalysisTask.objects.filter(
+                    pk=task.pk, status=AnalysisTask.RUNNING, attempts=task.attempts
+                ).update(heartbeat_at=timezone.now())
+        except DatabaseError as e:
+            logger.warning("Could not refresh the lease of analysis task %s: %s", task.pk, e)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=beat, name=f"analysis-lease-{task.pk}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def has_pending_tasks():
+    return AnalysisTask.objects.filter(status=AnalysisTask.PENDING).exists()
+
+
+def run_task(task):
+    """
+    Runs one claimed task, keeping its lease while it runs. Failures,
+    including a profile save that fails (e.g. database is locked), are
+    retried with exponential backoff until ANALYSIS_TASK_MAX_ATTEMPTS, then
+    the task is marked failed.
+    """
+    try:
+        with keep_lease(task):
+            analysis = analyze_stored_resume(task.content_hash, task.resume.name)
+            if task.user_id:
+                update_profile_analysis(task.user, task.resume.name, analysis, task.content_hash)
+    except Exception as e:
+        logger.warning("Analysis task %s failed (attempt %d): %s", task.pk, task.attempts, e)
+        task.error = str(e)
+        if task.attempts < getattr(settings, 'ANALYSIS_TASK_MAX_ATTEMPTS', 3):
+            backoff = getattr(settings, 'ANALYSIS_TASK_RETRY_BACKOFF', 5) * (2 ** (task.attempts - 1))
+            task.status = AnalysisTask.PENDING
+            task.available_at = timezone.now() + timedelta(seconds=backoff)
+        else:
+            task.status = AnalysisTask.FAILED
+            task.finished_at = timezone.now()
+        task.save(update_fields=['status', 'error', 'available_at', 'finished_at'])
+        return task
+
+    task.status = AnalysisTask.DONE
+    task.result = analysis_response(analysis)
+    task.error = ''
+    task.finished_at = timezone.now()
+    task.save(update_fields=['status', 'result', 'error', 'finished_at'])
+    return task
+
+
+def _percentiles(seconds):
+    seconds = sorted(seconds)
+
+    def percentile(p):
+        if not seconds:
+            return 0.0
+        return round(seconds[min(len(seconds) - 1, int(p * len(seconds)))] * 1000, 1)
+
+    return {
+        'avg': round(sum(seconds) / len(seconds) * 1000, 1) if seconds else 0.0,
+        'p50': percentile(0.50),
+        'p95': percentile(0.95),
+        'max': round(seconds[-1] * 1000, 1) if seconds else 0.0,
+    }
+
+
+def queue_counts():
+    counts = {status: 0 for status, _ in AnalysisTask.STATUS_CHOICES}
+    for row in AnalysisTask.objects.values('status').order_by().annotate(n=Count('id')):
+        counts[row['status']] = row['n']
+    return counts
+
+
+def queue_stats(sample_size=500):
+    """
+    Queue depth by status, age of the oldest pending task, and wait
+    (queued -> started) and processing (started -> finished) times in
+    milliseconds over the most recently finished tasks.
+    """
+    now = timezone.now()
+    counts = queue_counts()
+
+    oldest = (AnalysisTask.objects.filter(status=AnalysisTask.PENDING)
+              .order_by('created_at').values_list('created_at', flat=True).first())
+    recent = (AnalysisTask.objects.filter(status=AnalysisTask.DONE)
+              .order_by('-finished_at')
+              .values_list('created_at', 'started_at', 'finished_at')[:sample_size])
+    waits = [(started - created).total_seconds() for created, started, _ in recent]
+    processing = [(finished - started).total_seconds() for _, started, finished in recent]
+    return {
+        'depth': counts[AnalysisTask.PENDING],
+        'counts': counts,
+        'oldest_pending_s': round((now - oldest).total_seconds(), 1) if oldest else 0.0,
+        'wait_ms': _percentiles(waits),
+        'processing_ms': _percentiles(processing),
+    }
@@ -1,3 +1,1057 @@
-from django.test import TestCase
+import asyncio
+import json
+import random
+import re
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+import httpx
+import requests
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.http import JsonResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from . import analysis, http_client, remoteok
+from .benchmarks.corpus import write_pdf
+from .cache import TTLCache
+from .candidates import normalize_skills, search_candidates, sync_profile_skills
+from .dedupe import dedupe_jobs
+from .http_client import AsyncProviderClient, CircuitBreaker, CircuitOpenError, ProviderClient
+from .matching import PhraseMatcher, tokenize
+from .metrics import request_duration, timed_view
+from .models import AnalysisTask, JobPosting, JobRecommendation, ProfileSkill, ResumeAnalysis, SavedJob, UserProfile
+from .ranking import rank_jobs
+from .recommendations import record_job_postings, refresh_recommendations
+from .remoteok import RemoteOKIndex, fetch_remoteok_feed, save_snapshot
+from .simulator import FaultProfile, ProviderSimulator, load_payloads
+from .skills import SkillTaxonomy
+from .tasks import claim_next_task, keep_lease, run_task
+from .utils import (calculate_ats_score, extract_skills, extract_text_from_pdf, get_remoteok_jobs, iter_pdf_pages,
+                    iter_provider_jobs, job_cache)
+
+ACME_INTRO = (
+    "Acme Corp builds payment infrastructure for thousands of merchants across India. "
+    "We are a remote-first team of engineers, designers and operators who care about "
+    "reliability, clear writing and shipping small changes often. Our platform processes "
+    "millions of transactions every day and we are growing quickly across new markets, "
+    "so every engineer here has real ownership of the systems they build and run. "
+)
+
+
+def make_job(title, company, description, job_id=None):
+    return {
+        'id': job_id or title,
+        'title': title,
+        'company': {'display_name': company},
+        'location': {'display_name': 'Bengaluru, IN'},
+        'description': description,
+    }
+
+
+class DedupeTests(SimpleTestCase):
+    def test_same_posting_from_two_providers_is_dropped(self):
+        description = (
+            "Globex is hiring a developer to build Django services and REST APIs for our logistics "
+            "platform. You will own features end to end, from design to production, and work with "
+            "PostgreSQL, Redis and Celery. We value code review, tests and clear documentation, and "
+            "we ship to production several times a day with a small and friendly team."
+        )
+        jobs = [
+            make_job('Senior Python Developer', 'Globex Pvt Ltd', description, 'adzuna-1'),
+            # Relayed by another provider: HTML, a longer title and another legal form
+            make_job('Python Django Developer', 'Globex Private Limited', f"<p>{description}</p>", 'jsearch-1'),
+        ]
+        self.assertEqual([job['id'] for job in dedupe_jobs(jobs)], ['adzuna-1'])
+
+    def test_roles_sharing_a_company_intro_are_kept(self):
+        jobs = [
+            make_job('Platform Engineer', 'Acme Corp', ACME_INTRO + 'You will run our Kubernetes clusters.'),
+            make_job('QA Engineer', 'Acme Corp', ACME_INTRO + 'You will automate our release testing.'),
+        ]
+        self.assertEqual(len(dedupe_jobs(jobs)), 2)
+
+    def test_same_title_at_other_companies_is_kept(self):
+        jobs = [
+            make_job('Data Analyst', 'Initech', 'Analyse sales data in SQL and build dashboards.'),
+            make_job('Data Analyst', 'Umbrella', 'Model clinical trial data with Python and R.'),
+        ]
+        self.assertEqual(len(dedupe_jobs(jobs)), 2)
+
+    def test_other_seniority_levels_are_kept(self):
+        description = ACME_INTRO + 'You will build our payment APIs in Go.'
+        jobs = [
+            make_job('Senior Backend Engineer', 'Acme Corp', description, 'senior'),
+            make_job('Intern Backend Engineer', 'Acme Corp', description, 'intern'),
+            make_job('Sr. Backend Engineer', 'Acme Corp Inc.', description, 'senior-again'),
+        ]
+        self.assertEqual([job['id'] for job in dedupe_jobs(jobs)], ['senior', 'intern'])
+
+    def test_max_distance_must_fit_the_bands(self):
+        self.assertEqual(dedupe_jobs([], max_distance=15), [])
+        with self.assertRaises(ValueError):
+            dedupe_jobs([], max_distance=16)
+
+
+class PhraseMatcherTests(SimpleTestCase):
+    def setUp(self):
+        self.taxonomy = SkillTaxonomy({
+            'java': [], 'javascript': ['js'], 'go': ['golang'], 'c++': ['cpp'], 'node.js': ['nodejs'],
+            'kubernetes': ['k8s'], 'machine learning': ['ml'], 'ci/cd': ['continuous integration'],
+        }, 'test')
+
+    def test_matches_fall_on_token_boundaries(self):
+        found = self.taxonomy.extract("Good JavaScript skills; built tooling in Go.")
+        self.assertEqual(found, ['javascript', 'go'])
+
+    def test_punctuated_and_multi_word_skills(self):
+        found = self.taxonomy.extract("C++ and Node.js. Machine learning with CI/CD pipelines.")
+        self.assertEqual(found, ['c++', 'node.js', 'machine learning', 'ci/cd'])
+
+    def test_aliases_map_to_canonical_names(self):
+        found = self.taxonomy.extract("Deployed with K8s, wrote Golang and nodejs, ML and continuous integration")
+        self.assertEqual(found, ['kubernetes', 'go', 'node.js', 'machine learning', 'ci/cd'])
+        self.assertEqual(self.taxonomy.canonical(' K8S '), 'kubernetes')
+        self.assertEqual(self.taxonomy.canonical('Rust'), 'rust')
+
+    def test_payloads_reported_in_text_order(self):
+        matcher = PhraseMatcher()
+        matcher.add('project', 'projects')
+        matcher.add('team', 'team')
+        tokens = tokenize("led a team on a project with another team")
+        self.assertEqual([payload for _, payload in matcher.iter_matches(tokens)], ['team', 'projects', 'team'])
+        self.assertEqual(matcher.find_all(tokens), ['team', 'projects'])
+
+
+def baseline_ats_score(text, skills):
+    """
+    The substring-based ATS scoring the compiled rules replaced, kept to
+    check that the rewrite scores resumes the same way.
+    """
+    text_lower = text.lower()
+    score = 0
+    strengths, weaknesses = [], []
+
+    if 200 <= len(text.split()) <= 2000:
+        score += 10
+        strengths.append("Optimal resume length")
+    else:
+        weaknesses.append("Resume length is outside optimal range (200-2000 words)")
+    if "@" in text:
+        score += 10
+        strengths.append("Email address detected")
+    else:
+        weaknesses.append("Missing email address")
+    if sum(c.isdigit() for c in text) > 9:
+        score += 10
+        strengths.append("Phone number detected")
+    else:
+        weaknesses.append("Missing phone number")
+
+    sections = ["experience", "education", "skills", "summary", "projects"]
+    found_sections = [s for s in sections if s in text_lower]
+    score += (len(found_sections) / len(sections)) * 30
+    if len(found_sections) == len(sections):
+        strengths.append("All key sections detected")
+    else:
+        missing = [s.title() for s in sections if s not in text_lower]
+        weaknesses.append(f"Missing sections: {', '.join(missing)}")
+
+    skill_count = len(skills)
+    if skill_count >= 5:
+        score += 40
+        strengths.append(f"Strong skill presence ({skill_count} skills detected)")
+    elif skill_count > 0:
+        score += (skill_count / 5) * 40
+        weaknesses.append("Could add more relevant technical skills")
+    else:
+        weaknesses.append("No technical skills detected")
+
+    common_roles = {
+        "developer": ["python", "javascript", "react", "node.js", "api", "git", "docker", "aws", "ci/cd", "testing"],
+        "engineer": ["system design", "architecture", "scalability", "microservices", "kubernetes", "devops"],
+        "data": ["sql", "python", "machine learning", "pandas", "visualization", "statistics", "big data"],
+        "manager": ["leadership", "stakeholder management", "agile", "scrum", "roadmap", "kpis", "budgeting"],
+        "designer": ["ui/ux", "figma", "adobe", "wireframing", "prototyping", "user research", "design systems"],
+        "analyst": ["excel", "sql", "data analysis", "reporting", "dashboards", "business intelligence"],
+        "marketing": ["seo", "sem", "content marketing", "analytics", "campaign management", "social media"],
+    }
+    recommended = [
+        "agile", "scrum", "ci/cd", "devops", "cloud", "api", "testing", "debugging", "version control", "git",
+        "collaboration", "problem-solving", "leadership", "communication", "teamwork", "analytical", "creative",
+        "detail-oriented", "time management", "adaptable", "strategic thinking", "improved", "increased",
+        "reduced", "developed", "implemented", "designed", "optimized", "achieved", "led", "managed", "delivered",
+    ]
+    missing_keywords = []
+    detected_role = next((role for role in common_roles if role in text_lower), None)
+    if detected_role:
+        for keyword in common_roles[detected_role]:
+            if keyword not in text_lower and len(missing_keywords) < 10:
+                missing_keywords.append(keyword.title())
+    for keyword in recommended:
+        if keyword not in text_lower and len(missing_keywords) < 15 and keyword.title() not in missing_keywords:
+            missing_keywords.append(keyword.title())
+    if not missing_keywords:
+        missing_keywords = ["Leadership", "Communication", "Problem-Solving", "Teamwork",
+                            "Project Management", "Analytical", "Strategic Thinking", "Innovation"]
+
+    years = [int(y) for y in re.findall(r'(\d+)\s*(?:\+)?\s*years?', text_lower)]
+    years_exp = max(years) if years else 0
+    return int(score), strengths, weaknesses, missing_keywords, years_exp
+
+
+class AtsParityTests(SimpleTestCase):
+    def assert_same_score(self, text, skills):
+        score, breakdown = calculate_ats_score(text, skills)
+        expected_score, strengths, weaknesses, missing_keywords, years_exp = baseline_ats_score(text, skills)
+        self.assertEqual(score, expected_score)
+        self.assertEqual(breakdown['strengths'], strengths)
+        self.assertEqual(breakdown['weaknesses'], weaknesses)
+        self.assertEqual(breakdown['missing_keywords'], missing_keywords)
+        if years_exp:
+            self.assertIn(f" with {years_exp}+ years of experience", breakdown['professional_summary'])
+
+    def test_sample_resumes_score_as_before(self):
+        resumes = sorted(Path(settings.MEDIA_ROOT, 'resumes').glob('*.[pP][dD][fF]'))
+        self.assertTrue(resumes)
+        for path in resumes:
+            with self.subTest(resume=path.name):
+                text = extract_text_from_pdf(str(path))
+                self.assert_same_score(text, extract_skills(text))
+
+    def test_length_and_contact_checks_match_the_old_scoring(self):
+        # Slashes and hyphens do not split words, and digits inside words
+        # count towards a phone number
+        words = ' '.join(['CI/CD', 'problem-solving'] * 100)
+        self.assert_same_score(f"{words} reach me at john123 or python3 4567 89", [])
+        self.assert_same_score(' '.join(['CI/CD'] * 150) + ' 5+ years', ['python'])
+
+
+class AnalysisCacheTests(TestCase):
+    content_hash = 'a' * 64
+    result = {'skills': ['python'], 'ats_score': 70, 'ats_breakdown': {'missing_keywords': ['Git']}}
+
+    def setUp(self):
+        analysis._analysis_cache.clear()
+
+    def test_unknown_resume_misses(self):
+        self.assertIsNone(analysis.get_cached_analysis(self.content_hash))
+
+    def test_stored_analysis_hits(self):
+        analysis.store_analysis(self.content_hash, self.result, resume_path='resumes/cv.pdf')
+        analysis._analysis_cache.clear()
+        expected = dict(self.result, resume='resumes/cv.pdf')
+        self.assertEqual(analysis.get_cached_analysis(self.content_hash), expected)
+        # The second lookup is answered from memory
+        with self.assertNumQueries(0):
+            self.assertEqual(analysis.get_cached_analysis(self.content_hash), expected)
+
+    def test_version_change_invalidates_without_writing(self):
+        analysis.store_analysis(self.content_hash, self.result)
+        with mock.patch.object(analysis, 'get_analysis_version', return_value='next-version'):
+            with self.assertNumQueries(1):
+                self.assertIsNone(analysis.get_cached_analysis(self.content_hash))
+            self.assertEqual(ResumeAnalysis.objects.count(), 1)
+            self.assertEqual(analysis.purge_stale_analyses(), 1)
+        self.assertFalse(ResumeAnalysis.objects.exists())
+
+
+class PdfLimitTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        # Five one-line pages: "page 1 line", "page 2 line", ...
+        text = "\n".join(f"page {number} line" for number in range(1, 6))
+        self.path = write_pdf(str(Path(directory.name, 'resume.pdf')), text, lines_per_page=1)
+
+    def test_page_limit_stops_reading(self):
+        pages = list(iter_pdf_pages(self.path, max_pages=2, max_chars=0))
+        self.assertEqual([page.number for page in pages], [1, 2])
+        text = extract_text_from_pdf(self.path, max_pages=2, max_chars=0)
+        self.assertEqual(text.split(), ['page', '1', 'line', 'page', '2', 'line'])
+
+    def test_char_limit_truncates_the_last_page(self):
+        pages = list(iter_pdf_pages(self.path, max_pages=0, max_chars=15))
+        self.assertEqual([page.number for page in pages], [1, 2])
+        self.assertEqual(sum(len(page.text) for page in pages), 15)
+        self.assertTrue(pages[0].text.startswith("page 1 line"))
+        self.assertTrue("page 2 line".startswith(pages[1].text))
+
+    def test_zero_disables_the_limits(self):
+        self.assertEqual(len(list(iter_pdf_pages(self.path, max_pages=0, max_chars=0))), 5)
+
+    @override_settings(PDF_MAX_PAGES=3, PDF_MAX_CHARS=100000)
+    def test_limits_default_to_settings(self):
+        self.assertEqual([page.number for page in iter_pdf_pages(self.path)], [1, 2, 3])
+
+
+class SimulatorTestCase(SimpleTestCase):
+    """
+    Runs a ProviderSimulator on a free local port for the tests; faults
+    are set per test on self.simulator.faults.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.simulator = ProviderSimulator(load_payloads(), port=0, seed=0)
+        cls.simulator.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.simulator.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.simulator.faults = {}
+        self.adzuna_url = f"{self.simulator.url}/adzuna/jobs/in/search/1"
+
+
+class ProviderDeadlineTests(SimulatorTestCase):
+    def test_deadline_caps_attempts_and_retries(self):
+        self.simulator.faults = {'adzuna': FaultProfile(timeout_rate=1.0, hang_seconds=3)}
+        client = ProviderClient('test-deadline', retries=2, backoff=0.01)
+        started = time.monotonic()
+        with self.assertRaises(requests.Timeout):
+            client.get(self.adzuna_url, timeout=10, deadline=started + 0.3)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(client.stats()['retries'], 0)
+
+    def test_expired_deadline_sends_nothing(self):
+        client = ProviderClient('test-expired', retries=2)
+        with self.assertRaises(requests.Timeout):
+            client.get(self.adzuna_url, timeout=10, deadline=time.monotonic() - 1)
+        self.assertEqual(client.stats()['requests'], 0)
+
+    def test_search_deadline_reports_hung_provider_as_timeout(self):
+        self.simulator.faults = {'adzuna': FaultProfile(timeout_rate=1.0, hang_seconds=3)}
+        url = self.simulator.url
+        with override_settings(
+            ADZUNA_API_URL=f"{url}/adzuna", JSEARCH_API_URL=f"{url}/jsearch/search",
+            REMOTEOK_API_URL=f"{url}/remoteok/api", RAPIDAPI_KEY='simulator', REMOTEOK_SNAPSHOT_PATH='',
+            JOB_CATALOG_ENABLED=False, JOB_PROVIDER_CLIENT={'default': {'retries': 0}},
+        ):
+            # Provider clients are shared per process; start from fresh ones
+            http_client._clients.clear()
+            job_cache.clear()
+            started = time.monotonic()
+            with self.assertLogs('core.utils', 'WARNING') as logs:
+                results = {name: (jobs, status) for name, jobs, status
+                           in iter_provider_jobs(['python', 'django'], deadline=0.5)}
+                elapsed = time.monotonic() - started
+                # The worker thread gives up at the same deadline and logs it
+                while not any('Adzuna API Error' in line for line in logs.output):
+                    self.assertLess(time.monotonic() - started, 2.0)
+                    time.sleep(0.05)
+            http_client._clients.clear()
+            job_cache.clear()
+        self.assertLess(elapsed, 1.5)
+        self.assertEqual(results['adzuna'][1]['status'], 'timeout')
+        self.assertEqual(results['jsearch'][1]['status'], 'ok')
+        self.assertTrue(results['jsearch'][0])
+        self.assertRegex('\n'.join(logs.output), r'(?m)^WARNING:core.utils:adzuna timed out after \d+ ms$')
+
+
+class TTLCacheTests(SimpleTestCase):
+    def setUp(self):
+        clock = mock.patch('core.cache.time')
+        self.time = clock.start()
+        self.addCleanup(clock.stop)
+        self.time.monotonic.return_value = 100.0
+        self.cache = TTLCache(maxsize=2, ttl=10, stale_ttl=5)
+        self.cache.set('jobs', ['job-1'])
+
+    def age(self, seconds):
+        self.time.monotonic.return_value = 100.0 + seconds
+
+    def test_fresh_entry(self):
+        self.age(10)
+        self.assertEqual(self.cache.get('jobs'), (['job-1'], TTLCache.FRESH))
+
+    def test_stale_entry_is_served_and_refreshed_once(self):
+        self.age(12)
+        self.assertEqual(self.cache.get('jobs'), (['job-1'], TTLCache.STALE))
+        self.assertTrue(self.cache.start_refresh('jobs'))
+        self.assertFalse(self.cache.start_refresh('jobs'))
+        self.cache.set('jobs', ['job-2'])
+        self.cache.finish_refresh('jobs')
+        self.assertEqual(self.cache.get('jobs'), (['job-2'], TTLCache.FRESH))
+        self.assertTrue(self.cache.start_refresh('jobs'))
+
+    def test_expired_entry_misses(self):
+        self.age(16)
+        self.assertEqual(self.cache.get('jobs'), (None, None))
+        self.assertEqual(len(self.cache), 0)
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['stale_hits'], stats['misses']), (0, 0, 1))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.set('other', [])
+        self.cache.get('jobs')
+        self.cache.set('third', [])
+        self.assertEqual(self.cache.get('other'), (None, None))
+        self.assertEqual(self.cache.get('jobs')[1], TTLCache.FRESH)
+
+
+REMOTEOK_FEED = [
+    {'id': 1, 'position': 'Frontend Developer', 'tags': ['JavaScript', 'React'],
+     'description': '<p>Build our <b>React</b> app.</p>'},
+    {'id': 2, 'position': 'Backend Developer', 'tags': ['Java'], 'description': 'Spring services.'},
+    {'id': 3, 'position': 'ML Engineer', 'tags': [],
+     'description': 'Machine learning with Python and React dashboards.'},
+    {'id': 4, 'position': 'Data Engineer', 'tags': ['Python'], 'description': 'Learning platform pipelines.'},
+]
+
+
+class RemoteOKIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = RemoteOKIndex(REMOTEOK_FEED)
+
+    def search_ids(self, skills, limit=10):
+        return [job['id'] for job in self.index.search(skills, limit)]
+
+    def test_tags_and_text_tokens_match_whole_words(self):
+        self.assertEqual(self.search_ids(['java']), [2])
+        self.assertEqual(self.search_ids(['react']), [1, 3])
+
+    def test_multi_word_skills_need_every_word(self):
+        self.assertEqual(self.search_ids(['Machine Learning']), [3])
+
+    def test_jobs_matching_more_skills_rank_first(self):
+        self.assertEqual(self.search_ids(['python', 'react']), [3, 1, 4])
+        self.assertEqual(self.search_ids(['python', 'react'], limit=1), [3])
+
+    def test_results_are_normalized(self):
+        job = self.index.search(['java'])[0]
+        self.assertEqual(job['title'], 'Backend Developer')
+        self.assertEqual(job['location'], {'display_name': 'Remote'})
+
+    def test_snapshot_is_loaded_and_expires(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = str(Path(directory.name, 'remoteok.json'))
+        save_snapshot(REMOTEOK_FEED, path)
+        with override_settings(REMOTEOK_SNAPSHOT_PATH=path, REMOTEOK_SNAPSHOT_MAX_AGE=60):
+            remoteok._index_mtime = None
+            self.assertEqual([job['id'] for job in get_remoteok_jobs(['java'])], [2])
+            self.assertIs(remoteok.get_remoteok_index(), remoteok.get_remoteok_index())
+        with override_settings(REMOTEOK_SNAPSHOT_PATH=path, REMOTEOK_SNAPSHOT_MAX_AGE=1):
+            with mock.patch.object(remoteok.time, 'time', return_value=time.time() + 10):
+                self.assertIsNone(remoteok.get_remoteok_index())
+
+
+class RemoteOKFeedFallbackTests(SimulatorTestCase):
+    def test_live_feed_is_searched_like_a_snapshot(self):
+        with override_settings(REMOTEOK_API_URL=f"{self.simulator.url}/remoteok/api", REMOTEOK_SNAPSHOT_PATH=''):
+            http_client._clients.clear()
+            feed = fetch_remoteok_feed()
+            jobs = get_remoteok_jobs(['python', 'react'])
+            http_client._clients.clear()
+        self.assertGreater(len(feed), 20)
+        self.assertTrue(jobs)
+        self.assertEqual(jobs, RemoteOKIndex(feed).search(['python', 'react']))
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+    def test_half_open_lets_one_trial_through(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0.01)
+        for _ in range(5):
+            breaker.record_failure()
+        time.sleep(0.02)
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+    def test_abandoned_trial_times_out(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01, half_open_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.02)
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow_request())
+
+
+class ProviderClientTests(SimulatorTestCase):
+    def test_retries_server_errors_then_gives_up(self):
+        self.simulator.faults = {'adzuna': FaultProfile(error_rate=1.0)}
+        client = ProviderClient('test-retries', retries=2, backoff=0.01)
+        response = client.get(self.adzuna_url, timeout=5)
+        self.assertEqual(response.status_code, 503)
+        stats = client.stats()
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['retries'], 2)
+
+    def test_breaker_rejects_without_a_request(self):
+        self.simulator.faults = {'adzuna': FaultProfile(error_rate=1.0)}
+        client = ProviderClient('test-breaker', retries=0, failure_threshold=2, reset_timeout=60)
+        client.get(self.adzuna_url, timeout=5)
+        client.get(self.adzuna_url, timeout=5)
+        with self.assertRaises(CircuitOpenError):
+            client.get(self.adzuna_url, timeout=5)
+        self.assertEqual(client.stats()['requests'], 2)
+        self.assertEqual(client.stats()['rejected'], 1)
+
+    def test_healthy_provider_keeps_the_circuit_closed(self):
+        client = ProviderClient('test-healthy', retries=2)
+        for _ in range(3):
+            self.assertEqual(client.get(self.adzuna_url, timeout=5).status_code, 200)
+        stats = client.stats()
+        self.assertEqual((stats['circuit'], stats['requests'], stats['retries']), (CircuitBreaker.CLOSED, 3, 0))
+
+    def test_cancelled_half_open_trial_reopens_the_breaker(self):
+        self.simulator.faults = {'adzuna': FaultProfile(timeout_rate=1.0, hang_seconds=3)}
+        client = ProviderClient('test-cancel', retries=0, failure_threshold=1, reset_timeout=0.01)
+        client.breaker.record_failure()
+        time.sleep(0.02)
+
+        async def cancel_trial():
+            task = asyncio.ensure_future(AsyncProviderClient(client).get(self.adzuna_url, timeout=10))
+            await asyncio.sleep(0.2)
+            self.assertEqual(client.breaker.state, CircuitBreaker.HALF_OPEN)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_trial())
+        self.assertEqual(client.breaker.state, CircuitBreaker.OPEN)
+        time.sleep(0.02)
+        self.assertTrue(client.breaker.allow_request())
+
+    def test_loop_clients_are_closed_with_their_loop(self):
+        self.addCleanup(http_client._clients.pop, 'test-loop', None)
+
+        async def fetch():
+            client = http_client.get_async_provider_client('test-loop')
+            self.assertIs(http_client.get_async_provider_client('test-loop'), client)
+            self.assertEqual((await client.get(self.adzuna_url, timeout=5)).status_code, 200)
+            return client
+
+        with mock.patch.object(httpx.AsyncClient, 'aclose', autospec=True,
+                               side_effect=httpx.AsyncClient.aclose) as aclose:
+            client = asyncio.run(fetch())
+        aclose.assert_called_once_with(client.session)
+        self.assertEqual(len(http_client._loop_objects), 0)
+
+    def test_async_jobs_view_answers_like_the_sync_view(self):
+        url = self.simulator.url
+        with override_settings(
+            ADZUNA_API_URL=f"{url}/adzuna", JSEARCH_API_URL=f"{url}/jsearch/search",
+            REMOTEOK_API_URL=f"{url}/remoteok/api", RAPIDAPI_KEY='simulator', REMOTEOK_SNAPSHOT_PATH='',
+            JOB_CATALOG_ENABLED=False, JOB_IDF_PATH='',
+        ):
+            body = json.dumps({'skills': ['python', 'django']})
+            responses = []
+            with self.assertLogs('core.utils', 'INFO') as logs:
+                for post in (self.client.post, async_to_sync(self.async_client.post)):
+                    job_cache.clear()
+                    responses.append(post('/core/jobs/async/' if responses else '/core/jobs/', body,
+                                          content_type='application/json').json())
+            job_cache.clear()
+        sync_data, async_data = responses
+        self.assertEqual(sum('Total unique jobs' in line for line in logs.output), 2)
+        self.assertEqual({name: status['status'] for name, status in async_data['providers'].items()},
+                         {'adzuna': 'ok', 'jsearch': 'ok', 'remoteok': 'ok'})
+        self.assertTrue(async_data['jobs'])
+        self.assertEqual([job['id'] for job in async_data['jobs']], [job['id'] for job in sync_data['jobs']])
+
+
+@override_settings(JOB_IDF_PATH='')
+class RankJobsTests(SimpleTestCase):
+    def setUp(self):
+        self.jobs = [
+            make_job('Office Manager', 'Initech', 'Run the office and manage vendors.', 'job-1'),
+            make_job('Django Developer', 'Globex', 'Build REST APIs with Django and PostgreSQL.', 'job-2'),
+            make_job('Python Engineer', 'Acme Corp', 'Python services, Django admin and machine learning.', 'job-3'),
+        ]
+
+    def test_jobs_are_ordered_by_relevance(self):
+        ranked = rank_jobs(self.jobs, ['Python', 'Django', 'Machine Learning'])
+        self.assertEqual([job['id'] for job in ranked], ['job-3', 'job-2', 'job-1'])
+        self.assertEqual(ranked[0]['relevance']['matched_terms'], ['Python', 'Django', 'Machine Learning'])
+        self.assertEqual(ranked[1]['relevance']['matched_terms'], ['Django'])
+        self.assertEqual(ranked[2]['relevance'], {'score': 0.0, 'matched_terms': []})
+
+    def test_input_jobs_are_not_mutated(self):
+        originals = [dict(job) for job in self.jobs]
+        rank_jobs(self.jobs, ['python'])
+        self.assertEqual(self.jobs, originals)
+        self.assertTrue(all('relevance' not in job for job in self.jobs))
+
+    def test_edited_description_is_not_served_from_the_term_cache(self):
+        job = make_job('Backend Developer', 'Globex', 'Write Python services.', 'job-4')
+        self.assertEqual(rank_jobs([job], ['python'])[0]['relevance']['matched_terms'], ['python'])
+        # Same id, title and description length
+        edited = dict(job, description='Write Golang services.')
+        self.assertEqual(rank_jobs([edited], ['python'])[0]['relevance']['matched_terms'], [])
+
+
+def make_task(status=AnalysisTask.PENDING, age=0, **fields):
+    created = timezone.now() - timedelta(seconds=age)
+    return AnalysisTask.objects.create(
+        content_hash='c' * 64, resume='resumes/Resume.PDF', status=status, available_at=created, **fields)
+
+
+@override_settings(ANALYSIS_TASK_TIMEOUT=300, ANALYSIS_TASK_MAX_ATTEMPTS=2, ANALYSIS_TASK_RETRY_BACKOFF=5)
+class AnalysisQueueTests(TestCase):
+    def test_oldest_runnable_task_is_claimed_once(self):
+        newer = make_task(age=5)
+        older = make_task(age=10)
+        make_task(age=-60)  # waiting out a retry delay
+
+        task = claim_next_task('worker-1')
+        self.assertEqual((task.pk, task.status, task.attempts, task.worker),
+                         (older.pk, AnalysisTask.RUNNING, 1, 'worker-1'))
+        self.assertEqual(task.heartbeat_at, task.started_at)
+        self.assertEqual(claim_next_task('worker-2').pk, newer.pk)
+        self.assertIsNone(claim_next_task('worker-3'))
+
+    def test_failures_are_retried_with_backoff_then_fail(self):
+        make_task()
+        with mock.patch('core.tasks.analyze_stored_resume', side_effect=OSError('disk full')), \
+                self.assertLogs('core.tasks', 'WARNING'):
+            task = run_task(claim_next_task('worker-1'))
+            self.assertEqual((task.status, task.error), (AnalysisTask.PENDING, 'disk full'))
+            delay = (task.available_at - timezone.now()).total_seconds()
+            self.assertTrue(4 < delay <= 5, delay)
+            self.assertIsNone(claim_next_task('worker-1'))
+
+            AnalysisTask.objects.filter(pk=task.pk).update(available_at=timezone.now())
+            task = run_task(claim_next_task('worker-1'))
+        self.assertEqual((task.status, task.attempts), (AnalysisTask.FAILED, 2))
+        self.assertIsNotNone(task.finished_at)
+
+    def test_successful_task_stores_the_result_on_the_profile(self):
+        user = User.objects.create_user('queued', password='secret-password')
+        make_task(user=user)
+        task = run_task(claim_next_task('worker-1'))
+        self.assertEqual(task.status, AnalysisTask.DONE)
+        profile = UserProfile.objects.get(user=user)
+        self.assertEqual(task.result['ats_score'], profile.ats_score)
+        self.assertEqual(task.result['skills'], profile.skills)
+
+    def test_lost_task_is_reclaimed(self):
+        lost = make_task(AnalysisTask.RUNNING, age=600, attempts=1, worker='dead',
+                         heartbeat_at=timezone.now() - timedelta(seconds=301))
+        task = claim_next_task('worker-2')
+        self.assertEqual((task.pk, task.attempts, task.worker), (lost.pk, 2, 'worker-2'))
+
+    def test_lost_task_out_of_attempts_fails(self):
+        lost = make_task(AnalysisTask.RUNNING, age=600, attempts=2, worker='dead',
+                         heartbeat_at=timezone.now() - timedelta(seconds=301))
+        self.assertIsNone(claim_next_task('worker-2'))
+        lost.refresh_from_db()
+        self.assertEqual(lost.status, AnalysisTask.FAILED)
+        self.assertIn('attempt 2', lost.error)
+
+    def test_task_with_a_live_heartbeat_is_left_alone(self):
+        make_task(AnalysisTask.RUNNING, age=600, attempts=1, worker='busy',
+                  heartbeat_at=timezone.now() - timedelta(seconds=60))
+        self.assertIsNone(claim_next_task('worker-2'))
+
+
+class AnalysisLeaseTests(TransactionTestCase):
+    @override_settings(ANALYSIS_TASK_TIMEOUT=0.6)
+    def test_running_task_renews_its_lease(self):
+        make_task()
+        task = claim_next_task('worker-1')
+        with keep_lease(task):
+            # Longer than the lease
+            time.sleep(0.7)
+        task.refresh_from_db()
+        self.assertGreater(task.heartbeat_at, task.started_at + timedelta(seconds=0.3))
+        self.assertIsNone(claim_next_task('worker-2'))
+
+
+def observed_requests(view):
+    state = request_duration._values.get((view, '200'))
+    return state[2] if state else 0
+
+
+class TimedViewTests(SimpleTestCase):
+    def test_response_gets_server_timing(self):
+        @timed_view('test_plain')
+        def view(request):
+            with request.timer.stage('work'):
+                pass
+            return JsonResponse({})
+
+        response = view(RequestFactory().get('/'))
+        self.assertRegex(response['Server-Timing'], r'^work;dur=[\d.]+, total;dur=[\d.]+$')
+        self.assertEqual(observed_requests('test_plain'), 1)
+
+    def test_stream_is_timed_when_it_finishes(self):
+        @timed_view('test_stream')
+        def view(request):
+            def stream():
+                yield 'first\n'
+                time.sleep(0.05)
+                yield 'last\n'
+            return StreamingHttpResponse(stream())
+
+        response = view(RequestFactory().get('/'))
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(observed_requests('test_stream'), 0)
+        self.assertEqual(b''.join(response.streaming_content), b'first\nlast\n')
+        self.assertEqual(observed_requests('test_stream'), 1)
+        self.assertGreaterEqual(request_duration._values[('test_stream', '200')][1], 0.05)
+
+    def test_async_stream_is_timed_when_it_finishes(self):
+        @timed_view('test_async_stream')
+        async def view(request):
+            async def stream():
+                yield 'only\n'
+            return StreamingHttpResponse(stream())
+
+        async def consume():
+            response = await view(RequestFactory().get('/'))
+            return b''.join([chunk async for chunk in response.streaming_content])
+
+        self.assertEqual(asyncio.run(consume()), b'only\n')
+        self.assertEqual(observed_requests('test_async_stream'), 1)
+
+
+class SavedJobsApiTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('saver', password='secret-password')
+        self.client.force_login(self.user)
+
+    def save_jobs(self, count):
+        for i in range(count):
+            SavedJob.objects.create(user=self.user, job_id=f"job-{i}", job_title=f"Job {i}", company='Acme')
+
+    def test_cursor_pages_cover_every_job_once(self):
+        self.save_jobs(5)
+        ids = []
+        cursor = ''
+        while True:
+            data = self.client.get('/core/saved-jobs/', {'limit': 2, 'cursor': cursor}).json()
+            self.assertLessEqual(len(data['jobs']), 2)
+            ids += [job['id'] for job in data['jobs']]
+            if not data['has_more']:
+                break
+            cursor = data['next_cursor']
+        expected = list(SavedJob.objects.filter(user=self.user).order_by('-saved_at', '-id')
+                        .values_list('job_id', flat=True))
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(set(ids)), 5)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get('/core/saved-jobs/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_unchanged_page_answers_304(self):
+        self.save_jobs(3)
+        response = self.client.get('/core/saved-jobs/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertEqual(self.client.get('/core/saved-jobs/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        SavedJob.objects.filter(job_id='job-0').delete()
+        self.assertEqual(self.client.get('/core/saved-jobs/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_removal_is_not_hidden_by_if_modified_since(self):
+        self.save_jobs(3)
+        response = self.client.get('/core/saved-jobs/')
+        self.assertFalse(response.has_header('Last-Modified'))
+
+        # Removing an older job leaves the newest saved_at as it was
+        SavedJob.objects.filter(job_id='job-0').delete()
+        since = 'Fri, 01 Jan 2100 00:00:00 GMT'
+        response = self.client.get('/core/saved-jobs/', HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['jobs']), 2)
+
+    def test_bulk_save_and_unsave_outcomes(self):
+        self.save_jobs(2)
+        items = [
+            {'job_id': 'new-1', 'action': 'save', 'job_title': 'Python Developer', 'company': 'Globex'},
+            {'job_id': 'job-0', 'action': 'save'},
+            {'job_id': 'job-1', 'action': 'unsave'},
+            {'job_id': 'missing', 'action': 'unsave'},
+            {'job_id': 'new-2', 'action': 'save'},
+            {'job_id': 'new-2', 'action': 'unsave'},
+            {'action': 'save'},
+        ]
+        response = self.client.post('/core/save-jobs/bulk/', json.dumps({'items': items}),
+                                    content_type='application/json')
+        data = response.json()
+        self.assertEqual([result['outcome'] for result in data['results']],
+                         ['saved', 'already_saved', 'removed', 'not_saved', 'duplicate', 'not_saved', 'invalid'])
+        self.assertEqual((data['saved'], data['removed']), (1, 1))
+        self.assertEqual(set(SavedJob.objects.filter(user=self.user).values_list('job_id', flat=True)),
+                         {'new-1', 'job-0'})
+        self.assertEqual(SavedJob.objects.get(job_id='new-1').job_title, 'Python Developer')
+
+    def test_bulk_rejects_empty_and_oversized_requests(self):
+        response = self.client.post('/core/save-jobs/bulk/', json.dumps({'items': []}),
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        with override_settings(SAVED_JOBS_BULK_MAX_ITEMS=2):
+            items = [{'job_id': str(i), 'action': 'save'} for i in range(3)]
+            response = self.client.post('/core/save-jobs/bulk/', json.dumps({'items': items}),
+                                        content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(TRANSLATOR_CLASS='core.translation.LocalTranslator', TRANSLATOR_STUB_DELAY=0.01)
+
+
+@override_settings(TRANSLATOR_CLASS='core.translation.LocalTranslator', TRANSLATOR_STUB_DELAY=0.01)
+class StreamedTranslationTests(TransactionTestCase):
+    def setUp(self):
+        # Unique texts, so no piece comes from the translation caches
+        self.paragraphs = [f"{self._testMethodName} paragraph {i}: design, build and run services."
+                           for i in range(6)]
+        self.body = json.dumps({'text': '\n\n'.join(self.paragraphs), 'target_language': 'hi'})
+
+    def assert_translated_in_order(self, content):
+        lines = [json.loads(line) for line in content.decode().splitlines()]
+        self.assertEqual(lines[-1], {'done': True, 'target_language': 'hi'})
+        pieces = lines[:-1]
+        self.assertEqual([piece['index'] for piece in pieces], list(range(len(pieces))))
+        self.assertEqual(''.join(piece['text'] for piece in pieces),
+                         '\n\n'.join(f"[hi] {paragraph}" for paragraph in self.paragraphs))
+
+    def test_pieces_arrive_in_order(self):
+        response = self.client.post('/core/translate/stream/', self.body, content_type='application/json')
+        self.assertFalse(response.is_async)
+        self.assert_translated_in_order(b''.join(response.streaming_content))
+
+    async def test_asgi_request_streams_from_the_event_loop(self):
+        response = await self.async_client.post('/core/translate/stream/', self.body,
+                                                content_type='application/json')
+        # A sync iterator would be buffered whole by the ASGI handler
+        self.assertTrue(response.is_async)
+        self.assert_translated_in_order(b''.join([chunk async for chunk in response.streaming_content]))
+
+
+class CandidateSearchTests(TestCase):
+    SKILLS = ['python', 'django', 'react', 'sql', 'docker', 'aws', 'java', 'kubernetes']
+
+    def setUp(self):
+        rng = random.Random(0)
+        for i in range(40):
+            user = User.objects.create_user(f"candidate-{i}")
+            profile = UserProfile.objects.create(user=user, ats_score=rng.randint(0, 100),
+                                                 skills=rng.sample(self.SKILLS, rng.randint(0, 5)))
+            sync_profile_skills(profile)
+
+    def brute_force(self, all_skills=(), any_skills=(), min_ats=0):
+        skills = {}
+        scores = {}
+        for row in ProfileSkill.objects.values('profile_id', 'skill', 'ats_score'):
+            skills.setdefault(row['profile_id'], set()).add(row['skill'])
+            scores[row['profile_id']] = row['ats_score']
+        matches = [profile_id for profile_id, have in skills.items()
+                   if set(all_skills) <= have and (not any_skills or have & set(any_skills))
+                   and scores[profile_id] >= min_ats]
+        return sorted(matches, key=lambda profile_id: (-scores[profile_id], -profile_id))
+
+    def assert_matches_scan(self, **query):
+        expected = self.brute_force(**query)
+        result = search_candidates(**query, limit=100)
+        self.assertEqual([candidate['profile_id'] for candidate in result['candidates']], expected)
+        self.assertEqual((result['total'], result['total_exact']), (len(expected), True))
+
+    def test_all_skills_match_a_scan(self):
+        for all_skills in (['python'], ['python', 'django'], ['react', 'sql', 'aws']):
+            for min_ats in (0, 50):
+                with self.subTest(all_skills=all_skills, min_ats=min_ats):
+                    self.assert_matches_scan(all_skills=all_skills, min_ats=min_ats)
+
+    def test_any_skills_match_a_scan(self):
+        for any_skills in (['java'], ['python', 'react'], self.SKILLS):
+            for min_ats in (0, 50):
+                with self.subTest(any_skills=any_skills, min_ats=min_ats):
+                    self.assert_matches_scan(any_skills=any_skills, min_ats=min_ats)
+                    # Past the count limit the search walks profiles by score instead
+                    with override_settings(CANDIDATE_SEARCH_COUNT_LIMIT=3):
+                        expected = self.brute_force(any_skills=any_skills, min_ats=min_ats)
+                        result = search_candidates(any_skills=any_skills, min_ats=min_ats, limit=100)
+                        self.assertEqual([c['profile_id'] for c in result['candidates']], expected)
+
+    def test_all_and_any_skills_combined(self):
+        self.assert_matches_scan(all_skills=['python'], any_skills=['docker', 'aws'], min_ats=20)
+
+    def test_pages_follow_the_scan_order(self):
+        expected = self.brute_force(any_skills=['python', 'sql'])
+        pages = [search_candidates(any_skills=['python', 'sql'], limit=5, offset=offset)['candidates']
+                 for offset in range(0, len(expected), 5)]
+        self.assertEqual([candidate['profile_id'] for page in pages for candidate in page], expected)
+
+
+class RecommendationRefreshTests(TestCase):
+    SKILLS = ['python', 'django', 'react', 'sql', 'docker', 'aws', 'java', 'kubernetes']
+
+    def setUp(self):
+        self.rng = random.Random(0)
+        for i in range(12):
+            user = User.objects.create_user(f"reader-{i}")
+            UserProfile.objects.create(user=user, skills=self.rng.sample(self.SKILLS, self.rng.randint(1, 4)))
+        self.record_jobs(range(30))
+
+    def job(self, i, version=0):
+        skills = random.Random(f"{i}-{version}").sample(self.SKILLS, 3)
+        return {'id': str(i), 'title': f"{skills[0].title()} developer",
+                'description': f"We use {', '.join(skills)} every day."}
+
+    def record_jobs(self, ids, version=0):
+        record_job_postings('test', [self.job(i, version) for i in ids])
+
+    def stored(self):
+        return list(JobRecommendation.objects.order_by('user_id', 'rank')
+                    .values_list('user_id', 'posting__job_id', 'rank', 'score', 'matched_skills'))
+
+    def assert_incremental_equals_full(self):
+        run = refresh_recommendations(top_k=5)
+        self.assertFalse(run.full)
+        incremental = self.stored()
+        refresh_recommendations(full=True, top_k=5)
+        self.assertEqual(incremental, self.stored())
+        return run
+
+    def test_incremental_refresh_equals_full_recompute(self):
+        refresh_recommendations(top_k=5)
+        top = self.stored()[0]
+
+        with self.subTest('expired job'):
+            # The user whose top job expires gets the list refilled
+            JobPosting.objects.filter(job_id=top[1]).update(seen_at=timezone.now() - timedelta(days=60))
+            self.assertEqual(self.assert_incremental_equals_full().jobs_removed, 1)
+        with self.subTest('changed jobs'):
+            self.record_jobs(range(0, 30, 3), version=1)
+            self.assert_incremental_equals_full()
+        with self.subTest('changed profile'):
+            profile = UserProfile.objects.get(user_id=top[0])
+            profile.skills = ['kubernetes', 'java']
+            profile.save()
+            self.assert_incremental_equals_full()
+        with self.subTest('new jobs'):
+            self.record_jobs(range(30, 40))
+            self.assert_incremental_equals_full()
+
+
+class ReanalyzeProfilesTests(TestCase):
+    texts = {
+        'b' * 64: "Summary\nBackend developer.\nSkills\nPython, Django, SQL and Docker.\nExperience\n2019-2024",
+        'c' * 64: "Skills\nJava, Kubernetes and AWS.\nEducation\nB.Tech 2018",
+    }
+
+    def setUp(self):
+        analysis._analysis_cache.clear()
+        stale = {'skills': ['cobol'], 'ats_score': 10, 'ats_breakdown': {}}
+        for content_hash, text in self.texts.items():
+            analysis.store_resume_text(content_hash, text)
+            analysis.store_analysis(content_hash, stale)
+        # Two profiles share the first resume
+        for i, content_hash in enumerate(['b' * 64, 'b' * 64, 'c' * 64]):
+            user = User.objects.create_user(f"analyzed-{i}")
+            analysis.update_profile_analysis(user, f"resumes/{i}.pdf", stale, content_hash)
+
+    def test_version_bump_updates_rows_in_place(self):
+        with mock.patch.object(analysis, 'get_analysis_version', return_value='next-version'):
+            profile_ids = list(analysis.stale_profiles().values_list('id', flat=True))
+            self.assertEqual(len(profile_ids), 3)
+            for _ in range(2):
+                self.assertEqual(analysis.reanalyze_profiles(profile_ids), {'text': 3, 'pdf': 0, 'missing': 0})
+            self.assertFalse(analysis.stale_profiles().exists())
+
+        self.assertEqual(ResumeAnalysis.objects.count(), 2)
+        for content_hash, text in self.texts.items():
+            expected = analysis.analyze_text(text)
+            row = ResumeAnalysis.objects.get(content_hash=content_hash)
+            self.assertEqual((row.version, row.skills, row.ats_score), ('next-version', expected['skills'],
+                                                                        expected['ats_score']))
+            for profile in UserProfile.objects.filter(resume_hash=content_hash):
+                self.assertEqual(profile.skills, expected['skills'])
+                self.assertEqual(sorted(profile.skill_index.values_list('skill', flat=True)),
+                                 sorted(normalize_skills(expected['skills'])))
+        self.assertEqual(ProfileSkill.objects.filter(skill='cobol').count(), 0)
+
+
+@override_settings(TRANSLATOR_CLASS='core.translation.LocalTranslator')
+class AsyncTranslationViewTests(TransactionTestCase):
+    async def test_async_view_translates_like_the_sync_view(self):
+        body = json.dumps({'text': 'Design, build and run backend services.', 'target_language': 'hi'})
+        response = await self.async_client.post('/core/translate/async/', body, content_type='application/json')
+        self.assertEqual(response.json(), {'success': True, 'target_language': 'hi',
+                                           'translated_text': '[hi] Design, build and run backend services.'})
+        response = await self.async_client.post('/core/translate/async/', json.dumps({'text': ''}),
+                                                content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+class JobsStreamViewTests(SimulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        url = self.simulator.url
+        self.provider_settings = override_settings(
+            ADZUNA_API_URL=f"{url}/adzuna", JSEARCH_API_URL=f"{url}/jsearch/search",
+            REMOTEOK_API_URL=f"{url}/remoteok/api", RAPIDAPI_KEY='simulator', REMOTEOK_SNAPSHOT_PATH='',
+            JOB_CATALOG_ENABLED=False, JOB_IDF_PATH='', JOB_PROVIDER_CLIENT={'default': {'retries': 0}},
+        )
+        self.provider_settings.enable()
+        self.addCleanup(self.provider_settings.disable)
+        # Provider clients are shared per process; start from fresh ones
+        for cleanup in (http_client._clients.clear, job_cache.clear):
+            cleanup()
+            self.addCleanup(cleanup)
+        self.body = json.dumps({'skills': ['python', 'django']})
+
+    def assert_ndjson(self, content, timed_out=()):
+        lines = [json.loads(line) for line in content.decode().splitlines()]
+        done = lines.pop()
+        self.assertEqual(sorted(line['provider'] for line in lines), ['adzuna', 'jsearch', 'remoteok'])
+        self.assertEqual(done, {
+            'done': True,
+            'total': sum(len(line['jobs']) for line in lines),
+            'providers': {line['provider']: line['status'] for line in lines},
+            'timed_out': list(timed_out),
+        })
+        return {line['provider']: line for line in lines}
+
+    def test_one_line_per_provider_then_done(self):
+        with self.assertLogs('core.utils', 'INFO'):
+            response = self.client.post('/core/jobs/stream/', self.body, content_type='application/json')
+            self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+            lines = self.assert_ndjson(b''.join(response.streaming_content))
+        self.assertTrue(all(line['status']['status'] == 'ok' for line in lines.values()))
+        self.assertTrue(lines['adzuna']['jobs'])
+
+    async def test_asgi_stream_reports_a_hung_provider(self):
+        self.simulator.faults = {'adzuna': FaultProfile(timeout_rate=1.0, hang_seconds=3)}
+        with override_settings(JOB_SEARCH_DEADLINE=0.5), self.assertLogs('core.utils', 'INFO'):
+            response = await self.async_client.post('/core/jobs/stream/', self.body,
+                                                    content_type='application/json')
+            self.assertTrue(response.is_async)
+            lines = self.assert_ndjson(b''.join([chunk async for chunk in response.streaming_content]),
+                                       timed_out=['adzuna'])
+        self.assertEqual((lines['adzuna']['status']['status'], lines['adzuna']['jobs']), ('timeout', []))
+        self.assertEqual(lines['jsearch']['status']['status'], 'ok')
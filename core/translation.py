@@ -0,0 +1,352 @@
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils.module_loading import import_string
+
+from .cache import LRUCache
+from .http_client import get_loop_object
+from .models import TranslationCache
+
+# googletrans rejects requests much above 5000 characters; the limit is
+# applied to UTF-8 bytes so non-Latin text stays well inside it
+MAX_CHUNK_BYTES = 4500
+
+# Paragraphs are the unit of caching, so a paragraph shared by several job
+# descriptions (company blurb, benefits, boilerplate) is translated once
+PARAGRAPH_BREAK_RE = re.compile(r"(\n\s*\n)")
+# Split points after sentence ends: terminal punctuation (including the
+# Devanagari danda) and one whitespace character, kept with the sentence
+SENTENCE_END_RE = re.compile(r"(?<=[.!?\u0964]\s)")
+WORD_BREAK_RE = re.compile(r"(?<=\s)(?=\S)")
+
+_translation_cache = LRUCache(maxsize=getattr(settings, 'TRANSLATION_CACHE_SIZE', 2048))
+_db_stats = {'hits': 0, 'misses': 0, 'translated': 0}
+_stats_lock = threading.Lock()
+
+# Chunks of one text are translated in parallel on this pool; its size
+# bounds the concurrent translator requests of the whole process
+_translation_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'TRANSLATION_WORKERS', 4),
+    thread_name_prefix='translate',
+)
+_translators = threading.local()
+
+
+class LocalTranslator:
+    """
+    Offline stand-in with the googletrans interface, for tests and load
+    tests (TRANSLATOR_CLASS = 'core.translation.LocalTranslator').
+    Waits TRANSLATOR_STUB_DELAY seconds per call and tags the text with the
+    target language instead of translating it.
+    """
+
+    def __init__(self):
+        self.delay = getattr(settings, 'TRANSLATOR_STUB_DELAY', 0.0)
+
+    def translate(self, text, dest='en'):
+        time.sleep(self.delay)
+        return SimpleNamespace(text=f"[{dest}] {text}", dest=dest)
+
+    async def atranslate(self, text, dest='en'):
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(text=f"[{dest}] {text}", dest=dest)
+
+
+def get_translator():
+    """
+    Returns this thread's translator client (TRANSLATOR_CLASS, googletrans
+    by default). Clients are reused, not created per call, which set up a
+    new HTTP connection and TLS handshake for every translation.
+    """
+    translator = getattr(_translators, 'translator', None)
+    if translator is None:
+        translator = _translators.translator = _translator_class()()
+    return translator
+
+
+def _translator_class():
+    return import_string(getattr(settings, 'TRANSLATOR_CLASS', 'googletrans.Translator'))
+
+
+def get_async_translator():
+    """
+    Returns the running event loop's translator client when TRANSLATOR_CLASS
+    has a non-blocking atranslate(text, dest) coroutine (and does not turn
+    it off with async_supported = False), otherwise None.
+    """
+    translator_class = _translator_class()
+    if not hasattr(translator_class, 'atranslate') or not getattr(translator_class, 'async_supported', True):
+        return None
+    return get_loop_object(('translator', translator_class), translator_class)
+
+
+def _count(name):
+    with _stats_lock:
+        _db_stats[name] += 1
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def get_cached_translation(text, target_language):
+    """
+    Returns the cached translation of text, or None.
+    The in-process LRU is checked before the database; a failed database
+    read counts as a miss.
+    """
+    key = (text_hash(text), target_language)
+    translated = _translation_cache.get(key)
+    if translated is not None:
+        return translated
+
+    try:
+        row = TranslationCache.objects.filter(text_hash=key[0], target_language=target_language).first()
+    except DatabaseError as e:
+        print(f"Error reading translation cache: {e}")
+        row = None
+    if row is None:
+        _count('misses')
+        return None
+    _count('hits')
+    _translation_cache.set(key, row.translated_text)
+    return row.translated_text
+
+
+def store_translation(text, target_language, translated):
+    key = (text_hash(text), target_language)
+    _translation_cache.set(key, translated)
+    try:
+        # A single INSERT OR IGNORE: no read-then-write transaction, so
+        # concurrent chunk workers do not trip over SQLite's write lock
+        TranslationCache.objects.bulk_create([
+            TranslationCache(text_hash=key[0], target_language=target_language, translated_text=translated)
+        ], ignore_conflicts=True)
+    except DatabaseError as e:
+        # The memory tier still has it; the database tier is best effort
+        print(f"Error storing translation: {e}")
+
+
+def _utf8_len(text):
+    return len(text.encode('utf-8'))
+
+
+def _pack(units, max_bytes):
+    """
+    Greedily joins consecutive units into chunks of at most max_bytes.
+    """
+    chunks = []
+    current = ''
+    for unit in units:
+        if current and _utf8_len(current) + _utf8_len(unit) > max_bytes:
+            chunks.append(current)
+            current = ''
+        current += unit
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _split_long(text, max_bytes):
+    """
+    Splits text over max_bytes at sentence ends, then at word breaks for
+    sentences that are still too long, and as a last resort anywhere.
+    """
+    units = []
+    for sentence in SENTENCE_END_RE.split(text):
+        if _utf8_len(sentence) <= max_bytes:
+            units.append(sentence)
+            continue
+        for word in WORD_BREAK_RE.split(sentence):
+            while _utf8_len(word) > max_bytes:
+                cut = len(word.encode('utf-8')[:max_bytes].decode('utf-8', 'ignore'))
+                units.append(word[:cut])
+                word = word[cut:]
+            units.append(word)
+    return _pack(units, max_bytes)
+
+
+def split_chunks(text, max_bytes=MAX_CHUNK_BYTES):
+    """
+    Splits text into pieces of at most max_bytes UTF-8 bytes, first at
+    paragraph breaks, then at sentence ends inside long paragraphs.
+    Returns (piece, translate) pairs; paragraph breaks and blank pieces are
+    kept as they are so the translation keeps the original layout, and
+    joining the pieces gives back the text.
+    """
+    pieces = []
+    for part in PARAGRAPH_BREAK_RE.split(text):
+        if not part.strip():
+            pieces.append((part, False))
+        elif _utf8_len(part) <= max_bytes:
+            pieces.append((part, True))
+        else:
+            pieces.extend((chunk, True) for chunk in _split_long(part, max_bytes))
+    return pieces
+
+
+def translate_chunk(chunk, target_language):
+    """
+    Translates one chunk, served from the cache when any earlier text
+    contained the same chunk. Surrounding whitespace is kept as is.
+    """
+    core = chunk.strip()
+    if not core:
+        return chunk
+    translated = get_cached_translation(core, target_language)
+    if translated is None:
+        translated = get_translator().translate(core, dest=target_language).text
+        _count('translated')
+        store_translation(core, target_language, translated)
+    start = chunk.index(core[0])
+    return chunk[:start] + translated + chunk[start + len(core):]
+
+
+def iter_translation(text, target_language):
+    """
+    Yields the translation of text piece by piece, in order. Uncached
+    chunks are translated concurrently on the translation pool, and each
+    piece is yielded as soon as it and all pieces before it are ready, so
+    the first piece arrives after one chunk's round trip.
+    A chunk that fails to translate is yielded untranslated.
+    """
+    # Skip translation if text is too short or target is English
+    if not text or len(text.strip()) < 10 or target_language == 'en':
+        yield text
+        return
+
+    translated = get_cached_translation(text, target_language)
+    if translated is not None:
+        yield translated
+        return
+
+    pieces = split_chunks(text)
+    parallel = sum(1 for _, translate in pieces if translate) > 1
+    results = []
+    for piece, translate in pieces:
+        if not translate:
+            results.append(piece)
+        elif parallel:
+            results.append(_translation_executor.submit(translate_chunk, piece, target_language))
+        else:
+            results.append(None)
+
+    translated = []
+    failed = False
+    for (piece, translate), result in zip(pieces, results):
+        if translate:
+            try:
+                result = result.result() if parallel else translate_chunk(piece, target_language)
+            except Exception as e:
+                print(f"Translation error: {e}")
+                result = piece
+                failed = True
+        translated.append(result)
+        yield result
+
+    if not failed and len(pieces) > 1:
+        store_translation(text, target_language, ''.join(translated))
+
+
+async def _aget_cached_translation(text, target_language):
+    # Memory hits skip the hop to the database thread
+    translated = _translation_cache.get((text_hash(text), target_language))
+    if translated is None:
+        translated = await sync_to_async(get_cached_translation)(text, target_language)
+    return translated
+
+
+def _translation_slots():
+    # Like the translation pool for the sync path, bounds the translator
+    # calls in flight on the running loop to TRANSLATION_WORKERS
+    return get_loop_object('translation_slots',
+                           lambda: asyncio.Semaphore(getattr(settings, 'TRANSLATION_WORKERS', 4)))
+
+
+async def atranslate_chunk(chunk, target_language):
+    """
+    Async translate_chunk. Uses the loop's translator client when it is
+    non-blocking (get_async_translator), otherwise the translation pool.
+    At most TRANSLATION_WORKERS translator calls run at once per loop.
+    """
+    core = chunk.strip()
+    if not core:
+        return chunk
+    translated = await _aget_cached_translation(core, target_language)
+    if translated is None:
+        async with _translation_slots():
+            translator = get_async_translator()
+            if translator is not None:
+                translated = (await translator.atranslate(core, dest=target_language)).text
+            else:
+                translated = await asyncio.get_running_loop().run_in_executor(
+                    _translation_executor, lambda: get_translator().translate(core, dest=target_language).text)
+        _count('translated')
+        await sync_to_async(store_translation)(core, target_language, translated)
+    start = chunk.index(core[0])
+    return chunk[:start] + translated + chunk[start + len(core):]
+
+
+async def aiter_translation(text, target_language):
+    """
+    Async iter_translation: uncached chunks are translated concurrently as
+    tasks on the event loop (up to TRANSLATION_WORKERS at once) and pieces are yielded in order as soon as
+    they and all pieces before them are ready. The cache's database reads
+    and writes run in a thread.
+    """
+    # Skip translation if text is too short or target is English
+    if not text or len(text.strip()) < 10 or target_language == 'en':
+        yield text
+        return
+
+    translated = await _aget_cached_translation(text, target_language)
+    if translated is not None:
+        yield translated
+        return
+
+    pieces = split_chunks(text)
+    tasks = [asyncio.ensure_future(atranslate_chunk(piece, target_language)) if translate else None
+             for piece, translate in pieces]
+    translated = []
+    failed = False
+    try:
+        for (piece, translate), task in zip(pieces, tasks):
+            result = piece
+            if translate:
+                try:
+                    result = await task
+                except Exception as e:
+                    print(f"Translation error: {e}")
+                    failed = True
+            translated.append(result)
+            yield result
+    finally:
+        for task in tasks:
+            if task is not None:
+                task.cancel()
+
+    if not failed and len(pieces) > 1:
+        await sync_to_async(store_translation)(text, target_language, ''.join(translated))
+
+
+def translation_cache_stats():
+    with _stats_lock:
+        db_stats = dict(_db_stats)
+    lookups = db_stats['hits'] + db_stats['misses']
+    return {
+        'memory': _translation_cache.stats(),
+        'db': {
+            'hits': db_stats['hits'],
+            'misses': db_stats['misses'],
+            'hit_ratio': round(db_stats['hits'] / lookups, 4) if lookups else 0.0,
+        },
+        'translator_calls': db_stats['translated'],
+    }
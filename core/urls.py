@@ -4,11 +4,25 @@ from . import views
 urlpatterns = [
     path('', views.index, name='index'), 
     path('core/upload/', views.upload_view, name='upload_api'),
+    path('core/upload/async/', views.upload_async_view, name='upload_async_api'),
+    path('core/upload/status/<uuid:task_id>/', views.analysis_status_view, name='analysis_status_api'),
     path('core/jobs/', views.get_jobs_view, name='get_jobs_api'),
+    path('core/jobs/async/', views.get_jobs_async_view, name='get_jobs_async_api'),
+    path('core/jobs/stream/', views.get_jobs_stream_view, name='get_jobs_stream_api'),
+    path('core/cache-stats/', views.cache_stats_view, name='cache_stats_api'),
+    path('core/provider-stats/', views.provider_stats_view, name='provider_stats_api'),
+    path('core/analysis-queue-stats/', views.analysis_queue_stats_view, name='analysis_queue_stats_api'),
+    path('core/candidates/search/', views.candidate_search_view, name='candidate_search_api'),
+    path('metrics/', views.metrics_view, name='metrics'),
     path('core/submit-application/', views.submit_application_view, name='submit_application_api'),
+    path('core/recommendations/', views.recommendations_view, name='recommendations_api'),
     path('core/save-job/', views.save_job_view, name='save_job_api'),
+    path('core/save-jobs/bulk/', views.bulk_save_jobs_view, name='bulk_save_jobs_api'),
     path('core/saved-jobs/', views.get_saved_jobs_view, name='get_saved_jobs_api'),
+    path('core/saved-jobs/<path:job_id>/', views.saved_job_detail_view, name='saved_job_detail_api'),
     path('core/translate/', views.translate_job_view, name='translate_job_api'),
+    path('core/translate/async/', views.translate_job_async_view, name='translate_job_async_api'),
+    path('core/translate/stream/', views.translate_job_stream_view, name='translate_job_stream_api'),
     path('login/', views.login_view, name='login'),
     path('register/', views.register_view, name='register'),
     path('logout/', views.logout_view, name='logout'),
@@ -1,105 +1,136 @@
+import asyncio
+import logging
 import os
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import requests
 from pypdf import PdfReader
 from django.conf import settings
 
+from .ats import get_ats_rules
+from .cache import TTLCache
+from .dedupe import JobDeduper, dedupe_jobs
+from .http_client import ASYNC_HTTP_ERRORS, get_async_provider_client, get_provider_client
+from .metrics import record_provider_result
+from .recommendations import record_job_postings
+from .remoteok import RemoteOKIndex, afetch_remoteok_feed, fetch_remoteok_feed, get_remoteok_index
+from .skills import get_skill_taxonomy
+from .translation import aiter_translation, iter_translation
+
+logger = logging.getLogger(__name__)
+
 def translate_text(text, target_language='hi'):
     """
     Translates text to target language using googletrans library.
     Default target is Hindi ('hi'), but supports many languages.
     Common codes: 'hi' (Hindi), 'es' (Spanish), 'fr' (French), 'de' (German), etc.
+    Whole texts and their paragraphs are cached, and the chunks of long texts
+    are translated concurrently (see core.translation).
     """
     try:
-        from googletrans import Translator
-        translator = Translator()
-        
-        # Skip translation if text is too short or target is English
-        if not text or len(text.strip()) < 10 or target_language == 'en':
-            return text
-        
-        # Translate in chunks if text is very long (API limit ~5000 chars)
-        max_chunk_size = 4500
-        if len(text) > max_chunk_size:
-            # Split by sentences/paragraphs
-            chunks = []
-            current_chunk = ""
-            for sentence in text.split('. '):
-                if len(current_chunk) + len(sentence) < max_chunk_size:
-                    current_chunk += sentence + '. '
-                else:
-                    chunks.append(current_chunk)
-                    current_chunk = sentence + '. '
-            if current_chunk:
-                chunks.append(current_chunk)
-            
-            # Translate each chunk
-            translated_chunks = []
-            for chunk in chunks:
-                result = translator.translate(chunk, dest=target_language)
-                translated_chunks.append(result.text)
-            
-            return ' '.join(translated_chunks)
-        else:
-            result = translator.translate(text, dest=target_language)
-            return result.text
+        return ''.join(iter_translation(text, target_language))
     except Exception as e:
-        print(f"Translation error: {e}")
+        logger.warning("Translation error: %s", e)
         # Return original text if translation fails
         return text
 
-
-def extract_text_from_pdf(file_path):
+async def atranslate_text(text, target_language='hi'):
     """
-    Extracts text from a PDF file.
+    Async translate_text, on the non-blocking translator client when the
+    translator has one (see core.translation.aiter_translation).
     """
     try:
-        reader = PdfReader(file_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text()
+        return ''.join([piece async for piece in aiter_translation(text, target_language)])
+    except Exception as e:
+        logger.warning("Translation error: %s", e)
+        # Return original text if translation fails
         return text
+
+
+PdfPage = namedtuple('PdfPage', ['number', 'text', 'elapsed'])
+
+def iter_pdf_pages(file_path, max_pages=None, max_chars=None):
+    """
+    Yields PdfPage(number, text, elapsed) for each page of a PDF as soon as
+    it is extracted, so callers can start working on the text read so far.
+    Stops after max_pages pages or once max_chars characters have been
+    produced (the last page is truncated to fit). Defaults come from the
+    PDF_MAX_PAGES and PDF_MAX_CHARS settings; pass 0 to disable a limit.
+    """
+    if max_pages is None:
+        max_pages = getattr(settings, 'PDF_MAX_PAGES', 0)
+    if max_chars is None:
+        max_chars = getattr(settings, 'PDF_MAX_CHARS', 0)
+    
+    with open(file_path, 'rb') as f:
+        # Pages are parsed lazily as they are accessed
+        reader = PdfReader(f)
+        chars = 0
+        for index, page in enumerate(reader.pages):
+            if max_pages and index >= max_pages:
+                break
+            started = time.perf_counter()
+            try:
+                text = page.extract_text() or ""
+            except Exception as e:
+                logger.warning("Error extracting text from PDF page %d: %s", index + 1, e)
+                text = ""
+            if max_chars and chars + len(text) >= max_chars:
+                text = text[:max_chars - chars]
+                yield PdfPage(index + 1, text, time.perf_counter() - started)
+                break
+            chars += len(text)
+            yield PdfPage(index + 1, text, time.perf_counter() - started)
+
+def extract_text_from_pdf(file_path, max_pages=None, max_chars=None, page_timings=None):
+    """
+    Extracts text from a PDF file, page by page, within the page and
+    character limits (see iter_pdf_pages).
+    If page_timings is a list, (page number, seconds) is appended per page.
+    On error the text extracted so far is returned.
+    """
+    pages = []
+    try:
+        for page in iter_pdf_pages(file_path, max_pages, max_chars):
+            pages.append(page.text)
+            if page_timings is not None:
+                page_timings.append((page.number, page.elapsed))
     except Exception as e:
-        print(f"Error extracting text from PDF: {e}")
-        return ""
+        logger.warning("Error extracting text from PDF: %s", e)
+    return "\n".join(pages)
 
 def extract_skills(text):
     """
-    Extracts skills from text based on a predefined list.
-    This is a basic implementation. In a real app, use NLP.
+    Extracts skills from text using the skill taxonomy.
+    Aliases are mapped to their canonical name ("k8s" -> "kubernetes") and
+    matches respect word boundaries. Skills are returned in order of first
+    appearance.
     """
-    # Common tech skills list
-    COMMON_SKILLS = {
-        "python", "java", "javascript", "c++", "c#", "php", "ruby", "go", "swift", "kotlin",
-        "html", "css", "sql", "mysql", "postgresql", "mongodb", "aws", "azure", "docker",
-        "kubernetes", "git", "react", "angular", "vue", "django", "flask", "spring", "node.js",
-        "machine learning", "data science", "artificial intelligence", "deep learning",
-        "communication", "leadership", "problem solving", "agile", "scrum", "project management"
-    }
-    
-    found_skills = set()
-    text_lower = text.lower()
-    
-    for skill in COMMON_SKILLS:
-        # Simple word matching, can be improved
-        if skill in text_lower:
-            found_skills.add(skill)
-            
-    return list(found_skills)
+    if not text:
+        return []
+    return get_skill_taxonomy().extract(text)
 
-def get_adzuna_jobs(skills, location="in"): 
+def get_provider_timeout(provider):
     """
-    Fetches job recommendations from Adzuna API based on skills.
+    Returns the HTTP timeout (seconds) for a job provider from JOB_PROVIDER_TIMEOUTS.
+    """
+    timeouts = getattr(settings, 'JOB_PROVIDER_TIMEOUTS', {})
+    return timeouts.get(provider, timeouts.get('default', 10))
+
+def _adzuna_request(skills):
+    """
+    URL and request arguments of an Adzuna search for skills.
     """
-    if not skills:
-        return []
-    
     app_id = settings.ADZUNA_APP_ID
     app_key = settings.ADZUNA_APP_KEY
     
     # Adzuna API endpoint
     country = "in" # Default to India as requested
     
-    url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
+    base_url = getattr(settings, 'ADZUNA_API_URL', 'https://api.adzuna.com/v1/api')
+    url = f"{base_url}/jobs/{country}/search/1"
     
     # Construct query from skills (top 3 skills to avoid over-constraint)
     what = " ".join(skills[:3]) 
@@ -110,31 +141,57 @@ def get_adzuna_jobs(skills, location="in"):
         'what': what,
         'content-type': 'application/json',
     }
+    return url, {'params': params}
+
+def get_adzuna_jobs(skills, location="in", timeout=None, deadline=None): 
+    """
+    Fetches job recommendations from Adzuna API based on skills.
+    """
+    if not skills:
+        return []
     
+    url, kwargs = _adzuna_request(skills)
     try:
-        response = requests.get(url, params=params)
+        response = get_provider_client('adzuna').get(
+            url, deadline=deadline, timeout=timeout or get_provider_timeout('adzuna'), **kwargs)
         response.raise_for_status()
         data = response.json()
         return data.get('results', [])
     except requests.RequestException as e:
-        print(f"Adzuna API Error: {e}")
+        logger.warning("Adzuna API Error: %s", e)
         return []
 
-def get_jsearch_jobs(skills, location="India"):
+async def aget_adzuna_jobs(skills, location="in", timeout=None, deadline=None):
     """
-    Fetches job recommendations from JSearch API (via RapidAPI) based on skills.
+    Async get_adzuna_jobs, on the provider's non-blocking client.
     """
     if not skills:
         return []
     
+    url, kwargs = _adzuna_request(skills)
+    try:
+        response = await get_async_provider_client('adzuna').get(
+            url, deadline=deadline, timeout=timeout or get_provider_timeout('adzuna'), **kwargs)
+        response.raise_for_status()
+        data = response.json()
+        return data.get('results', [])
+    except (*ASYNC_HTTP_ERRORS, ValueError) as e:
+        logger.warning("Adzuna API Error: %s", e)
+        return []
+
+def _jsearch_request(skills, location):
+    """
+    URL and request arguments of a JSearch search for skills, or None
+    when no RapidAPI key is configured.
+    """
     # Get API key from settings
     api_key = getattr(settings, 'RAPIDAPI_KEY', None)
     
     if not api_key:
-        print("RapidAPI key not configured")
-        return []
+        logger.warning("RapidAPI key not configured")
+        return None
     
-    url = "https://jsearch.p.rapidapi.com/search"
+    url = getattr(settings, 'JSEARCH_API_URL', "https://jsearch.p.rapidapi.com/search")
     
     # Construct query from skills
     query = " ".join(skills[:3]) + f" jobs in {location}"
@@ -149,134 +206,359 @@ def get_jsearch_jobs(skills, location="India"):
         "page": "1",
         "num_pages": "1"
     }
+    return url, {'headers': headers, 'params': params}
+
+def _normalize_jsearch_jobs(data):
+    # Normalize JSearch data to common format
+    jobs = []
+    for job in data.get('data', [])[:10]:  # Limit to 10 jobs
+        jobs.append({
+            'id': job.get('job_id', ''),
+            'title': job.get('job_title', ''),
+            'company': {'display_name': job.get('employer_name', 'Unknown')},
+            'location': {'display_name': job.get('job_city', '') + ', ' + job.get('job_country', '')},
+            'description': job.get('job_description', ''),
+            'created': job.get('job_posted_at_datetime_utc', ''),
+            'salary_min': job.get('job_min_salary'),
+            'salary_max': job.get('job_max_salary'),
+            'redirect_url': job.get('job_apply_link', '')
+        })
+    return jobs
+
+def get_jsearch_jobs(skills, location="India", timeout=None, deadline=None):
+    """
+    Fetches job recommendations from JSearch API (via RapidAPI) based on skills.
+    """
+    if not skills:
+        return []
+    
+    request = _jsearch_request(skills, location)
+    if request is None:
+        return []
+    url, kwargs = request
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = get_provider_client('jsearch').get(
+            url, deadline=deadline, timeout=timeout or get_provider_timeout('jsearch'), **kwargs)
         response.raise_for_status()
-        data = response.json()
-        
-        # Normalize JSearch data to common format
-        jobs = []
-        for job in data.get('data', [])[:10]:  # Limit to 10 jobs
-            jobs.append({
-                'id': job.get('job_id', ''),
-                'title': job.get('job_title', ''),
-                'company': {'display_name': job.get('employer_name', 'Unknown')},
-                'location': {'display_name': job.get('job_city', '') + ', ' + job.get('job_country', '')},
-                'description': job.get('job_description', ''),
-                'created': job.get('job_posted_at_datetime_utc', ''),
-                'salary_min': job.get('job_min_salary'),
-                'salary_max': job.get('job_max_salary'),
-                'redirect_url': job.get('job_apply_link', '')
-            })
-        
-        return jobs
+        return _normalize_jsearch_jobs(response.json())
     except requests.RequestException as e:
-        print(f"JSearch API Error: {e}")
+        logger.warning("JSearch API Error: %s", e)
         return []
 
-def get_remoteok_jobs(skills):
+async def aget_jsearch_jobs(skills, location="India", timeout=None, deadline=None):
     """
-    Fetches remote job recommendations from RemoteOK API based on skills.
+    Async get_jsearch_jobs, on the provider's non-blocking client.
     """
     if not skills:
         return []
     
-    url = "https://remoteok.com/api"
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    request = _jsearch_request(skills, location)
+    if request is None:
+        return []
+    url, kwargs = request
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = await get_async_provider_client('jsearch').get(
+            url, deadline=deadline, timeout=timeout or get_provider_timeout('jsearch'), **kwargs)
         response.raise_for_status()
-        data = response.json()
-        
-        # RemoteOK returns array where first element is metadata
-        if isinstance(data, list) and len(data) > 1:
-            data = data[1:]  # Skip first element
-        
-        # Filter jobs based on skills
-        skills_lower = [s.lower() for s in skills]
-        jobs = []
-        
-        for job in data[:20]:  # Check first 20 jobs
-            if not isinstance(job, dict):
-                continue
-                
-            # Check if any skill matches job tags or description
-            job_tags = [tag.lower() for tag in job.get('tags', [])]
-            job_desc = job.get('description', '').lower()
-            
-            # Simple matching logic
-            if any(skill in job_tags or skill in job_desc for skill in skills_lower):
-                jobs.append({
-                    'id': job.get('id', ''),
-                    'title': job.get('position', ''),
-                    'company': {'display_name': job.get('company', 'Unknown')},
-                    'location': {'display_name': 'Remote'},
-                    'description': job.get('description', '')[:500],  # Truncate long descriptions
-                    'created': job.get('date', ''),
-                    'salary_min': job.get('salary_min'),
-                    'salary_max': job.get('salary_max'),
-                    'redirect_url': job.get('url', '')
-                })
-                
-                if len(jobs) >= 10:  # Limit to 10 jobs
-                    break
-        
-        return jobs
-    except requests.RequestException as e:
-        print(f"RemoteOK API Error: {e}")
+        return _normalize_jsearch_jobs(response.json())
+    except (*ASYNC_HTTP_ERRORS, ValueError) as e:
+        logger.warning("JSearch API Error: %s", e)
         return []
 
-def aggregate_jobs(skills, location="India"):
+def _match_remoteok_feed(data, skills):
     """
-    Aggregates job results from multiple APIs.
+    Searches a downloaded feed through a throwaway RemoteOKIndex, so the
+    live fallback finds the same jobs, in the same order, as a snapshot of
+    that feed would.
     """
-    all_jobs = []
+    return RemoteOKIndex(data).search(skills)
+
+def get_remoteok_jobs(skills, timeout=None, deadline=None):
+    """
+    Fetches remote job recommendations from RemoteOK based on skills.
+    Uses the local feed snapshot (see the ingest_remoteok command) when one
+    is available, otherwise downloads the feed.
+    """
+    if not skills:
+        return []
+    
+    index = get_remoteok_index()
+    if index is not None:
+        return index.search(skills)
     
-    # Fetch from Adzuna
     try:
-        adzuna_jobs = get_adzuna_jobs(skills, location)
-        all_jobs.extend(adzuna_jobs)
-        print(f"Fetched {len(adzuna_jobs)} jobs from Adzuna")
-    except Exception as e:
-        print(f"Error fetching from Adzuna: {e}")
+        data = fetch_remoteok_feed(timeout=timeout or get_provider_timeout('remoteok'), deadline=deadline)
+        return _match_remoteok_feed(data, skills)
+    except requests.RequestException as e:
+        logger.warning("RemoteOK API Error: %s", e)
+        return []
+
+async def aget_remoteok_jobs(skills, timeout=None, deadline=None):
+    """
+    Async get_remoteok_jobs. Searching the local snapshot is in-memory and
+    stays on the event loop; only the feed download is awaited.
+    """
+    if not skills:
+        return []
+    
+    index = get_remoteok_index()
+    if index is not None:
+        return index.search(skills)
     
-    # Fetch from JSearch
     try:
-        jsearch_jobs = get_jsearch_jobs(skills, location)
-        all_jobs.extend(jsearch_jobs)
-        print(f"Fetched {len(jsearch_jobs)} jobs from JSearch")
-    except Exception as e:
-        print(f"Error fetching from JSearch: {e}")
+        data = await afetch_remoteok_feed(timeout=timeout or get_provider_timeout('remoteok'), deadline=deadline)
+        return _match_remoteok_feed(data, skills)
+    except (*ASYNC_HTTP_ERRORS, ValueError) as e:
+        logger.warning("RemoteOK API Error: %s", e)
+        return []
+
+# Job providers queried by aggregate_jobs:
+# (name, fetch(skills, location, timeout, deadline), number of leading skills the query uses or None for all)
+# deadline is a time.monotonic() value after which the fetch stops retrying, or None
+JOB_PROVIDERS = [
+    ('adzuna', lambda skills, location, timeout, deadline=None: get_adzuna_jobs(
+        skills, location, timeout=timeout, deadline=deadline), 3),
+    ('jsearch', lambda skills, location, timeout, deadline=None: get_jsearch_jobs(
+        skills, location, timeout=timeout, deadline=deadline), 3),
+    ('remoteok', lambda skills, location, timeout, deadline=None: get_remoteok_jobs(
+        skills, timeout=timeout, deadline=deadline), None),
+]
+
+# Coroutine counterparts of the JOB_PROVIDERS fetchers, for aiter_provider_jobs
+ASYNC_JOB_FETCHERS = {
+    'adzuna': lambda skills, location, timeout, deadline=None: aget_adzuna_jobs(
+        skills, location, timeout=timeout, deadline=deadline),
+    'jsearch': lambda skills, location, timeout, deadline=None: aget_jsearch_jobs(
+        skills, location, timeout=timeout, deadline=deadline),
+    'remoteok': lambda skills, location, timeout, deadline=None: aget_remoteok_jobs(
+        skills, timeout=timeout, deadline=deadline),
+}
+
+_provider_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'JOB_PROVIDER_WORKERS', 16),
+    thread_name_prefix='job-provider',
+)
+# Catalogue writes get their own thread, so they never wait behind (or
+# hold up) provider fetches; the writes are serialized anyway
+_catalog_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='job-catalog')
+
+# Shared provider results, keyed by (provider, sorted skills, location)
+job_cache = TTLCache(
+    maxsize=getattr(settings, 'JOB_CACHE_SIZE', 1024),
+    ttl=getattr(settings, 'JOB_CACHE_TTL', 600),
+    stale_ttl=getattr(settings, 'JOB_CACHE_STALE_TTL', 3600),
+)
+
+def job_cache_key(provider, skills, location, skill_limit=None):
+    query_skills = skills[:skill_limit] if skill_limit else skills
+    return (provider, tuple(sorted({s.strip().lower() for s in query_skills})), (location or '').strip().lower())
+
+def _cache_jobs(key, jobs):
+    # Providers return [] on errors, so empty results are not cached
+    if jobs:
+        job_cache.set(key, jobs)
+        # Off the request path: the catalogue feeds the batch recommendations
+        _catalog_executor.submit(record_job_postings, key[0], jobs)
+    return jobs
+
+def _fetch_and_cache(key, fetch, skills, location, timeout, deadline=None):
+    return _cache_jobs(key, fetch(skills, location, timeout, deadline))
+
+async def _afetch_and_cache(key, fetch, skills, location, timeout, deadline=None):
+    return _cache_jobs(key, await fetch(skills, location, timeout, deadline))
+
+def _refresh_in_background(key, fetch, skills, location, timeout):
+    if not job_cache.start_refresh(key):
+        return
+    def refresh():
+        try:
+            _fetch_and_cache(key, fetch, skills, location, timeout)
+        except Exception as e:
+            logger.warning("Background refresh failed for %s: %s", key[0], e)
+        finally:
+            job_cache.finish_refresh(key)
+    _provider_executor.submit(refresh)
+
+def iter_provider_jobs(skills, location="India", deadline=None):
+    """
+    Queries every job provider concurrently and yields
+    (provider, jobs, status) as each one finishes.
+    Cached results are yielded first without a request; stale ones are
+    refreshed in the background.
+    A provider is given up on once its own timeout (JOB_PROVIDER_TIMEOUTS)
+    or the overall deadline (JOB_SEARCH_DEADLINE seconds) passes, whichever
+    comes first; it is then yielded with no jobs and status 'timeout'.
+    The fetch gets the same deadline, so its worker thread stops retrying
+    and is free again by then too.
+    """
+    started = time.monotonic()
+    overall_deadline = started + (deadline or getattr(settings, 'JOB_SEARCH_DEADLINE', 10))
+    
+    pending = {}
+    for name, fetch, skill_limit in JOB_PROVIDERS:
+        timeout = get_provider_timeout(name)
+        key = job_cache_key(name, skills, location, skill_limit)
+        jobs, state = job_cache.get(key)
+        if jobs is not None:
+            if state == TTLCache.STALE:
+                _refresh_in_background(key, fetch, skills, location, timeout)
+            yield name, jobs, {'status': 'ok', 'count': len(jobs), 'elapsed_ms': 0, 'cache': state}
+            continue
+        provider_deadline = min(started + timeout, overall_deadline)
+        future = _provider_executor.submit(_fetch_and_cache, key, fetch, skills, location, timeout, provider_deadline)
+        pending[future] = (name, provider_deadline)
+    
+    while pending:
+        next_deadline = min(provider_deadline for _, provider_deadline in pending.values())
+        done, _ = wait(pending, timeout=max(0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+        now = time.monotonic()
+        elapsed_ms = round((now - started) * 1000)
+        
+        for future in done:
+            name, _ = pending.pop(future)
+            try:
+                jobs = future.result()
+                yield name, jobs, {'status': 'ok', 'count': len(jobs), 'elapsed_ms': elapsed_ms, 'cache': 'miss'}
+            except Exception as e:
+                logger.warning("Error fetching from %s: %s", name, e)
+                yield name, [], {'status': 'error', 'count': 0, 'elapsed_ms': elapsed_ms}
+        
+        for future, (name, provider_deadline) in list(pending.items()):
+            if provider_deadline <= now:
+                # The worker thread finishes on its own: the fetch's last
+                # attempt times out at the same deadline
+                del pending[future]
+                future.cancel()
+                logger.warning("%s timed out after %s ms", name, elapsed_ms)
+                yield name, [], {'status': 'timeout', 'count': 0, 'elapsed_ms': elapsed_ms}
+
+async def aiter_provider_jobs(skills, location="India", deadline=None):
+    """
+    Async iter_provider_jobs, for async views: providers are queried as
+    tasks on the event loop with non-blocking clients instead of on the
+    provider thread pool, so a worker can wait on any number of searches
+    at once. Caching, deadlines and the yielded (provider, jobs, status)
+    are the same; a provider past its deadline is cancelled.
+    """
+    started = time.monotonic()
+    overall_deadline = started + (deadline or getattr(settings, 'JOB_SEARCH_DEADLINE', 10))
+    
+    pending = {}
+    for name, fetch, skill_limit in JOB_PROVIDERS:
+        timeout = get_provider_timeout(name)
+        key = job_cache_key(name, skills, location, skill_limit)
+        jobs, state = job_cache.get(key)
+        if jobs is not None:
+            if state == TTLCache.STALE:
+                _refresh_in_background(key, fetch, skills, location, timeout)
+            yield name, jobs, {'status': 'ok', 'count': len(jobs), 'elapsed_ms': 0, 'cache': state}
+            continue
+        provider_deadline = min(started + timeout, overall_deadline)
+        task = asyncio.ensure_future(_afetch_and_cache(
+            key, ASYNC_JOB_FETCHERS[name], skills, location, timeout, provider_deadline))
+        pending[task] = (name, provider_deadline)
     
-    # Fetch from RemoteOK
     try:
-        remoteok_jobs = get_remoteok_jobs(skills)
-        all_jobs.extend(remoteok_jobs)
-        print(f"Fetched {len(remoteok_jobs)} jobs from RemoteOK")
-    except Exception as e:
-        print(f"Error fetching from RemoteOK: {e}")
-    
-    # Remove duplicates based on title and company
-    seen = set()
-    unique_jobs = []
-    for job in all_jobs:
-        key = (job.get('title', '').lower(), job.get('company', {}).get('display_name', '').lower())
-        if key not in seen:
-            seen.add(key)
-            unique_jobs.append(job)
-    
-    print(f"Total unique jobs: {len(unique_jobs)}")
+        while pending:
+            next_deadline = min(provider_deadline for _, provider_deadline in pending.values())
+            done, _ = await asyncio.wait(pending, timeout=max(0, next_deadline - time.monotonic()),
+                                         return_when=asyncio.FIRST_COMPLETED)
+            now = time.monotonic()
+            elapsed_ms = round((now - started) * 1000)
+            
+            for task in done:
+                name, _ = pending.pop(task)
+                try:
+                    jobs = task.result()
+                    yield name, jobs, {'status': 'ok', 'count': len(jobs), 'elapsed_ms': elapsed_ms, 'cache': 'miss'}
+                except Exception as e:
+                    logger.warning("Error fetching from %s: %s", name, e)
+                    yield name, [], {'status': 'error', 'count': 0, 'elapsed_ms': elapsed_ms}
+            
+            for task, (name, provider_deadline) in list(pending.items()):
+                if provider_deadline <= now:
+                    del pending[task]
+                    task.cancel()
+                    logger.warning("%s timed out after %s ms", name, elapsed_ms)
+                    yield name, [], {'status': 'timeout', 'count': 0, 'elapsed_ms': elapsed_ms}
+    finally:
+        # The client went away or the caller stopped early
+        for task in pending:
+            task.cancel()
+
+def _record_provider(name, jobs, status):
+    logger.info("Fetched %d jobs from %s (%s, %s ms)", len(jobs), name, status['status'], status['elapsed_ms'])
+    record_provider_result(name, status)
+
+def _merge_provider_jobs(results):
+    all_jobs = []
+    for name, _, _ in JOB_PROVIDERS:
+        all_jobs.extend(results.get(name, []))
+    
+    # Remove duplicates and near-duplicates (same posting reworded or
+    # truncated differently by another provider)
+    unique_jobs = dedupe_jobs(all_jobs, max_distance=getattr(settings, 'JOB_DEDUPE_MAX_DISTANCE', 8))
+    
+    logger.info("Total unique jobs: %d", len(unique_jobs))
     return unique_jobs
 
+class ProviderJobMerger:
+    """
+    Incremental aggregate_jobs for streaming: add() each provider's results
+    as they arrive and get back only the jobs that do not duplicate one
+    returned before. Duplicates across providers therefore keep the copy
+    of whichever provider answered first, not the first in provider order.
+    """
+
+    def __init__(self):
+        self.deduper = JobDeduper(getattr(settings, 'JOB_DEDUPE_MAX_DISTANCE', 8))
+        self.provider_status = {}
+        self.total = 0
+
+    def add(self, name, jobs, status):
+        self.provider_status[name] = status
+        _record_provider(name, jobs, status)
+        new_jobs = [job for job in jobs if self.deduper.add(job)]
+        self.total += len(new_jobs)
+        return new_jobs
+
+    def timed_out(self):
+        return [name for name, status in self.provider_status.items() if status['status'] == 'timeout']
+
+def aggregate_jobs(skills, location="India", deadline=None):
+    """
+    Aggregates job results from multiple APIs, queried concurrently.
+    Returns (unique_jobs, provider_status) where provider_status maps each
+    provider to its status ('ok', 'error' or 'timeout'), job count and
+    elapsed milliseconds. Jobs keep provider order.
+    """
+    results = {}
+    provider_status = {}
+    for name, jobs, status in iter_provider_jobs(skills, location, deadline):
+        results[name] = jobs
+        provider_status[name] = status
+        _record_provider(name, jobs, status)
+    return _merge_provider_jobs(results), provider_status
+
+async def aaggregate_jobs(skills, location="India", deadline=None):
+    """
+    Async aggregate_jobs, built on aiter_provider_jobs. Same result.
+    """
+    results = {}
+    provider_status = {}
+    async for name, jobs, status in aiter_provider_jobs(skills, location, deadline):
+        results[name] = jobs
+        provider_status[name] = status
+        _record_provider(name, jobs, status)
+    return _merge_provider_jobs(results), provider_status
+
 def calculate_ats_score(text, skills):
     """
     Calculates a heuristic ATS score based on resume content.
     Also generates missing keywords and professional summary.
+    All text features come from a single pass of the compiled ATS rules.
     """
     score = 0
     breakdown = {
@@ -285,10 +567,11 @@ def calculate_ats_score(text, skills):
         "missing_keywords": []
     }
     
-    text_lower = text.lower()
+    rules = get_ats_rules()
+    features = rules.extract_features(text)
     
     # 1. Content Length (10 points)
-    word_count = len(text.split())
+    word_count = features.word_count
     if 200 <= word_count <= 2000:
         score += 10
         breakdown["strengths"].append("Optimal resume length")
@@ -296,32 +579,28 @@ def calculate_ats_score(text, skills):
         breakdown["weaknesses"].append("Resume length is outside optimal range (200-2000 words)")
 
     # 2. Contact Info Check (20 points)
-    has_email = "@" in text
-    # Simple digit check for phone, can be improved with regex
-    has_phone = sum(c.isdigit() for c in text) > 9 
-    
-    if has_email:
+    if features.has_email:
         score += 10
         breakdown["strengths"].append("Email address detected")
     else:
         breakdown["weaknesses"].append("Missing email address")
         
-    if has_phone:
+    if features.has_phone:
         score += 10
         breakdown["strengths"].append("Phone number detected")
     else:
         breakdown["weaknesses"].append("Missing phone number")
 
     # 3. Key Sections Check (30 points)
-    sections = ["experience", "education", "skills", "summary", "projects"]
-    found_sections = [s for s in sections if s in text_lower]
+    sections = list(rules.rules["sections"])
+    found_sections = [s for s in sections if s in features.sections]
     
     score += (len(found_sections) / len(sections)) * 30
     
     if len(found_sections) == len(sections):
         breakdown["strengths"].append("All key sections detected")
     else:
-        missing = [s.title() for s in sections if s not in text_lower]
+        missing = [s.title() for s in sections if s not in features.sections]
         breakdown["weaknesses"].append(f"Missing sections: {', '.join(missing)}")
 
     # 4. Skills/Keywords (40 points)
@@ -338,47 +617,25 @@ def calculate_ats_score(text, skills):
          breakdown["weaknesses"].append("No technical skills detected")
     
     # 5. Generate Missing Keywords - Enhanced with role-specific suggestions
-    # Detect role from resume
+    # Detect role from resume (first role in priority order that appears)
     detected_role = None
-    common_roles = {
-        "developer": ["python", "javascript", "react", "node.js", "api", "git", "docker", "aws", "ci/cd", "testing"],
-        "engineer": ["system design", "architecture", "scalability", "microservices", "kubernetes", "devops"],
-        "data": ["sql", "python", "machine learning", "pandas", "visualization", "statistics", "big data"],
-        "manager": ["leadership", "stakeholder management", "agile", "scrum", "roadmap", "kpis", "budgeting"],
-        "designer": ["ui/ux", "figma", "adobe", "wireframing", "prototyping", "user research", "design systems"],
-        "analyst": ["excel", "sql", "data analysis", "reporting", "dashboards", "business intelligence"],
-        "marketing": ["seo", "sem", "content marketing", "analytics", "campaign management", "social media"]
-    }
-    
-    # Detect role from text
-    for role, keywords in common_roles.items():
-        if role in text_lower:
+    for role in rules.rules["roles"]:
+        if role["role"] in features.roles:
             detected_role = role
             break
     
-    # Common industry keywords that should be in most resumes
-    RECOMMENDED_KEYWORDS = {
-        "technical": ["agile", "scrum", "ci/cd", "devops", "cloud", "api", "testing", "debugging", 
-                     "version control", "git", "collaboration", "problem-solving"],
-        "soft_skills": ["leadership", "communication", "teamwork", "analytical", "creative", 
-                       "detail-oriented", "time management", "adaptable", "strategic thinking"],
-        "achievements": ["improved", "increased", "reduced", "developed", "implemented", 
-                        "designed", "optimized", "achieved", "led", "managed", "delivered"]
-    }
-    
     missing_keywords = []
     
     # First, add role-specific keywords if role detected
-    if detected_role and detected_role in common_roles:
-        role_keywords = common_roles[detected_role]
-        for keyword in role_keywords:
-            if keyword not in text_lower and len(missing_keywords) < 10:
+    if detected_role:
+        for keyword in detected_role["keywords"]:
+            if keyword not in features.keywords and len(missing_keywords) < 10:
                 missing_keywords.append(keyword.title())
     
     # Then add general keywords
-    for category, keywords in RECOMMENDED_KEYWORDS.items():
+    for category, keywords in rules.rules["recommended_keywords"].items():
         for keyword in keywords:
-            if keyword not in text_lower and len(missing_keywords) < 15:  # Limit to 15 suggestions
+            if keyword not in features.keywords and len(missing_keywords) < 15:  # Limit to 15 suggestions
                 # Avoid duplicates
                 if keyword.title() not in missing_keywords:
                     missing_keywords.append(keyword.title())
@@ -392,25 +649,22 @@ def calculate_ats_score(text, skills):
     breakdown["missing_keywords"] = missing_keywords
     
     # 6. Generate Professional Summary
-    summary = generate_professional_summary(text, skills)
+    summary = generate_professional_summary(text, skills, features=features)
     breakdown["professional_summary"] = summary
 
     return int(score), breakdown
 
-def generate_professional_summary(text, skills):
+def generate_professional_summary(text, skills, features=None):
     """
     Generates a professional summary based on resume content.
+    Pass the features from calculate_ats_score to avoid rescanning the text.
     """
-    text_lower = text.lower()
+    rules = get_ats_rules()
+    if features is None:
+        features = rules.extract_features(text)
     
     # Detect experience level
-    years_exp = 0
-    if "years" in text_lower or "year" in text_lower:
-        # Try to extract years of experience
-        import re
-        year_matches = re.findall(r'(\d+)\s*(?:\+)?\s*years?', text_lower)
-        if year_matches:
-            years_exp = max([int(y) for y in year_matches])
+    years_exp = features.years_experience
     
     # Determine experience level
     if years_exp >= 7:
@@ -423,12 +677,10 @@ def generate_professional_summary(text, skills):
         level = "Entry-level"
     
     # Detect role/title (simple heuristic)
-    common_roles = ["developer", "engineer", "designer", "manager", "analyst", "scientist", 
-                   "architect", "consultant", "specialist", "administrator"]
     detected_role = "Professional"
-    for role in common_roles:
-        if role in text_lower:
-            detected_role = role.title()
+    for role in rules.rules["summary_roles"]:
+        if role["role"] in features.summary_roles:
+            detected_role = role["role"].title()
             break
     
     # Build summary
@@ -447,13 +699,7 @@ def generate_professional_summary(text, skills):
         summary_parts.append(f"specializing in {skills_str}")
     
     # Achievements/Focus
-    focus_areas = []
-    if "project" in text_lower or "projects" in text_lower:
-        focus_areas.append("project delivery")
-    if "team" in text_lower or "collaboration" in text_lower:
-        focus_areas.append("team collaboration")
-    if "client" in text_lower or "customer" in text_lower:
-        focus_areas.append("client satisfaction")
+    focus_areas = [area for area in rules.rules["focus_areas"] if area in features.focus_areas]
     
     if focus_areas:
         focus_str = " and ".join(focus_areas)
@@ -466,4 +712,3 @@ def generate_professional_summary(text, skills):
     summary = ". ".join(summary_parts) + "."
     
     return summary
-
@@ -1,13 +1,36 @@
 
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
 from django.core.files.storage import default_storage
 from django.conf import settings
-from .utils import extract_text_from_pdf, extract_skills, aggregate_jobs, calculate_ats_score
+from django.urls import reverse
+from django.contrib.admin.views.decorators import staff_member_required
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from .utils import (
+    ProviderJobMerger, aaggregate_jobs, aggregate_jobs, aiter_provider_jobs, iter_provider_jobs, job_cache,
+)
+from .candidates import normalize_skills, search_candidates
+from .http_client import provider_client_stats
+from .ranking import rank_jobs
+from .recommendations import get_recommendations
+from .analysis import (
+    aanalyze_stored_resume, analysis_cache_stats, analysis_response, analyze_stored_resume,
+    get_cached_analysis, hash_uploaded_file, save_profile_analysis,
+)
+from .metrics import analysis_queue_depth, render_metrics, timed_view
+from .models import AnalysisTask
+from .tasks import enqueue_analysis, queue_counts, queue_stats
+from .translation import aiter_translation, iter_translation, translation_cache_stats
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 @csrf_exempt
+@timed_view('upload')
 def upload_view(request):
     if request.method == 'POST':
         if 'resume' not in request.FILES:
@@ -15,50 +38,120 @@ def upload_view(request):
         
         resume_file = request.FILES['resume']
         
-        # Simple file saving for now
-        file_path = default_storage.save(f'resumes/{resume_file.name}', resume_file)
-        # Fix path for windows if needed, though default_storage handles it usually.
-        # However, extract_text_from_pdf might need absolute path.
-        full_path = os.path.join(settings.MEDIA_ROOT, file_path)
+        # Identical resume bytes always produce the same analysis, so look it
+        # up by content hash before touching the PDF
+        timer = request.timer
+        with timer.stage('hash'):
+            content_hash = hash_uploaded_file(resume_file)
+        with timer.stage('cache_lookup'):
+            analysis = get_cached_analysis(content_hash)
         
-        # 1. Extract Text
-        try:
-            text = extract_text_from_pdf(full_path)
-        except Exception as e:
-             return JsonResponse({'error': f"Failed to extract text: {str(e)}"}, status=500)
-
-        # 2. Extract Skills
-        skills = extract_skills(text)
+        if analysis and analysis.get('resume') and default_storage.exists(analysis['resume']):
+            # Reuse the stored copy instead of saving another duplicate
+            file_path = analysis['resume']
+        else:
+            # Simple file saving for now
+            with timer.stage('save_file'):
+                file_path = default_storage.save(f'resumes/{resume_file.name}', resume_file)
         
-        # 3. Calculate ATS Score (now includes missing keywords and summary)
-        ats_score, ats_breakdown = calculate_ats_score(text, skills)
+        if analysis is None:
+            if getattr(settings, 'ANALYSIS_QUEUE_ENABLED', False):
+                # Parsing and scoring run in `manage.py run_analysis_worker`;
+                # the page polls the status endpoint for the result
+                with timer.stage('enqueue'):
+                    task = enqueue_analysis(content_hash, file_path, request.user)
+                return JsonResponse({
+                    'success': True,
+                    'task_id': str(task.pk),
+                    'status': task.status,
+                    'status_url': reverse('analysis_status_api', args=[task.pk]),
+                }, status=202)
 
-        # 4. Save to UserProfile (if authenticated)
-        if request.user.is_authenticated:
             try:
-                from .models import UserProfile
-                profile, created = UserProfile.objects.get_or_create(user=request.user)
-                profile.resume = file_path # Save relative path
-                profile.skills = skills
-                profile.ats_score = ats_score
-                profile.ats_breakdown = ats_breakdown
-                profile.save()
+                # 1. Extract Text, 2. Extract Skills and 3. Calculate ATS Score
+                # (includes missing keywords and summary)
+                analysis = analyze_stored_resume(content_hash, file_path, timer)
             except Exception as e:
-                print(f"Error saving profile: {e}")
+                 return JsonResponse({'error': f"Failed to extract text: {str(e)}"}, status=500)
 
-        return JsonResponse({
-            'success': True,
-            'skills': skills,
-            'ats_score': ats_score,
-            'ats_breakdown': ats_breakdown,
-            'missing_keywords': ats_breakdown.get('missing_keywords', []),
-            'professional_summary': ats_breakdown.get('professional_summary', '')
-            # Jobs are now fetched asynchronously via /api/jobs/
-        })
+        # 4. Save to UserProfile (if authenticated)
+        if request.user.is_authenticated:
+            with timer.stage('profile_save'):
+                save_profile_analysis(request.user, file_path, analysis, content_hash)
+
+        # Jobs are now fetched asynchronously via /api/jobs/
+        return JsonResponse({'success': True, **analysis_response(analysis)})
 
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
 @csrf_exempt
+@timed_view('upload_async')
+async def upload_async_view(request):
+    """
+    Async variant of upload_view for ASGI deployments. Storage and database
+    work run in a thread, and an inline analysis (ANALYSIS_QUEUE_ENABLED
+    off) in the analysis process pool, so the event loop keeps serving
+    other requests while a PDF is parsed.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    if 'resume' not in request.FILES:
+        return JsonResponse({'error': 'No resume file provided'}, status=400)
+    
+    resume_file = request.FILES['resume']
+    user = await request.auser()
+    timer = request.timer
+    with timer.stage('hash'):
+        content_hash = hash_uploaded_file(resume_file)
+    with timer.stage('cache_lookup'):
+        analysis = await sync_to_async(get_cached_analysis)(content_hash)
+    
+    if analysis and analysis.get('resume') and await sync_to_async(default_storage.exists)(analysis['resume']):
+        file_path = analysis['resume']
+    else:
+        with timer.stage('save_file'):
+            file_path = await sync_to_async(default_storage.save)(f'resumes/{resume_file.name}', resume_file)
+    
+    if analysis is None:
+        if getattr(settings, 'ANALYSIS_QUEUE_ENABLED', False):
+            with timer.stage('enqueue'):
+                task = await sync_to_async(enqueue_analysis)(content_hash, file_path, user)
+            return JsonResponse({
+                'success': True,
+                'task_id': str(task.pk),
+                'status': task.status,
+                'status_url': reverse('analysis_status_api', args=[task.pk]),
+            }, status=202)
+        try:
+            analysis = await aanalyze_stored_resume(content_hash, file_path, timer)
+        except Exception as e:
+            return JsonResponse({'error': f"Failed to extract text: {str(e)}"}, status=500)
+    
+    if user.is_authenticated:
+        with timer.stage('profile_save'):
+            await sync_to_async(save_profile_analysis)(user, file_path, analysis, content_hash)
+    return JsonResponse({'success': True, **analysis_response(analysis)})
+
+def analysis_status_view(request, task_id):
+    """API endpoint polled by the upload page until a queued analysis is done"""
+    try:
+        task = AnalysisTask.objects.get(pk=task_id)
+    except AnalysisTask.DoesNotExist:
+        return JsonResponse({'error': 'Task not found'}, status=404)
+    if task.user_id and task.user_id != request.user.id:
+        return JsonResponse({'error': 'Task not found'}, status=404)
+
+    data = {'task_id': str(task.pk), 'status': task.status, 'attempts': task.attempts}
+    if task.status == AnalysisTask.DONE:
+        data.update(task.result, success=True)
+    elif task.status == AnalysisTask.FAILED:
+        data.update(success=False, error=f"Failed to extract text: {task.error}")
+    else:
+        data['success'] = True
+    return JsonResponse(data)
+
+@csrf_exempt
+@timed_view('jobs')
 def get_jobs_view(request):
     if request.method == 'POST':
         import json
@@ -67,18 +160,178 @@ def get_jobs_view(request):
             skills = data.get('skills', [])
             
             jobs = []
+            providers = {}
             try:
-                # Use aggregate_jobs to fetch from multiple APIs
-                jobs = aggregate_jobs(skills)
+                # Use aggregate_jobs to fetch from multiple APIs concurrently
+                with request.timer.stage('providers'):
+                    jobs, providers = aggregate_jobs(skills)
+                for name, status in providers.items():
+                    request.timer.add(name, status['elapsed_ms'] / 1000,
+                                      f"{status['status']} {status['count']} jobs", observe=False)
+                with request.timer.stage('rank'):
+                    jobs = rank_jobs(jobs, skills)
             except Exception as e:
-                print(f"Job API Error: {e}")
+                logger.warning("Job API Error: %s", e)
+            
+            timed_out = [name for name, status in providers.items() if status['status'] == 'timeout']
                 
-            return JsonResponse({'success': True, 'jobs': jobs})
+            return JsonResponse({'success': True, 'jobs': jobs, 'providers': providers, 'timed_out': timed_out})
         except Exception as e:
              return JsonResponse({'error': str(e)}, status=400)
              
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
+@csrf_exempt
+@timed_view('jobs_async')
+async def get_jobs_async_view(request):
+    """
+    Async variant of get_jobs_view for ASGI deployments: the providers are
+    awaited on non-blocking clients, so one worker serves many concurrent
+    searches instead of one per thread. Same request and response.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    try:
+        skills = json.loads(request.body).get('skills', [])
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    jobs = []
+    providers = {}
+    try:
+        with request.timer.stage('providers'):
+            jobs, providers = await aaggregate_jobs(skills)
+        for name, status in providers.items():
+            request.timer.add(name, status['elapsed_ms'] / 1000,
+                              f"{status['status']} {status['count']} jobs", observe=False)
+        with request.timer.stage('rank'):
+            jobs = rank_jobs(jobs, skills)
+    except Exception as e:
+        logger.warning("Job API Error: %s", e)
+    
+    timed_out = [name for name, status in providers.items() if status['status'] == 'timeout']
+    return JsonResponse({'success': True, 'jobs': jobs, 'providers': providers, 'timed_out': timed_out})
+
+@csrf_exempt
+@timed_view('jobs_stream')
+def get_jobs_stream_view(request):
+    """
+    Streaming variant of get_jobs_view: newline-delimited JSON with one
+    {"provider", "status", "jobs"} line per provider as soon as it answers,
+    holding its ranked jobs minus those already sent, then {"done": true,
+    "total", "providers", "timed_out"}. The first jobs arrive after the
+    fastest provider instead of the slowest.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    try:
+        skills = json.loads(request.body).get('skills', [])
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    merger = ProviderJobMerger()
+    
+    def provider_line(name, jobs, status):
+        new_jobs = merger.add(name, jobs, status)
+        return json.dumps({'provider': name, 'status': status, 'jobs': rank_jobs(new_jobs, skills)}) + '\n'
+    
+    def done_line():
+        return json.dumps({'done': True, 'total': merger.total, 'providers': merger.provider_status,
+                           'timed_out': merger.timed_out()}) + '\n'
+    
+    def stream():
+        try:
+            for name, jobs, status in iter_provider_jobs(skills):
+                yield provider_line(name, jobs, status)
+        except Exception as e:
+            logger.warning("Job API Error: %s", e)
+            yield json.dumps({'error': str(e)}) + '\n'
+        yield done_line()
+    
+    async def astream():
+        try:
+            async for name, jobs, status in aiter_provider_jobs(skills):
+                yield provider_line(name, jobs, status)
+        except Exception as e:
+            logger.warning("Job API Error: %s", e)
+            yield json.dumps({'error': str(e)}) + '\n'
+        yield done_line()
+    
+    # Django buffers the whole body of a sync iterator under ASGI and of an
+    # async one under WSGI, so stream with the kind the server consumes
+    content = astream() if isinstance(request, ASGIRequest) else stream()
+    response = StreamingHttpResponse(content, content_type='application/x-ndjson')
+    # Ask proxies (nginx) not to buffer the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+@staff_member_required
+def cache_stats_view(request):
+    """API endpoint exposing cache hit/miss counters for tuning TTLs"""
+    return JsonResponse({
+        'success': True,
+        'job_cache': job_cache.stats(),
+        'analysis_cache': analysis_cache_stats(),
+        'translation_cache': translation_cache_stats(),
+    })
+
+@staff_member_required
+def provider_stats_view(request):
+    """API endpoint exposing latency, error rate and circuit state per job provider"""
+    return JsonResponse({'success': True, 'providers': provider_client_stats()})
+
+def metrics_view(request):
+    """Prometheus scrape endpoint (text exposition format) for this process"""
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token and request.headers.get('Authorization') != f"Bearer {token}":
+        return HttpResponse(status=401)
+    try:
+        for status, count in queue_counts().items():
+            analysis_queue_depth.set(count, status=status)
+    except Exception as e:
+        logger.warning("Error reading analysis queue: %s", e)
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@staff_member_required
+def analysis_queue_stats_view(request):
+    """API endpoint exposing analysis queue depth, wait and processing times"""
+    return JsonResponse({'success': True, **queue_stats()})
+
+def _skill_param(request, name):
+    return normalize_skills(request.GET.get(name, '').split(','))
+
+@staff_member_required
+@timed_view('candidate_search')
+def candidate_search_view(request):
+    """
+    API endpoint to find candidates by skills: ?all=python,docker (every
+    skill), ?any=aws,gcp (at least one), ?min_ats=60, ?limit=, ?offset=.
+    Best ATS score first.
+    """
+    try:
+        all_skills = _skill_param(request, 'all')
+        any_skills = _skill_param(request, 'any')
+        if not all_skills and not any_skills:
+            return JsonResponse({'error': 'Give skills in all= and/or any='}, status=400)
+        min_ats = int(request.GET.get('min_ats', 0))
+        page_size = getattr(settings, 'CANDIDATE_SEARCH_PAGE_SIZE', 50)
+        limit = min(int(request.GET.get('limit', page_size)), getattr(settings, 'CANDIDATE_SEARCH_MAX_PAGE_SIZE', 200))
+        offset = int(request.GET.get('offset', 0))
+        if limit < 1 or offset < 0:
+            return JsonResponse({'error': 'limit must be positive and offset not negative'}, status=400)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    with request.timer.stage('search'):
+        result = search_candidates(all_skills, any_skills, min_ats, limit, offset)
+    return JsonResponse({
+        'success': True,
+        'query': {'all': all_skills, 'any': any_skills, 'min_ats': min_ats},
+        **result,
+        'has_more': (offset + len(result['candidates']) < result['total']
+                     or (not result['total_exact'] and len(result['candidates']) == limit)),
+    })
+
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
 from django.contrib.auth.decorators import login_required
@@ -169,9 +422,21 @@ def dashboard(request):
         })
     except UserProfile.DoesNotExist:
         context['user_profile_data'] = 'null'
+    
+    # Precomputed by refresh_recommendations: one indexed query, no provider calls
+    context['recommendations_data'] = json.dumps(get_recommendations(request.user))
         
     return render(request, 'core/dashboard.html', context)
 
+@login_required(login_url='/login/')
+def recommendations_view(request):
+    """API endpoint to get the current user's precomputed job recommendations"""
+    try:
+        limit = int(request.GET.get('limit', 0)) or None
+    except ValueError:
+        return JsonResponse({'error': 'limit must be a number'}, status=400)
+    return JsonResponse({'success': True, 'jobs': get_recommendations(request.user, limit)})
+
 @login_required(login_url='/login/')
 @csrf_exempt
 def upload_page(request): # Renamed to avoid conflict with upload_view
@@ -238,11 +503,8 @@ def submit_application_view(request):
             
             # In a real application, you would save this to a database
             # For now, we'll just log it and return success
-            print(f"Application received:")
-            print(f"  Job: {job_title} at {job_company}")
-            print(f"  Applicant: {full_name} ({email})")
-            print(f"  Resume: {file_path}")
-            print(f"  Cover Letter: {cover_letter[:100]}...")
+            logger.info("Application received: job %s at %s, applicant %s (%s), resume %s, cover letter: %s...",
+                        job_title, job_company, full_name, email, file_path, cover_letter[:100])
             
             return JsonResponse({
                 'success': True,
@@ -254,8 +516,13 @@ def submit_application_view(request):
     
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
+from .db import serialized_write
 from .models import SavedJob
-from .utils import translate_text
+from .saved_jobs import (
+    DETAIL_FIELDS, apply_saved_job_actions, get_saved_jobs_page, saved_jobs_etag, saved_jobs_state,
+    serialize_saved_job,
+)
+from .utils import atranslate_text, translate_text
 
 @login_required(login_url='/login/')
 @csrf_exempt
@@ -281,19 +548,20 @@ def save_job_view(request):
                 posted_date = data.get('posted_date', '')
                 
                 # Create or get saved job
-                saved_job, created = SavedJob.objects.get_or_create(
-                    user=request.user,
-                    job_id=job_id,
-                    defaults={
-                        'job_title': job_title,
-                        'company': company,
-                        'location': location,
-                        'description': description,
-                        'redirect_url': redirect_url,
-                        'salary': salary,
-                        'posted_date': posted_date
-                    }
-                )
+                with serialized_write():
+                    saved_job, created = SavedJob.objects.get_or_create(
+                        user=request.user,
+                        job_id=job_id,
+                        defaults={
+                            'job_title': job_title,
+                            'company': company,
+                            'location': location,
+                            'description': description,
+                            'redirect_url': redirect_url,
+                            'salary': salary,
+                            'posted_date': posted_date
+                        }
+                    )
                 
                 return JsonResponse({
                     'success': True,
@@ -303,7 +571,8 @@ def save_job_view(request):
             
             elif action == 'unsave':
                 # Delete saved job
-                SavedJob.objects.filter(user=request.user, job_id=job_id).delete()
+                with serialized_write():
+                    SavedJob.objects.filter(user=request.user, job_id=job_id).delete()
                 
                 return JsonResponse({
                     'success': True,
@@ -320,39 +589,100 @@ def save_job_view(request):
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
 @login_required(login_url='/login/')
+@csrf_exempt
+def bulk_save_jobs_view(request):
+    """
+    API endpoint to save and/or unsave many jobs at once:
+    {"items": [{"job_id": ..., "action": "save"|"unsave", "job_title": ..., ...}]}
+    All items are applied in one transaction; the response has one result
+    per item, in order.
+    """
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            items = data.get('items')
+            
+            if not isinstance(items, list) or not items:
+                return JsonResponse({'error': 'items must be a non-empty list'}, status=400)
+            
+            max_items = getattr(settings, 'SAVED_JOBS_BULK_MAX_ITEMS', 1000)
+            if len(items) > max_items:
+                return JsonResponse({'error': f'At most {max_items} items per request'}, status=400)
+            
+            results = apply_saved_job_actions(request.user, items)
+            
+            return JsonResponse({
+                'success': True,
+                'results': results,
+                'saved': sum(1 for result in results if result['outcome'] == 'saved'),
+                'removed': sum(1 for result in results if result['outcome'] == 'removed'),
+            })
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=400)
+    
+    return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+def _saved_jobs_list_etag(request):
+    return saved_jobs_etag(request.user, saved_jobs_state(request.user),
+                           request.GET.get('cursor', ''), request.GET.get('limit', ''))
+
+# ETag only: no Last-Modified, because removing a job does not change the
+# newest saved_at and an If-Modified-Since check would answer 304 with the
+# removed job still in the client's list
+@login_required(login_url='/login/')
+@condition(etag_func=_saved_jobs_list_etag)
 def get_saved_jobs_view(request):
-    """API endpoint to get all saved jobs for the current user"""
+    """
+    API endpoint to get the current user's saved jobs, newest first, one page
+    at a time (?limit=, ?cursor= from next_cursor). Descriptions are left out;
+    see saved_job_detail_view. Unchanged pages answer 304 to If-None-Match.
+    """
     try:
-        saved_jobs = SavedJob.objects.filter(user=request.user)
-        
-        jobs_data = []
-        for saved_job in saved_jobs:
-            jobs_data.append({
-                'id': saved_job.job_id,
-                'title': saved_job.job_title,
-                'company': saved_job.company,
-                'location': saved_job.location,
-                'description': saved_job.description,
-                'redirect_url': saved_job.redirect_url,
-                'salary': saved_job.salary,
-                'postedDate': saved_job.posted_date,
-                'saved_at': saved_job.saved_at.isoformat(),
-                'saved': True
-            })
+        page_size = getattr(settings, 'SAVED_JOBS_PAGE_SIZE', 50)
+        limit = min(int(request.GET.get('limit', page_size)), getattr(settings, 'SAVED_JOBS_MAX_PAGE_SIZE', 200))
+        if limit < 1:
+            return JsonResponse({'error': 'limit must be positive'}, status=400)
+        jobs_data, next_cursor = get_saved_jobs_page(request.user, request.GET.get('cursor'), limit)
         
         return JsonResponse({
             'success': True,
-            'jobs': jobs_data
+            'jobs': jobs_data,
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None,
         })
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=400)
 
+def _saved_job_row(request, job_id):
+    if not hasattr(request, '_saved_job_row'):
+        request._saved_job_row = (SavedJob.objects.filter(user=request.user, job_id=job_id)
+                                  .values(*DETAIL_FIELDS).first())
+    return request._saved_job_row
+
+def _saved_job_etag(request, job_id):
+    row = _saved_job_row(request, job_id)
+    return f"{row['id']}-{row['saved_at'].timestamp()}" if row else None
+
+def _saved_job_last_modified(request, job_id):
+    row = _saved_job_row(request, job_id)
+    return row['saved_at'] if row else None
+
+@login_required(login_url='/login/')
+@condition(etag_func=_saved_job_etag, last_modified_func=_saved_job_last_modified)
+def saved_job_detail_view(request, job_id):
+    """API endpoint to get one saved job including its description"""
+    row = _saved_job_row(request, job_id)
+    if row is None:
+        return JsonResponse({'error': 'Saved job not found'}, status=404)
+    return JsonResponse({'success': True, 'job': serialize_saved_job(row)})
+
 @login_required(login_url='/login/')
 def saved_jobs_page(request):
     """Render saved jobs page"""
     return render(request, 'core/saved_jobs.html')
 
 @csrf_exempt
+@timed_view('translate')
 def translate_job_view(request):
     """API endpoint to translate job description"""
     if request.method == 'POST':
@@ -364,7 +694,8 @@ def translate_job_view(request):
             if not text:
                 return JsonResponse({'error': 'Text is required'}, status=400)
             
-            translated_text = translate_text(text, target_language)
+            with request.timer.stage('translate'):
+                translated_text = translate_text(text, target_language)
             
             return JsonResponse({
                 'success': True,
@@ -376,4 +707,87 @@ def translate_job_view(request):
     
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
+@csrf_exempt
+@timed_view('translate_async')
+async def translate_job_async_view(request):
+    """
+    Async variant of translate_job_view for ASGI deployments, awaiting the
+    translator's non-blocking client. Same request and response.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    try:
+        data = json.loads(request.body)
+        text = data.get('text', '')
+        target_language = data.get('target_language', 'hi')  # Default to Hindi
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    if not text:
+        return JsonResponse({'error': 'Text is required'}, status=400)
+    
+    with request.timer.stage('translate'):
+        translated_text = await atranslate_text(text, target_language)
+    
+    return JsonResponse({
+        'success': True,
+        'translated_text': translated_text,
+        'target_language': target_language
+    })
+
+@csrf_exempt
+@timed_view('translate_stream')
+def translate_job_stream_view(request):
+    """
+    Streaming variant of translate_job_view: newline-delimited JSON with one
+    {"index", "text"} line per translated piece, in order, as soon as each
+    is ready, then {"done": true, "target_language"}.
+    """
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        text = data.get('text', '')
+        target_language = data.get('target_language', 'hi')  # Default to Hindi
+        
+        if not text:
+            return JsonResponse({'error': 'Text is required'}, status=400)
+        
+        def piece_line(index, piece):
+            return json.dumps({'index': index, 'text': piece}) + '\n'
+        
+        def done_line():
+            return json.dumps({'done': True, 'target_language': target_language}) + '\n'
+        
+        def stream():
+            try:
+                for index, piece in enumerate(iter_translation(text, target_language)):
+                    yield piece_line(index, piece)
+            except Exception as e:
+                logger.warning("Translation error: %s", e)
+                yield json.dumps({'error': str(e)}) + '\n'
+            yield done_line()
+        
+        async def astream():
+            try:
+                index = 0
+                async for piece in aiter_translation(text, target_language):
+                    yield piece_line(index, piece)
+                    index += 1
+            except Exception as e:
+                logger.warning("Translation error: %s", e)
+                yield json.dumps({'error': str(e)}) + '\n'
+            yield done_line()
+        
+        # As in get_jobs_stream_view: under ASGI a sync iterator would be
+        # consumed whole before anything is sent
+        content = astream() if isinstance(request, ASGIRequest) else stream()
+        response = StreamingHttpResponse(content, content_type='application/x-ndjson')
+        # Ask proxies (nginx) not to buffer the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+    
+    return JsonResponse({'error': 'Method not allowed'}, status=405)
+
 